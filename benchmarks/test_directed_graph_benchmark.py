@@ -0,0 +1,132 @@
+"""Suite graph queries against networkx on a synthetic 500-package suite.
+
+Shortest paths come from DirectedGraph, the order from SuiteDependencyGraph,
+as in production.
+
+Run with: python -m pytest benchmarks -s
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+import time
+
+import pytest
+
+PACKAGES_COUNT = 500
+
+
+def _build_dependencies_map() -> dict[str, list[str]]:
+    # Each package depends on up to 5 earlier ones: acyclic, like a suite.
+    generator = random.Random(0)
+    names = [f"package-{index:03d}" for index in range(PACKAGES_COUNT)]
+
+    return {
+        name: generator.sample(names[:index], min(index, generator.randint(0, 5)))
+        for index, name in enumerate(names)
+    }
+
+
+def _measure(callback) -> float:
+    started_at = time.perf_counter()
+    callback()
+    return time.perf_counter() - started_at
+
+
+def _measure_import(statement: str) -> float:
+    return _measure(
+        lambda: subprocess.run([sys.executable, "-c", statement], check=True)
+    )
+
+
+def test_directed_graph_against_networkx() -> None:
+    nx = pytest.importorskip("networkx")
+
+    from wexample_wex_addon_dev_python.common.directed_graph import DirectedGraph
+    from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+        SuiteDependencyGraph,
+    )
+
+    dependencies_map = _build_dependencies_map()
+    names = sorted(dependencies_map)
+    pairs = [(source, target) for source in names[::10] for target in names[::10]]
+
+    def _build_directed_graph() -> DirectedGraph:
+        graph = DirectedGraph()
+        for name in names:
+            graph.add_node(name)
+        for source in names:
+            for target in sorted(dependencies_map[source]):
+                graph.add_edge(source, target)
+        return graph
+
+    def _build_networkx_graph():
+        graph = nx.DiGraph()
+        for name in names:
+            graph.add_node(name)
+        for source in names:
+            for target in sorted(dependencies_map[source]):
+                graph.add_edge(source, target)
+        return graph
+
+    def _networkx_shortest_path(graph, source: str, target: str) -> list[str]:
+        try:
+            return nx.shortest_path(graph, source=source, target=target)
+        except nx.NetworkXNoPath:
+            return []
+
+    graph = _build_directed_graph()
+    nx_graph = _build_networkx_graph()
+
+    # Same answers: equal path lengths (ties may pick another path) and a
+    # valid dependencies-first order.
+    for source, target in pairs:
+        assert len(graph.shortest_path(source, target)) == len(
+            _networkx_shortest_path(nx_graph, source, target)
+        )
+    order = SuiteDependencyGraph(dependencies_map=dependencies_map).get_order()
+    position = {name: index for index, name in enumerate(order)}
+    assert sorted(order) == names
+    assert all(
+        position[dependency] < position[name]
+        for name, dependencies in dependencies_map.items()
+        for dependency in dependencies
+    )
+
+    order_graph = SuiteDependencyGraph(dependencies_map=dependencies_map)
+    timings = {
+        "import": (
+            _measure_import(
+                "import wexample_wex_addon_dev_python.common.directed_graph"
+            ),
+            _measure_import("import networkx"),
+        ),
+        "build": (
+            _measure(_build_directed_graph),
+            _measure(_build_networkx_graph),
+        ),
+        f"shortest path x{len(pairs)}": (
+            _measure(
+                lambda: [
+                    graph.shortest_path(source, target) for source, target in pairs
+                ]
+            ),
+            _measure(
+                lambda: [
+                    _networkx_shortest_path(nx_graph, source, target)
+                    for source, target in pairs
+                ]
+            ),
+        ),
+        "topological order": (
+            # Computed on first use only, the graph is built beforehand.
+            _measure(order_graph.get_order),
+            _measure(lambda: list(nx.topological_sort(nx_graph.reverse()))),
+        ),
+    }
+
+    print(f"\n{'operation':<24}{'DirectedGraph':>16}{'networkx':>16}")
+    for operation, (ours, theirs) in timings.items():
+        print(f"{operation:<24}{ours * 1000:>14.2f}ms{theirs * 1000:>14.2f}ms")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="max_workers",
+    type=int,
+    required=False,
+    description="Compiles run at once within a wave, every package of the wave by default.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Compile requirements.txt locks with uv; on a suite, every package at once "
+    "in dependency waves: python::lock/compile",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.DEPENDENCY,
+        EffectTag.WRITE,
+        EffectTag.NETWORK_CALL,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+        ScopeTag.SUITE,
+    ],
+)
+def python__lock__compile(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    max_workers: int | None = None,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if isinstance(app_workdir, PythonPackagesSuiteWorkdir):
+        app_workdir.compile_requirements(max_workers=max_workers)
+        return None
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+    if not app_workdir.compile_requirements():
+        return "No requirements.txt to compile."
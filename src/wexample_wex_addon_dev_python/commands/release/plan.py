@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="max_workers",
+    type=int,
+    required=False,
+    description="Packages classified at once, one per core by default.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Show the version bump every package of the suite would get, without releasing: "
+    "python::release/plan",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.DEPENDENCY,
+        EffectTag.READ_ONLY,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.SUITE,
+    ],
+)
+def python__release__plan(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    max_workers: int | None = None,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    if not isinstance(app_workdir, PythonPackagesSuiteWorkdir):
+        return "Not a python packages suite."
+
+    app_workdir.release_plan(max_workers=max_workers)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="base",
+    type=str,
+    required=True,
+    description="Git ref the packages are compared to, e.g. origin/main or a release tag",
+)
+@option(
+    name="names_only",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Only output the affected package names, one per line, for CI scripts.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="List the packages changed since a git ref and every package depending on them: "
+    "python::suite/affected --base origin/main",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.DEPENDENCY,
+        EffectTag.READ_ONLY,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.SUITE,
+    ],
+)
+def python__suite__affected(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    base: str,
+    names_only: bool = False,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    if not isinstance(app_workdir, PythonPackagesSuiteWorkdir):
+        return "Not a python packages suite."
+
+    affected = app_workdir.get_affected_packages(base_ref=base)
+    if names_only:
+        return "\n".join(affected)
+
+    if not affected:
+        return f"No package changed since {base}."
+
+    context.io.table(
+        data=[[name, reason] for name, reason in affected.items()],
+        headers=["Package", "Reason"],
+        title=f"{len(affected)} package(s) affected since {base}",
+    )
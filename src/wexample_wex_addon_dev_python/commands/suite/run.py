@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="command",
+    type=str,
+    required=True,
+    description="Manager command run in every package, e.g. python::test/run or app::setup/install",
+)
+@option(
+    name="arguments",
+    type=str,
+    required=False,
+    description='Arguments passed to the command, as one shell-quoted string: "--parallel auto"',
+)
+@option(
+    name="max_workers",
+    type=int,
+    required=False,
+    description="Packages run at once within a dependency level, one per core by default.",
+)
+@option(
+    name="keep_going",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Keep running after a failure, skipping only the dependents of failed packages.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Run a command on every package of the suite, concurrently within each dependency level: "
+    "python::suite/run --command python::test/run",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        EffectTag.WRITE,
+        EffectTag.SUBPROCESS_SPAWN,
+        EffectTag.LONG_RUNNING,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.SUITE,
+    ],
+)
+def python__suite__run(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    command: str,
+    arguments: str | None = None,
+    max_workers: int | None = None,
+    keep_going: bool = False,
+) -> str | None:
+    import shlex
+
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    if not isinstance(app_workdir, PythonPackagesSuiteWorkdir):
+        return "Not a python packages suite."
+
+    app_workdir.packages_execute_in_waves(
+        command=command,
+        arguments=shlex.split(arguments) if arguments else None,
+        max_workers=max_workers,
+        fail_fast=not keep_going,
+    )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="base",
+    type=str,
+    default="HEAD",
+    description="Git ref the changes are compared to",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="List the changed lines no test covers, from the stored coverage of the last run: "
+    "python::test/coverage-diff --base main",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.TEST,
+        EffectTag.READ_ONLY,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+    ],
+)
+def python__test__coverage_diff(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    base: str = "HEAD",
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+
+    app_workdir.test_coverage_diff(base_ref=base)
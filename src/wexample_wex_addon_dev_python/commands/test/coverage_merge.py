@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="directory",
+    type=str,
+    required=False,
+    description="Directory holding the shard coverage reports, the package root by default.",
+)
+@option(
+    name="count",
+    type=int,
+    required=False,
+    description="Number of shards of the run to merge, needed when reports of several splits are present.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Merge the coverage reports of every shard of a sharded test run: "
+    "python::test/coverage-merge",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.TEST,
+        EffectTag.WRITE,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+    ],
+)
+def python__test__coverage_merge(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    directory: str | None = None,
+    count: int | None = None,
+) -> str | None:
+    from pathlib import Path
+
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+
+    app_workdir.test_merge_coverage(
+        directory=Path(directory) if directory else None, count=count
+    )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Save the recorded test durations to the committed file sharded runs "
+    "are balanced from: python::test/durations-save",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.TEST,
+        EffectTag.WRITE,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+    ],
+)
+def python__test__durations_save(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+
+    app_workdir.test_save_durations()
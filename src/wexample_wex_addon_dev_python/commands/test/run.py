@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.python import PYTHON_PYTEST_COV_FORMAT_HTML
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="format",
+    type=str,
+    default=PYTHON_PYTEST_COV_FORMAT_HTML,
+    description="The output format of the coverage report",
+)
+@option(
+    name="parallel",
+    type=str,
+    required=False,
+    description='Number of pytest-xdist workers, or "auto" for one per core.',
+)
+@option(
+    name="shard",
+    type=str,
+    required=False,
+    description='Run only the i-th of N duration-balanced parts of the tests, as "i/N".',
+)
+@option(
+    name="affected",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Run only the tests covering code changed since the last recorded full run.",
+)
+@option(
+    name="coverage",
+    type=str,
+    required=False,
+    description="Coverage engine: trace, sysmon (low overhead, Python 3.12+) or none "
+    "(keeps the last report). Defaults to the python.test.coverage config.",
+)
+@option(
+    name="track_memory",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Record the memory peak of every test (slower, uses tracemalloc).",
+)
+@option(
+    name="warm",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Run through a warm server that keeps the package imported (no coverage).",
+)
+@option(
+    name="keyword",
+    type=str,
+    required=False,
+    description="Only run tests matching the pytest -k expression, selected from the collection cache.",
+)
+@option(
+    name="matrix",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Run the tests on every local Python 3.10-3.13 allowed by requires-python, concurrently.",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Run the tests of a python package, optionally on several workers: "
+    "python::test/run --parallel auto",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.TEST,
+        EffectTag.WRITE,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+    ],
+)
+def python__test__run(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    format: str | None = None,
+    parallel: str | None = None,
+    shard: str | None = None,
+    affected: bool = False,
+    coverage: str | None = None,
+    track_memory: bool = False,
+    warm: bool = False,
+    keyword: str | None = None,
+    matrix: bool = False,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+    if not app_workdir.has_tests():
+        return "No tests found."
+
+    app_workdir.test_run(
+        format=format,
+        parallel=parallel,
+        shard=shard,
+        affected=affected,
+        coverage=coverage,
+        track_memory=track_memory,
+        warm=warm,
+        keyword=keyword,
+        matrix=matrix,
+    )
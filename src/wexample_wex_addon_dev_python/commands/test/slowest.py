@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_dev_python.const.python import (
+    PYTHON_TEST_METRICS_SORT_DURATION,
+)
+from wexample_wex_addon_dev_python.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@middleware(middleware=AppMiddleware)
+@option(
+    name="limit",
+    type=int,
+    default=10,
+    description="Number of tests to show",
+)
+@option(
+    name="sort",
+    type=str,
+    default=PYTHON_TEST_METRICS_SORT_DURATION,
+    description="Rank tests by duration or by memory",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Show the slowest tests of the last runs and how they evolve across commits: "
+    "python::test/slowest --sort memory",
+    tags=[
+        DomainTag.LANGUAGE_PYTHON,
+        DomainTag.TEST,
+        EffectTag.READ_ONLY,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+        ScopeTag.PACKAGE,
+    ],
+)
+def python__test__slowest(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    limit: int = 10,
+    sort: str = PYTHON_TEST_METRICS_SORT_DURATION,
+) -> str | None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    if not isinstance(app_workdir, PythonWorkdir):
+        return "Not a python package."
+
+    app_workdir.test_report_slowest(limit=limit, sort=sort)
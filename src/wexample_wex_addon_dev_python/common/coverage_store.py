@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
+
+
+@base_class
+class CoverageStore(BaseClass):
+    """Per-file coverage of past test runs, one report per commit.
+
+    Executed and missing lines are kept as numbits blobs (see
+    helpers/coverage.py) in a SQLite file, so comparing commits or reading
+    the uncovered lines of a file never needs the json reports again.
+    """
+
+    max_reports: int = public_field(
+        default=50,
+        description="Reports kept, the oldest ones are dropped first.",
+    )
+    path: Path = public_field(
+        description="SQLite file holding the store.",
+    )
+
+    def get_lost_coverage(self, since_commit: str, commit_hash: str) -> list[dict]:
+        """Files whose line coverage went down between two recorded commits."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT after.path, "
+                "before.covered, before.statements, after.covered, after.statements "
+                "FROM file_coverage AS after "
+                "JOIN report AS after_report ON after_report.id = after.report_id "
+                "JOIN file_coverage AS before ON before.path = after.path "
+                "JOIN report AS before_report ON before_report.id = before.report_id "
+                "WHERE after_report.commit_hash = ? AND before_report.commit_hash = ? "
+                "ORDER BY after.path",
+                (commit_hash, since_commit),
+            ).fetchall()
+
+        lost = []
+        for (
+            path,
+            covered_before,
+            statements_before,
+            covered_after,
+            statements_after,
+        ) in rows:
+            percent_before = self._percent(covered_before, statements_before)
+            percent_after = self._percent(covered_after, statements_after)
+            if percent_after < percent_before:
+                lost.append(
+                    {
+                        "path": path,
+                        "percent_after": percent_after,
+                        "percent_before": percent_before,
+                        "missing_after": statements_after - covered_after,
+                        "missing_before": statements_before - covered_before,
+                    }
+                )
+
+        return lost
+
+    def get_missing_lines(
+        self, commit_hash: str, paths: list[str]
+    ) -> dict[str, list[int]]:
+        """Statements no test executed, for each of the given files measured at commit_hash."""
+        from wexample_wex_addon_dev_python.helpers.coverage import (
+            coverage_numbits_to_lines,
+        )
+
+        missing: dict[str, list[int]] = {}
+        with self._connect() as connection:
+            for path in paths:
+                row = connection.execute(
+                    "SELECT file_coverage.missing_bits FROM file_coverage "
+                    "JOIN report ON report.id = file_coverage.report_id "
+                    "WHERE report.commit_hash = ? AND file_coverage.path = ?",
+                    (commit_hash, path),
+                ).fetchone()
+                if row:
+                    missing[path] = coverage_numbits_to_lines(row[0])
+
+        return missing
+
+    def has_report(self, commit_hash: str) -> bool:
+        with self._connect() as connection:
+            return (
+                connection.execute(
+                    "SELECT 1 FROM report WHERE commit_hash = ?", (commit_hash,)
+                ).fetchone()
+                is not None
+            )
+
+    def record_json_reports(self, commit_hash: str, report_paths: list[Path]) -> dict:
+        """Store the coverage.py json reports of one run, replacing any report of commit_hash.
+
+        Several reports (e.g. one per shard) are merged per file: a line is
+        missing only if no report executed it. Returns totals shaped like
+        the "totals" of a json report.
+        """
+        import time
+
+        from wexample_wex_addon_dev_python.helpers.coverage import (
+            coverage_iter_json_files,
+            coverage_lines_to_numbits,
+            coverage_numbits_to_lines,
+        )
+
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM report WHERE commit_hash = ?", (commit_hash,)
+            )
+            report_id = connection.execute(
+                "INSERT INTO report (commit_hash, recorded_at) VALUES (?, ?)",
+                (commit_hash, time.time()),
+            ).lastrowid
+
+            for report_path in report_paths:
+                for path, data in coverage_iter_json_files(report_path):
+                    executed = set(data.get("executed_lines", []))
+                    statements = executed | set(data.get("missing_lines", []))
+                    excluded = set(data.get("excluded_lines", []))
+
+                    previous = connection.execute(
+                        "SELECT executed_bits, missing_bits, excluded_bits "
+                        "FROM file_coverage WHERE report_id = ? AND path = ?",
+                        (report_id, path),
+                    ).fetchone()
+                    if previous:
+                        executed.update(coverage_numbits_to_lines(previous[0]))
+                        statements.update(coverage_numbits_to_lines(previous[0]))
+                        statements.update(coverage_numbits_to_lines(previous[1]))
+                        excluded.update(coverage_numbits_to_lines(previous[2]))
+
+                    connection.execute(
+                        "INSERT OR REPLACE INTO file_coverage "
+                        "(report_id, path, covered, statements, excluded, "
+                        "executed_bits, missing_bits, excluded_bits) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            report_id,
+                            path,
+                            len(executed),
+                            len(statements),
+                            len(excluded),
+                            coverage_lines_to_numbits(list(executed)),
+                            coverage_lines_to_numbits(list(statements - executed)),
+                            coverage_lines_to_numbits(list(excluded)),
+                        ),
+                    )
+
+            connection.execute(
+                "DELETE FROM report WHERE id NOT IN "
+                "(SELECT id FROM report ORDER BY recorded_at DESC LIMIT ?)",
+                (self.max_reports,),
+            )
+            covered, statements, excluded = connection.execute(
+                "SELECT COALESCE(SUM(covered), 0), COALESCE(SUM(statements), 0), "
+                "COALESCE(SUM(excluded), 0) FROM file_coverage WHERE report_id = ?",
+                (report_id,),
+            ).fetchone()
+
+        return {
+            "covered_lines": covered,
+            "excluded_lines": excluded,
+            "missing_lines": statements - covered,
+            "num_statements": statements,
+            "percent_covered": self._percent(covered, statements),
+        }
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the store, creating its tables, as one transaction."""
+        import sqlite3
+        from contextlib import closing
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as connection:
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS report ("
+                "id INTEGER PRIMARY KEY, "
+                "commit_hash TEXT NOT NULL UNIQUE, "
+                "recorded_at REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS file_coverage ("
+                "report_id INTEGER NOT NULL REFERENCES report (id) ON DELETE CASCADE, "
+                "path TEXT NOT NULL, "
+                "covered INTEGER NOT NULL, "
+                "statements INTEGER NOT NULL, "
+                "excluded INTEGER NOT NULL, "
+                "executed_bits BLOB NOT NULL, "
+                "missing_bits BLOB NOT NULL, "
+                "excluded_bits BLOB NOT NULL, "
+                "PRIMARY KEY (report_id, path));"
+                "CREATE INDEX IF NOT EXISTS file_coverage_path "
+                "ON file_coverage (path);"
+            )
+            with connection:
+                yield connection
+
+    def _percent(self, covered: int, statements: int) -> float:
+        return 100.0 * covered / statements if statements else 100.0
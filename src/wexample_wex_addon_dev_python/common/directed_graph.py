@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class DirectedGraph(BaseClass):
+    """Adjacency-list directed graph, covering what the suite needed networkx for.
+
+    Results are deterministic: nodes and successors are visited in insertion
+    order, so a graph built from sorted nodes and edges always answers the
+    same way.
+    """
+
+    _successors: dict[str, list[str]] = private_field(
+        factory=dict,
+        description="Successors of each node, in insertion order.",
+    )
+
+    def add_edge(self, source: str, target: str) -> None:
+        self.add_node(source)
+        self.add_node(target)
+        if target not in self._successors[source]:
+            self._successors[source].append(target)
+
+    def add_node(self, node: str) -> None:
+        self._successors.setdefault(node, [])
+
+    def get_nodes(self) -> list[str]:
+        return list(self._successors)
+
+    def get_successors(self, node: str) -> list[str]:
+        return list(self._successors.get(node, []))
+
+    def has_node(self, node: str) -> bool:
+        return node in self._successors
+
+    def shortest_path(self, source: str, target: str) -> list[str]:
+        """Shortest path [source, ..., target], empty when target is unreachable."""
+        return self._search_paths(source, target=target).get(target, [])
+
+    def shortest_paths_from(self, source: str) -> dict[str, list[str]]:
+        """Shortest path from source to every node it reaches, itself included."""
+        return self._search_paths(source)
+
+    def _search_paths(
+        self, source: str, target: str | None = None
+    ) -> dict[str, list[str]]:
+        # Breadth-first, stopping as soon as target (if any) is reached.
+        if source not in self._successors:
+            return {}
+
+        paths = {source: [source]}
+        frontier = [source]
+        while frontier and target not in paths:
+            next_frontier = []
+            for node in frontier:
+                for successor in self._successors[node]:
+                    if successor not in paths:
+                        paths[successor] = paths[node] + [successor]
+                        next_frontier.append(successor)
+            frontier = next_frontier
+
+        return paths
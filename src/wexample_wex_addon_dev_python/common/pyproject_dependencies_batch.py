@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
+
+    from wexample_wex_addon_dev_python.file.python_pyproject_toml_file import (
+        PythonPyprojectTomlFile,
+    )
+
+
+@base_class
+class PyprojectDependenciesBatch(BaseClass):
+    """Dependency edits of a pyproject.toml, applied to the file at once.
+
+    Each dependency array touched is parsed once into a map of its entries
+    by canonical name; add, remove and update only edit those maps. commit()
+    rewrites the arrays that changed, sorts them and writes the file a
+    single time. Unparsable entries are kept untouched, as are packages
+    listed several times in one array (e.g. split by markers): editing such
+    a package, or giving one package two different entries in the same
+    batch, raises a ValueError. A batch is committed once, its changes can
+    still be read afterwards.
+    """
+
+    pyproject: PythonPyprojectTomlFile = public_field(
+        description="File the edits are applied to.",
+    )
+    _duplicates: dict[tuple, set[str]] = private_field(
+        factory=dict,
+        description="Packages listed several times in each array touched.",
+    )
+    _edits: dict[tuple, dict[str, str | None]] = private_field(
+        factory=dict,
+        description="Entry set by this batch for each package edited, None if removed.",
+    )
+    _entries: dict[tuple, dict[str, str]] = private_field(
+        factory=dict,
+        description="Current entries of each array touched, by canonical name.",
+    )
+    _items: dict[tuple, dict[str, object]] = private_field(
+        factory=dict,
+        description="TOML items of each array touched, by canonical name.",
+    )
+    _original_entries: dict[tuple, dict[str, str]] = private_field(
+        factory=dict,
+        description="Entries of each array touched, as read from the file.",
+    )
+
+    def add(
+        self, spec: Requirement, optional: bool = False, group: None | str = None
+    ) -> bool:
+        """Add the dependency or replace the entry of the same name; True if it changed."""
+        entries = self._get_entries(optional=optional, group=group)
+        name = self._get_edited_name(spec.name, optional=optional, group=group)
+        self._set_edit(name, str(spec), optional=optional, group=group)
+        previous = entries.get(name)
+        entries[name] = str(spec)
+
+        return previous != entries[name]
+
+    def commit(self) -> list[dict]:
+        """Write the edits in one go; returns the entries changed (see get_changes())."""
+        from wexample_filestate_python.helpers.toml import toml_sort_string_array
+
+        changes = self.get_changes()
+        if not changes:
+            return changes
+
+        for key, entries in self._entries.items():
+            if entries == self._original_entries[key]:
+                continue
+
+            deps = self.pyproject._get_deps_array(optional=key[0], group=key[1])
+            original = self._original_entries[key]
+            # Unchanged entries keep their TOML item, and so their formatting.
+            deps.clear()
+            deps.extend(
+                (self._items[key][name] if original.get(name) == spec else spec)
+                for name, spec in entries.items()
+            )
+            toml_sort_string_array(deps)
+
+        self.pyproject.write_parsed()
+
+        return changes
+
+    def get_changes(self) -> list[dict]:
+        """Entries differing from the file, in file order, additions last.
+
+        Each change gives its group (None for runtime dependencies), name,
+        old and new entry; old is None when added, new when removed.
+        """
+        changes = []
+        for (optional, group), entries in self._entries.items():
+            original = self._original_entries[(optional, group)]
+            for name in [
+                *original,
+                *(name for name in entries if name not in original),
+            ]:
+                if original.get(name) != entries.get(name):
+                    changes.append(
+                        {
+                            "group": group if optional else None,
+                            "name": name,
+                            "new": entries.get(name),
+                            "old": original.get(name),
+                        }
+                    )
+
+        return changes
+
+    def has(
+        self, package_name: str, optional: bool = False, group: None | str = None
+    ) -> bool:
+        """Whether package_name is an entry of the array, as currently edited."""
+        return self._get_edited_name(
+            package_name, optional=optional, group=group
+        ) in self._get_entries(optional=optional, group=group)
+
+    def remove(
+        self, package_name: str, optional: bool = False, group: None | str = None
+    ) -> bool:
+        """Remove the entry of package_name; True if there was one."""
+        entries = self._get_entries(optional=optional, group=group)
+        name = self._get_edited_name(package_name, optional=optional, group=group)
+        self._set_edit(name, None, optional=optional, group=group)
+
+        return entries.pop(name, None) is not None
+
+    def update(
+        self,
+        package_name: str,
+        specifier: str,
+        optional: bool = False,
+        group: None | str = None,
+    ) -> bool:
+        """Set the version specifier (e.g. ">=1.2.0") of an existing entry.
+
+        Extras and markers of the entry are kept. Returns False when the
+        package is not a dependency or already has this specifier.
+        """
+        from packaging.requirements import Requirement
+        from packaging.specifiers import SpecifierSet
+
+        entries = self._get_entries(optional=optional, group=group)
+        name = self._get_edited_name(package_name, optional=optional, group=group)
+        if name not in entries:
+            return False
+
+        requirement = Requirement(entries[name])
+        requirement.specifier = SpecifierSet(specifier)
+
+        return self.add(requirement, optional=optional, group=group)
+
+    def _get_edited_name(
+        self, package_name: str, optional: bool, group: None | str
+    ) -> str:
+        """Canonical name of a package to edit, refusing the ones listed several times."""
+        from packaging.utils import canonicalize_name
+
+        self._get_entries(optional=optional, group=group)
+        name = canonicalize_name(package_name)
+        if name in self._duplicates[self._get_key(optional=optional, group=group)]:
+            raise ValueError(
+                f'Package "{name}" has several entries in '
+                f"{self.pyproject.get_path()}, edit them by hand."
+            )
+
+        return name
+
+    def _get_entries(self, optional: bool, group: None | str) -> dict[str, str]:
+        from collections import Counter
+
+        from packaging.requirements import Requirement
+        from packaging.utils import canonicalize_name
+        from wexample_filestate_python.helpers.toml import toml_get_string_value
+
+        key = self._get_key(optional=optional, group=group)
+        if key not in self._entries:
+            parsed = []
+            for item in self.pyproject._get_deps_array(optional=key[0], group=key[1]):
+                value = toml_get_string_value(item)
+                try:
+                    name = canonicalize_name(Requirement(value).name)
+                except Exception:
+                    name = None
+                parsed.append((name, value, item))
+
+            counts = Counter(name for name, _, _ in parsed if name is not None)
+            duplicates = {name for name, count in counts.items() if count > 1}
+
+            entries = {}
+            items = {}
+            for position, (name, value, item) in enumerate(parsed):
+                # Kept as they are, under keys no package name can take.
+                if name is None:
+                    name = value
+                elif name in duplicates:
+                    name = f"{name}#{position}"
+                entries[name] = value
+                items[name] = item
+            self._duplicates[key] = duplicates
+            self._edits[key] = {}
+            self._items[key] = items
+            self._original_entries[key] = entries
+            self._entries[key] = dict(entries)
+
+        return self._entries[key]
+
+    def _get_key(self, optional: bool, group: None | str) -> tuple:
+        # Runtime dependencies are one array, whatever the group.
+        return optional, group if optional else None
+
+    def _set_edit(
+        self, name: str, entry: str | None, optional: bool, group: None | str
+    ) -> None:
+        edits = self._edits[self._get_key(optional=optional, group=group)]
+        if name in edits and edits[name] != entry:
+            raise ValueError(
+                f'Conflicting edits of package "{name}" in one batch of '
+                f'{self.pyproject.get_path()}: "{edits[name]}" then "{entry}".'
+            )
+        edits[name] = entry
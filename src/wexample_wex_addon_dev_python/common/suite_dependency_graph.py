@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_wex_addon_dev_python.common.directed_graph import DirectedGraph
+
+
+@base_class
+class SuiteDependencyGraph(BaseClass):
+    """Local dependencies of a suite, with every query answered from a cache.
+
+    Built once from a dependencies map (package name -> local dependency
+    names): for each package, the shortest path to everything it reaches
+    is computed at creation, so stack and reachability queries are lookups.
+    The topological levels are computed on first use and kept: a cycle only
+    fails the queries needing an order (ValueError), not the others.
+    """
+
+    dependencies_map: dict[str, list[str]] = public_field(
+        description="Local dependency names of each package.",
+    )
+    _dependents: dict[str, set[str]] = private_field(
+        factory=dict,
+        description="Packages reaching each package, directly or not.",
+    )
+    _graph: DirectedGraph | None = private_field(
+        default=None,
+        description="Graph of the dependencies map, built in sorted order.",
+    )
+    _levels: list[list[str]] | None = private_field(
+        default=None,
+        description="Package names grouped by dependency level, leaves first.",
+    )
+    _paths: dict[str, dict[str, list[str]]] = private_field(
+        factory=dict,
+        description="Shortest path from each package to every package it reaches.",
+    )
+
+    def __attrs_post_init__(self) -> None:
+        from wexample_wex_addon_dev_python.common.directed_graph import (
+            DirectedGraph,
+        )
+
+        # Deterministic graph: nodes and edges added in sorted order.
+        nodes = set(self.dependencies_map) | {
+            dependency
+            for dependencies in self.dependencies_map.values()
+            for dependency in dependencies
+        }
+        graph = DirectedGraph()
+        for node in sorted(nodes):
+            graph.add_node(node)
+        for source in sorted(self.dependencies_map):
+            for target in sorted(self.dependencies_map[source]):
+                graph.add_edge(source, target)
+
+        self._graph = graph
+        self._paths = {node: graph.shortest_paths_from(node) for node in sorted(nodes)}
+        self._dependents = {node: set() for node in nodes}
+        for source, paths in self._paths.items():
+            for target in paths:
+                if target != source:
+                    self._dependents[target].add(source)
+
+    def get_closure(self, name: str) -> set[str]:
+        """Every package name reaches, directly or not."""
+        return set(self._paths.get(name, {})) - {name}
+
+    def get_dependents(self, name: str) -> set[str]:
+        """Every package depending on name, directly or not."""
+        return set(self._dependents.get(name, set()))
+
+    def get_levels(self) -> list[list[str]]:
+        """Package names grouped by level: each only depends on earlier levels.
+
+        Levels are the ready batches of graphlib over the sorted nodes, so
+        get_order() is its static_order(), the order the suite always used.
+        Raises ValueError on cyclic dependencies.
+        """
+        from graphlib import CycleError, TopologicalSorter
+
+        if self._levels is None:
+            sorter = TopologicalSorter()
+            for node in self._graph.get_nodes():
+                sorter.add(node, *self._graph.get_successors(node))
+            try:
+                sorter.prepare()
+            except CycleError as error:
+                raise ValueError(
+                    "Cyclic dependencies detected between: "
+                    + ", ".join(sorted(set(error.args[1])))
+                ) from error
+
+            levels = []
+            while sorter.is_active():
+                level = list(sorter.get_ready())
+                sorter.done(*level)
+                # Only packages of the suite, not dependencies out of the map.
+                names = [name for name in level if name in self.dependencies_map]
+                if names:
+                    levels.append(names)
+            self._levels = levels
+
+        return [list(level) for level in self._levels]
+
+    def get_order(self) -> list[str]:
+        """Package names ordered leaves -> trunk; raises ValueError on a cycle."""
+        return [name for level in self.get_levels() for name in level]
+
+    def get_path(self, source: str, target: str) -> list[str]:
+        """Shortest dependency chain [source, ..., target], empty if there is none."""
+        return list(self._paths.get(source, {}).get(target, []))
+
+    def reaches(self, source: str, target: str) -> bool:
+        return target in self._paths.get(source, {})
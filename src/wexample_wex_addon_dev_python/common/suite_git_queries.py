@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@base_class
+class SuiteGitQueries(BaseClass):
+    """Git lookups over the packages of a suite, each package being its own repository.
+
+    Every method takes one query per package path and runs the git
+    processes concurrently, at most max_workers at once. Answers are kept
+    for the life of the object, one command, so asking twice never spawns
+    git twice. A failed query answers the exception it raised instead of
+    a value, for the caller to report per package.
+    """
+
+    max_workers: int = public_field(
+        default=8,
+        description="Git processes run at once.",
+    )
+    _results: dict[tuple, Any] = private_field(
+        factory=dict,
+        description="Answer of each query already run, by query key.",
+    )
+
+    def get_current_commit_hashes(self, paths: list[Path]) -> dict[Path, Any]:
+        from wexample_helpers_git.helpers.git import git_get_current_commit_hash
+
+        return self._run(
+            {
+                path: (
+                    ("commit_hash", str(path)),
+                    lambda path=path: git_get_current_commit_hash(cwd=path),
+                )
+                for path in paths
+            }
+        )
+
+    def get_last_tags(self, prefixes: dict[Path, str]) -> dict[Path, Any]:
+        """Last tag matching the glob prefix (e.g. "name/v*") of each path, None if none."""
+        from wexample_helpers_git.helpers.git import git_last_tag_for_prefix
+
+        return self._run(
+            {
+                path: (
+                    ("last_tag", str(path), prefix),
+                    lambda path=path, prefix=prefix: git_last_tag_for_prefix(
+                        prefix, cwd=path
+                    ),
+                )
+                for path, prefix in prefixes.items()
+            }
+        )
+
+    def has_changes_since(
+        self, refs: dict[Path, str], pathspec: str = "."
+    ) -> dict[Path, Any]:
+        """Whether pathspec changed since the given ref (tag or commit) of each path."""
+        from wexample_helpers_git.helpers.git import git_has_changes_since_tag
+
+        return self._run(
+            {
+                path: (
+                    ("has_changes", str(path), ref, pathspec),
+                    lambda path=path, ref=ref: git_has_changes_since_tag(
+                        ref, pathspec, cwd=path
+                    ),
+                )
+                for path, ref in refs.items()
+            }
+        )
+
+    def _run(
+        self, queries: dict[Path, tuple[tuple, Callable[[], Any]]]
+    ) -> dict[Path, Any]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _query(function: Callable[[], Any]) -> Any:
+            try:
+                return function()
+            except Exception as error:
+                return error
+
+        missing = {
+            key: function
+            for key, function in queries.values()
+            if key not in self._results
+        }
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(missing))
+            ) as executor:
+                self._results.update(
+                    zip(missing, executor.map(_query, missing.values()))
+                )
+
+        return {path: self._results[key] for path, (key, _) in queries.items()}
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@base_class
+class SuiteWavesRun(BaseClass):
+    """One run of a task over suite packages, level by level.
+
+    Packages of a level run concurrently on a thread pool, at most
+    max_workers at once; a level starts once the previous one is done.
+    Threads only wait for the task, which is expected to spawn its own
+    process: workdir objects cannot be sent to a process pool. A task
+    returns whether it passed; raising counts as a failure, its error is
+    kept. With fail_fast, the first failure cancels every package not
+    started yet; otherwise only the dependents of a failed package are
+    skipped.
+    """
+
+    fail_fast: bool = public_field(
+        default=True,
+        description="Cancel the packages not started yet after the first failure.",
+    )
+    get_closure: Callable[[str], set[str]] = public_field(
+        description="Every package a package depends on, directly or not.",
+    )
+    levels: list[list[str]] = public_field(
+        description="Package names grouped by dependency level, leaves first.",
+    )
+    max_workers: int | None = public_field(
+        default=None,
+        description="Packages run at once, one per core by default.",
+    )
+    _errors: dict[str, Exception] = private_field(
+        factory=dict,
+        description="Error raised by the task of each package, if any.",
+    )
+    _lock: Any = private_field(
+        default=None,
+        description="Guards statuses, timings and errors, written by every thread.",
+    )
+    _statuses: dict[str, str] = private_field(
+        factory=dict,
+        description="Status of each package: passed, failed, skipped or cancelled.",
+    )
+    _timings: dict[str, tuple[float, float]] = private_field(
+        factory=dict,
+        description="Start and end of each package run, in seconds since the start.",
+    )
+
+    def get_errors(self) -> dict[str, Exception]:
+        return dict(self._errors)
+
+    def get_statuses(self) -> dict[str, str]:
+        return dict(self._statuses)
+
+    def get_timings(self) -> dict[str, tuple[float, float]]:
+        return dict(self._timings)
+
+    def run(
+        self,
+        task: Callable[[str], bool],
+        on_level: Callable[[int, list[str]], None] | None = None,
+        on_done: Callable[[str, str], None] | None = None,
+    ) -> dict[str, str]:
+        """Run task on every package; returns the status of each package.
+
+        on_level(index, runnable names) is called when a level starts,
+        on_done(name, status) when the task of a package ends.
+        """
+        import os
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._lock = threading.Lock()
+        stop = threading.Event()
+        started_at = time.perf_counter()
+
+        def _run(name: str) -> None:
+            if stop.is_set():
+                self._set_status(name, "cancelled")
+                return
+
+            package_started_at = time.perf_counter()
+            error = None
+            try:
+                passed = bool(task(name))
+            except Exception as task_error:
+                error = task_error
+                passed = False
+
+            status = "passed" if passed else "failed"
+            with self._lock:
+                self._timings[name] = (
+                    package_started_at - started_at,
+                    time.perf_counter() - started_at,
+                )
+                self._statuses[name] = status
+                if error is not None:
+                    self._errors[name] = error
+
+            if not passed and self.fail_fast:
+                stop.set()
+            if on_done:
+                on_done(name, status)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers or os.cpu_count()
+        ) as executor:
+            for index, names in enumerate(self.levels, start=1):
+                if stop.is_set():
+                    for name in names:
+                        self._set_status(name, "cancelled")
+                    continue
+
+                runnable = []
+                for name in names:
+                    if any(
+                        self._statuses.get(dependency) in ("failed", "skipped")
+                        for dependency in self.get_closure(name)
+                    ):
+                        self._set_status(name, "skipped")
+                    else:
+                        runnable.append(name)
+
+                if on_level:
+                    on_level(index, runnable)
+                list(executor.map(_run, runnable))
+
+        return self.get_statuses()
+
+    def _set_status(self, name: str, status: str) -> None:
+        with self._lock:
+            self._statuses[name] = status
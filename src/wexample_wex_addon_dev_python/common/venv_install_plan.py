@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class VenvInstallPlan(BaseClass):
+    """Requirements and editable paths installed into a venv in a single pass.
+
+    Every entry is handed to one installer invocation, so the resolver runs
+    once over the combined set: editable suite packages are seen together
+    with the external requirements that depend on them. Uses `uv pip install`
+    when uv is available, pip otherwise.
+
+    Find-links directories (the suite wheelhouse) are searched alongside the
+    index; an offline plan searches them only.
+    """
+
+    editable_paths: list[str] = public_field(
+        factory=list,
+        description="Local project paths installed in editable mode.",
+    )
+    find_links: list[str] = public_field(
+        factory=list,
+        description="Local directories of wheels searched before the index.",
+    )
+    no_deps: bool = public_field(
+        default=False,
+        description="Install exactly the given entries, without resolving "
+        "their dependencies (for fully pinned lock files).",
+    )
+    offline: bool = public_field(
+        default=False,
+        description="Install from the find-links directories only, "
+        "without reaching the index.",
+    )
+    requirements: list[str] = public_field(
+        factory=list,
+        description="PEP 508 requirement specs installed from the index.",
+    )
+    venv_path: Path = public_field(
+        description="Target venv.",
+    )
+
+    def add_editable(self, path: Path | str) -> None:
+        if str(path) not in self.editable_paths:
+            self.editable_paths.append(str(path))
+
+    def add_requirement(self, spec: str) -> None:
+        if spec not in self.requirements:
+            self.requirements.append(spec)
+
+    def build_collect_command(
+        self, wheelhouse_path: Path, requirements: list[str]
+    ) -> list[str]:
+        """pip command storing the wheels of the pinned requirements in the wheelhouse.
+
+        Requirements are exact pins of what the install resolved, so they
+        are fetched without resolving anything (--no-deps). uv has no
+        equivalent of `pip wheel`, pip is used in both cases.
+        """
+        python_path = str(self.venv_path / "bin" / "python")
+
+        return [
+            python_path,
+            "-m",
+            "pip",
+            "wheel",
+            "--no-deps",
+            "--wheel-dir",
+            str(wheelhouse_path),
+            *(option for path in self.find_links for option in ("--find-links", path)),
+            *requirements,
+        ]
+
+    def build_command(self) -> list[str]:
+        import shutil
+
+        python_path = str(self.venv_path / "bin" / "python")
+
+        if shutil.which("uv"):
+            cmd = ["uv", "pip", "install", "--python", python_path]
+        else:
+            cmd = [python_path, "-m", "pip", "install"]
+
+        cmd.extend(self._build_source_options())
+        cmd.extend(self.requirements)
+        for path in self.editable_paths:
+            cmd.extend(["-e", path])
+
+        return cmd
+
+    def can_install_offline(self, wheelhouse_path: Path) -> bool:
+        """Whether the wheelhouse holds a wheel for every requirement of the plan.
+
+        Editable packages are built from source, their build backend is
+        never in the wheelhouse: plans holding some always need the index.
+        Dependencies of unpinned plans are not known beforehand, only the
+        requirements themselves are checked.
+        """
+        from packaging.requirements import Requirement
+        from packaging.utils import canonicalize_name
+
+        if self.editable_paths or not self.requirements:
+            return False
+
+        versions = self._get_wheelhouse_versions(wheelhouse_path)
+        for spec in self.requirements:
+            requirement = Requirement(spec)
+            if requirement.marker and not requirement.marker.evaluate():
+                continue
+            if not any(
+                requirement.specifier.contains(version, prereleases=True)
+                for version in versions.get(canonicalize_name(requirement.name), [])
+            ):
+                return False
+
+        return True
+
+    def collect_wheels(self, wheelhouse_path: Path) -> None:
+        """Store in the wheelhouse the wheels of what the venv got from the index."""
+        from wexample_helpers.helpers.shell import shell_run
+
+        requirements = self.get_collect_requirements(wheelhouse_path)
+        if not requirements:
+            return
+
+        wheelhouse_path.mkdir(parents=True, exist_ok=True)
+        shell_run(
+            cmd=self.build_collect_command(wheelhouse_path, requirements),
+            cwd=self.venv_path.parent,
+            inherit_stdio=True,
+        )
+
+    def describe(self) -> str:
+        return (
+            f"Installing {len(self.requirements)} {'pinned ' if self.no_deps else ''}requirements and "
+            f"{len(self.editable_paths)} editable packages with {self.get_installer_name()}"
+        )
+
+    def get_collect_requirements(self, wheelhouse_path: Path) -> list[str]:
+        """Pins of the venv distributions the wheelhouse has no wheel of.
+
+        Only these are collected after an install: distributions already
+        stored are not fetched again, and editable packages are local
+        sources, never collected.
+        """
+        from packaging.version import Version
+
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_scan_distributions,
+        )
+
+        versions = self._get_wheelhouse_versions(wheelhouse_path)
+
+        return [
+            f"{name}=={distribution.version}"
+            for name, distribution in sorted(
+                venv_scan_distributions(self.venv_path).items()
+            )
+            if distribution.editable_path is None
+            and Version(distribution.version) not in versions.get(name, [])
+        ]
+
+    def get_installer_name(self) -> str:
+        import shutil
+
+        return "uv" if shutil.which("uv") else "pip"
+
+    def get_label(self) -> str:
+        return "locked install" if self.no_deps else "install"
+
+    def is_empty(self) -> bool:
+        return not self.requirements and not self.editable_paths
+
+    def run(self, inherit_stdio: bool = True) -> None:
+        from wexample_helpers.helpers.shell import shell_run
+
+        if self.is_empty():
+            return
+
+        shell_run(
+            cmd=self.build_command(),
+            cwd=self.venv_path.parent,
+            inherit_stdio=inherit_stdio,
+        )
+
+    def _build_source_options(self) -> list[str]:
+        options = []
+
+        if self.no_deps:
+            options.append("--no-deps")
+        if self.offline:
+            options.append("--no-index")
+        for path in self.find_links:
+            options.extend(["--find-links", path])
+
+        return options
+
+    def _get_wheelhouse_versions(self, wheelhouse_path: Path) -> dict[str, list]:
+        """Versions of the wheels in the wheelhouse, by canonical name."""
+        from packaging.utils import InvalidWheelFilename, parse_wheel_filename
+
+        versions: dict[str, list] = {}
+        for wheel_path in wheelhouse_path.glob("*.whl"):
+            try:
+                name, version, _, _ = parse_wheel_filename(wheel_path.name)
+            except InvalidWheelFilename:
+                continue
+            versions.setdefault(name, []).append(version)
+
+        return versions
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class WarmTestServerClient(BaseClass):
+    """Runs pytest through a warm server kept alive in the package venv.
+
+    The server (resources/pytest/wex_test_server.py) pays interpreter
+    startup and heavy imports once, then forks a fresh process per run. It
+    is started on first use, and restarted when one of its imported modules
+    changed on disk.
+
+    The socket lives in a directory private to the user, and is only used
+    when owned by them. Requests carry the filtered environment only (see
+    PYTHON_TEST_SERVER_ENV_NAMES), never the whole calling shell one.
+    """
+
+    import_name: str = public_field(
+        description="Package imported by the server before any run.",
+    )
+    log_path: Path = public_field(
+        description="File receiving the output of the server itself.",
+    )
+    python_path: Path = public_field(
+        description="Venv interpreter running the server.",
+    )
+    socket_path: Path = public_field(
+        description="Unix socket the server listens on, in a directory private to the user.",
+    )
+    start_timeout: float = public_field(
+        default=60.0,
+        description="Seconds to wait for a starting server to listen.",
+    )
+
+    def get_server_script_path(self) -> Path:
+        from wexample_helpers.helpers.module import module_get_path
+
+        import wexample_wex_addon_dev_python
+
+        return (
+            module_get_path(wexample_wex_addon_dev_python)
+            / "resources"
+            / "pytest"
+            / "wex_test_server.py"
+        )
+
+    def run(self, args: list[str], cwd: Path, env: dict[str, str]) -> int:
+        """Run pytest with args, stream its output, and return its exit code."""
+        from wexample_wex_addon_dev_python.const.python import (
+            PYTHON_TEST_SERVER_ENV_NAMES,
+            PYTHON_TEST_SERVER_ENV_PREFIXES,
+        )
+        from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+            warm_test_server_filter_env,
+        )
+
+        request = {
+            "args": args,
+            "cwd": str(cwd),
+            "env": warm_test_server_filter_env(
+                env,
+                names=PYTHON_TEST_SERVER_ENV_NAMES,
+                prefixes=PYTHON_TEST_SERVER_ENV_PREFIXES,
+            ),
+        }
+
+        exit_code = self._send(request=request, env=env)
+        if exit_code is None:
+            # The server found modified modules and stopped: start anew.
+            exit_code = self._send(request=request, env=env)
+        if exit_code is None:
+            raise RuntimeError("The warm test server keeps asking for a restart.")
+
+        return exit_code
+
+    def start(self, env: dict[str, str]) -> None:
+        import socket
+        import subprocess
+        import time
+
+        from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+            warm_test_server_check_socket_owner,
+        )
+
+        warm_test_server_check_socket_owner(self.socket_path)
+        self.socket_path.unlink(missing_ok=True)
+
+        with self.log_path.open("ab") as log:
+            process = subprocess.Popen(
+                [
+                    str(self.python_path),
+                    str(self.get_server_script_path()),
+                    str(self.socket_path),
+                    self.import_name,
+                ],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"The warm test server exited on startup, see {self.log_path}"
+                )
+            try:
+                warm_test_server_check_socket_owner(self.socket_path)
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(str(self.socket_path))
+                    # A request-less connection is dropped by the server.
+                    probe.sendall(b"\n")
+                return
+            except OSError:
+                time.sleep(0.05)
+
+        process.kill()
+        raise RuntimeError(f"The warm test server did not start, see {self.log_path}")
+
+    def _connect(self, env: dict[str, str]):
+        import socket
+
+        from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+            warm_test_server_check_socket_owner,
+        )
+
+        warm_test_server_check_socket_owner(self.socket_path)
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(str(self.socket_path))
+        except OSError:
+            connection.close()
+            self.start(env=env)
+            warm_test_server_check_socket_owner(self.socket_path)
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.connect(str(self.socket_path))
+
+        return connection
+
+    def _send(self, request: dict, env: dict[str, str]) -> int | None:
+        """Send one run request; None when the server asked for a restart."""
+        import json
+        import sys
+
+        from wexample_wex_addon_dev_python.resources.pytest.wex_test_server import (
+            EXIT_MARKER,
+            RESTART_MARKER,
+        )
+
+        tail = b""
+        keep = max(len(EXIT_MARKER) + 8, len(RESTART_MARKER))
+
+        with self._connect(env=env) as connection:
+            connection.sendall(json.dumps(request).encode() + b"\n")
+
+            # Output is streamed as it comes, except for a tail long enough
+            # to hold the closing marker.
+            while chunk := connection.recv(65536):
+                tail += chunk
+                if len(tail) > keep:
+                    sys.stdout.buffer.write(tail[:-keep])
+                    sys.stdout.buffer.flush()
+                    tail = tail[-keep:]
+
+        if tail == RESTART_MARKER:
+            return None
+
+        output, marker, exit_code = tail.rpartition(EXIT_MARKER)
+        if not marker:
+            # The run process died without a word.
+            sys.stdout.buffer.write(tail)
+            sys.stdout.buffer.flush()
+            return 1
+
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+
+        return int(exit_code.strip() or 1)
@@ -3,5 +3,51 @@ from __future__ import annotations
 from pathlib import Path
 
 PYTHON_PYTEST_COV_REPORT_DIR: Path = Path("htmlcov")
+# Interpreter version the requirements.txt locks are compiled for.
+PYTHON_LOCK_VERSION: str = "3.11"
 PYTHON_PYTEST_COV_FORMAT_HTML: str = "html"
 PYTHON_PYTEST_COV_FORMAT_JSON: str = "json"
+PYTHON_PYTEST_COV_SHARD_JSON_GLOB: str = "coverage.shard-*-of-*.json"
+PYTHON_PYTEST_PARALLEL_AUTO: str = "auto"
+PYTHON_TEST_COVERAGE_NONE: str = "none"
+PYTHON_TEST_COVERAGE_SYSMON: str = "sysmon"
+PYTHON_TEST_COVERAGE_TRACE: str = "trace"
+# Test durations shards are balanced from, committed at the package root so
+# that every CI node computes the same split.
+PYTHON_TEST_DURATIONS_FILE_NAME: str = ".test_durations.json"
+PYTHON_TEST_METRICS_SORT_DURATION: str = "duration"
+PYTHON_TEST_METRICS_SORT_MEMORY: str = "memory"
+# Interpreters the test matrix looks for, when requires-python allows them.
+PYTHON_TEST_MATRIX_VERSIONS: list[str] = ["3.10", "3.11", "3.12", "3.13"]
+# Environment variables sent to the warm test server, which runs pytest with
+# these only: secrets of the calling shell never leave the wex process.
+PYTHON_TEST_SERVER_ENV_NAMES: list[str] = [
+    "CI",
+    "COLUMNS",
+    "FORCE_COLOR",
+    "HOME",
+    "LANG",
+    "LOGNAME",
+    "NO_COLOR",
+    "PATH",
+    "PYTHONDONTWRITEBYTECODE",
+    "PYTHONHASHSEED",
+    "PYTHONIOENCODING",
+    "PYTHONPATH",
+    "PYTHONUTF8",
+    "PYTHONWARNINGS",
+    "SHELL",
+    "TEMP",
+    "TERM",
+    "TMP",
+    "TMPDIR",
+    "TZ",
+    "USER",
+    "VIRTUAL_ENV",
+]
+PYTHON_TEST_SERVER_ENV_PREFIXES: list[str] = [
+    "COVERAGE_",
+    "LC_",
+    "PYTEST_",
+    "WEX_TEST_",
+]
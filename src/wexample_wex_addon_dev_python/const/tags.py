@@ -6,7 +6,9 @@ from __future__ import annotations
 class DomainTag:
     """Functional domain this addon's commands touch."""
 
+    DEPENDENCY = "domain:dependency"
     FORMAT = "domain:format"
     LANGUAGE_PYTHON = "domain:language-python"
     LINT = "domain:lint"
     SERVICE = "domain:service"
+    TEST = "domain:test"
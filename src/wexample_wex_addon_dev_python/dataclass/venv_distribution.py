@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class VenvDistribution:
+    """A distribution found in a venv's site-packages."""
+
+    version: str
+    editable_path: Path | None = None
+
+    def is_editable_at(self, path: Path | str) -> bool:
+        if self.editable_path is None:
+            return False
+        return self.editable_path.resolve() == Path(path).resolve()
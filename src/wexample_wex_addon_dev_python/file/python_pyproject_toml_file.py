@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from wexample_filestate.item.file.toml_file import TomlFile
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 from wexample_wex_addon_app.const.path import APP_PATH_README
 from wexample_wex_addon_app.item.file.mixin.app_dependencies_config_file_mixin import (
@@ -10,49 +12,32 @@ from wexample_wex_addon_app.item.file.mixin.app_dependencies_config_file_mixin i
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from packaging.requirements import Requirement
     from tomlkit import TOMLDocument
 
+    from wexample_wex_addon_dev_python.common.pyproject_dependencies_batch import (
+        PyprojectDependenciesBatch,
+    )
+
 
 @base_class
 class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
+    _batch: PyprojectDependenciesBatch | None = private_field(
+        default=None,
+        description="Dependency edits in progress, see batch_edit()",
+    )
+
     def add_dependency_from_spec(
         self,
         spec: Requirement,
         optional: bool = False,
         group: None | str = None,
     ) -> bool:
-        from packaging.requirements import Requirement
-        from packaging.utils import canonicalize_name
-        from wexample_filestate_python.helpers.toml import toml_sort_string_array
-
-        new_name = canonicalize_name(spec.name)
-
-        deps = self._get_deps_array(optional=optional, group=group)
-
-        # Look for existing dependency (string-based)
-        old_spec = next(
-            (d for d in deps if canonicalize_name(Requirement(d).name) == new_name),
-            None,
-        )
-
-        # Remove old dep if exists
-        if old_spec:
-            deps.remove(old_spec)
-
-        # Convert Requirement → string
-        new_spec_str = str(spec)
-
-        # Add new version
-        deps.append(new_spec_str)
-
-        # Sort array
-        toml_sort_string_array(deps)
-
-        # Save file
-        self.write_parsed()
-
-        return old_spec != new_spec_str
+        """Add or replace a dependency; written at once unless a batch edit is open."""
+        with self.batch_edit() as batch:
+            return batch.add(spec, optional=optional, group=group)
 
     def add_dependency_from_string(
         self,
@@ -62,14 +47,52 @@ class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
         optional: bool = False,
         group: None | str = None,
     ) -> bool:
+        """Set the version of a dependency, adding it when missing.
+
+        An existing entry keeps its extras and markers.
+        """
         from packaging.requirements import Requirement
 
-        return self.add_dependency_from_spec(
-            spec=Requirement(f"{package_name}{operator}{version}"),
-            optional=optional,
-            group=group,
+        with self.batch_edit() as batch:
+            if batch.has(package_name, optional=optional, group=group):
+                return batch.update(
+                    package_name,
+                    f"{operator}{version}",
+                    optional=optional,
+                    group=group,
+                )
+
+            return self.add_dependency_from_spec(
+                spec=Requirement(f"{package_name}{operator}{version}"),
+                optional=optional,
+                group=group,
+            )
+
+    @contextmanager
+    def batch_edit(self) -> Iterator[PyprojectDependenciesBatch]:
+        """Group dependency edits, the file being written once when the block ends.
+
+        add_dependency_from_spec() and remove_dependency_by_name() called
+        inside the block join the batch, as do nested batch_edit() blocks;
+        reads still see the file as it was, and write_parsed() waits for the
+        block to end. Nothing is written if the block raises.
+        """
+        from wexample_wex_addon_dev_python.common.pyproject_dependencies_batch import (
+            PyprojectDependenciesBatch,
         )
 
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = PyprojectDependenciesBatch(pyproject=self)
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        batch.commit()
+
     def dumps(self, content: TOMLDocument | dict | None = None) -> str:
         """Serialize a TOMLDocument (preferred) or a plain dict to TOML.
         Using tomlkit.dumps preserves comments/formatting when content is a TOMLDocument.
@@ -96,6 +119,14 @@ class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
 
         return result
 
+    def get_dependencies_specs(
+        self, optional: bool = False, group: str = "dev"
+    ) -> list[str]:
+        """Return raw dependency specs (extras and markers included), sorted."""
+        deps = self._get_deps_array(optional=optional, group=group)
+
+        return sorted(str(spec) for spec in deps)
+
     def get_dependencies_versions(
         self, optional: bool = False, group: str = "dev"
     ) -> dict[str, str]:
@@ -132,10 +163,14 @@ class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
 
         The provided package_name can be raw; it will be canonicalized to ensure
         consistent matching against entries parsed from list_dependencies().
+        Inside batch_edit(), the removal joins the batch.
         """
         from packaging.requirements import Requirement
         from packaging.utils import canonicalize_name
 
+        if self._batch is not None:
+            return self._batch.remove(package_name, optional=optional, group=group)
+
         deps = self._get_deps_array(optional=optional, group=group)
 
         target = canonicalize_name(package_name)
@@ -156,6 +191,13 @@ class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
             return True
         return False
 
+    def write_parsed(self, content: TOMLDocument | dict | None = None) -> None:
+        # Inside batch_edit(), the batch writes the file once the block ends.
+        if self._batch is not None and content is None:
+            return
+
+        super().write_parsed(content)
+
     def _dependencies_array(self):
         """Ensure and return project.dependencies as a multi-line TOML array."""
         from wexample_filestate_python.helpers.toml import toml_ensure_array
@@ -302,7 +344,7 @@ class PythonPyprojectTomlFile(AppDependenciesConfigFileMixin, TomlFile):
         }
         dev_values = [toml_get_string_value(it).strip() for it in list(dev_arr)]
 
-        for pkg in ["pytest", "pytest-cov"]:
+        for pkg in ["pytest", "pytest-cov", "pytest-xdist"]:
             if pkg not in runtime_pkgs and pkg not in dev_values:
                 dev_arr.append(pkg)
 
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def coverage_format_line_ranges(lines: list[int]) -> str:
+    """Compact sorted line numbers into ranges, as "3-5, 9"."""
+    ranges: list[list[int]] = []
+    for line in sorted(set(lines)):
+        if ranges and line == ranges[-1][1] + 1:
+            ranges[-1][1] = line
+        else:
+            ranges.append([line, line])
+
+    return ", ".join(
+        str(start) if start == end else f"{start}-{end}" for start, end in ranges
+    )
+
+
+def coverage_get_sysmon_blocker(
+    python_version: str | None, coverage_version: str | None
+) -> str | None:
+    """What prevents the sys.monitoring coverage core, None when it can be used.
+
+    sys.monitoring appeared in Python 3.12, coverage.py uses it since 7.4.
+    An unknown Python version blocks it, an unknown coverage version
+    (not installed yet) does not.
+    """
+    from packaging.version import Version
+
+    if not python_version or Version(python_version) < Version("3.12"):
+        return f"Python 3.12+ (venv: {python_version})"
+    if coverage_version and Version(coverage_version) < Version("7.4"):
+        return f"coverage 7.4+ (venv: {coverage_version})"
+
+    return None
+
+
+def coverage_iter_json_files(
+    path: Path, chunk_size: int = 1 << 16
+) -> Iterator[tuple[str, dict]]:
+    """Yield every (file path, file data) entry of a coverage.py json report.
+
+    The report is read chunk by chunk and decoded one file entry at a time,
+    so reports of large code bases never sit in memory as a whole. Other
+    top-level values (meta, totals) are decoded and skipped.
+    """
+    import json
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    with path.open(encoding="utf-8") as file:
+
+        def _read_more() -> None:
+            nonlocal buffer, eof, position
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        def _next_char(expected: str) -> str:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer):
+                    break
+                if eof:
+                    raise ValueError(f"Unexpected end of coverage report {path}")
+                _read_more()
+
+            char = buffer[position]
+            if char not in expected:
+                raise ValueError(
+                    f'Expected one of "{expected}" in coverage report {path}, '
+                    f'got "{char}"'
+                )
+            position += 1
+            return char
+
+        def _decode() -> Any:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # The value goes on in the next chunk.
+                    if eof:
+                        raise
+                    _read_more()
+                    continue
+                # A number ending the buffer may be cut short.
+                if end == len(buffer) and not eof:
+                    _read_more()
+                    continue
+                position = end
+                return value
+
+        _next_char("{")
+        while True:
+            key = _decode()
+            _next_char(":")
+            if key != "files":
+                _decode()
+            else:
+                _next_char("{")
+                # Anything but an empty object: give the quote back.
+                if _next_char('"}') == '"':
+                    position -= 1
+                    while True:
+                        file_path = _decode()
+                        _next_char(":")
+                        yield file_path, _decode()
+                        if _next_char(",}") == "}":
+                            break
+            if _next_char(",}") == "}":
+                return
+
+
+def coverage_lines_to_numbits(lines: list[int]) -> bytes:
+    # Inverse of coverage_numbits_to_lines().
+    if not lines:
+        return b""
+
+    numbits = bytearray(max(lines) // 8 + 1)
+    for line in lines:
+        numbits[line // 8] |= 1 << (line % 8)
+
+    return bytes(numbits)
+
+
+def coverage_numbits_to_lines(numbits: bytes) -> list[int]:
+    # Same encoding as coverage.numbits: bit n of the blob is set for line n.
+    return [
+        byte_index * 8 + bit_index
+        for byte_index, byte in enumerate(numbits)
+        for bit_index in range(8)
+        if byte & (1 << bit_index)
+    ]
+
+
+def coverage_read_line_contexts(data_path: Path) -> dict[str, dict[int, set[str]]]:
+    """Map every measured file and line of a .coverage database to its contexts.
+
+    Reads the sqlite data file directly, so coverage.py does not have to be
+    importable. Test contexts recorded by pytest-cov ("node_id|run") are
+    reduced to the node id; lines only run at import time keep the empty
+    context. Line-mode data only: branch coverage stores arcs instead.
+    """
+    import sqlite3
+
+    line_contexts: dict[str, dict[int, set[str]]] = {}
+
+    connection = sqlite3.connect(f"file:{data_path}?mode=ro", uri=True)
+    try:
+        rows = connection.execute(
+            "SELECT file.path, context.context, line_bits.numbits "
+            "FROM line_bits "
+            "JOIN file ON file.id = line_bits.file_id "
+            "JOIN context ON context.id = line_bits.context_id"
+        ).fetchall()
+    finally:
+        connection.close()
+
+    for file_path, context, numbits in rows:
+        test = context.partition("|")[0]
+        lines = line_contexts.setdefault(file_path, {})
+        for line in coverage_numbits_to_lines(numbits):
+            lines.setdefault(line, set()).add(test)
+
+    return line_contexts
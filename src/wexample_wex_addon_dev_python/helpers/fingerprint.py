@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def fingerprint_from_data(data: Any) -> str:
+    """Return a stable sha256 digest of JSON-serializable data.
+
+    Keys are sorted so that two equal structures always produce the same
+    fingerprint, whatever their construction order.
+    """
+    import hashlib
+    import json
+
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
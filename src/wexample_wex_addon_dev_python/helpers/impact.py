@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+def impact_build_map(
+    line_contexts: dict[str, dict[int, set[str]]], base_path: Path
+) -> dict:
+    """Compact per-line test contexts into ranges of lines run by the same tests.
+
+    Returns {"tests": [node_id, ...], "files": {path: [[start, end, [test
+    index, ...]], ...]}}, paths relative to base_path. Lines only run at
+    import time get an empty test list.
+    """
+    from pathlib import Path
+
+    tests = sorted(
+        {
+            test
+            for lines in line_contexts.values()
+            for contexts in lines.values()
+            for test in contexts
+            if test
+        }
+    )
+    test_indexes = {test: index for index, test in enumerate(tests)}
+    files = {}
+
+    for file_path, lines in line_contexts.items():
+        path = Path(file_path)
+        if path.is_absolute():
+            if not path.is_relative_to(base_path):
+                continue
+            path = path.relative_to(base_path)
+
+        ranges = []
+        for line in sorted(lines):
+            indexes = sorted(test_indexes[test] for test in lines[line] if test)
+            if ranges and ranges[-1][1] == line - 1 and ranges[-1][2] == indexes:
+                ranges[-1][1] = line
+            else:
+                ranges.append([line, line, indexes])
+
+        files[path.as_posix()] = ranges
+
+    return {"files": files, "tests": tests}
+
+
+def impact_get_unknown_paths(impact_map: dict, paths: Iterable[str]) -> list[str]:
+    """Changed paths the map records no line of, sorted.
+
+    No test can be selected from them: a new or never imported source
+    file, a conftest.py, pyproject.toml or a data file may change what any
+    test does.
+    """
+    return sorted(path for path in paths if path not in impact_map["files"])
+
+
+def impact_parse_diff(
+    diff: str, new_side: bool = False
+) -> dict[str, list[tuple[int, int]]]:
+    """Map every file of a `git diff -U0` to the changed line ranges of its old side.
+
+    Line numbers are those of the diffed commit, the one a map was recorded
+    at. A pure insertion after line n is reported as the range (n, n + 1).
+    With new_side, ranges are the lines added to the new side instead, keyed
+    by the new path, and pure deletions are left out.
+    """
+    import re
+
+    changes: dict[str, list[tuple[int, int]]] = {}
+    old_path = None
+    current = None
+
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            new_path = None if line == "+++ /dev/null" else line[6:]
+            path = (new_path if new_side else old_path) or old_path or new_path
+            current = changes.setdefault(path, [])
+        elif line.startswith("@@") and current is not None:
+            match = re.match(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? ", line)
+            if not match:
+                continue
+            if new_side:
+                start = int(match.group(3))
+                count = int(match.group(4)) if match.group(4) is not None else 1
+                if count:
+                    current.append((start, start + count - 1))
+                continue
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            if count:
+                current.append((start, start + count - 1))
+            else:
+                current.append((start, start + 1))
+
+    return changes
+
+
+def impact_select_tests(
+    impact_map: dict, changes: dict[str, list[tuple[int, int]]]
+) -> set[str]:
+    """Return the tests that ran any of the changed lines.
+
+    A change to a line only run at import time (a def, a class attribute,
+    an import) may alter any code of the file: every test covering the file
+    is selected then.
+    """
+    tests = impact_map["tests"]
+    selected: set[int] = set()
+
+    for path, changed_ranges in changes.items():
+        ranges = impact_map["files"].get(path, [])
+
+        for start, end, indexes in ranges:
+            if not any(
+                start <= changed_end and changed_start <= end
+                for changed_start, changed_end in changed_ranges
+            ):
+                continue
+
+            if indexes:
+                selected.update(indexes)
+            else:
+                for _, _, file_indexes in ranges:
+                    selected.update(file_indexes)
+                break
+
+    return {tests[index] for index in selected}
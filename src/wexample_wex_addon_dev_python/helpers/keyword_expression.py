@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+
+def keyword_expression_compile(expression: str) -> Callable[[Iterable[str]], bool]:
+    """Compile a pytest `-k` expression into a test of the keyword names of a test.
+
+    Parsed by pytest itself, so the grammar is the one of the installed
+    pytest: identifiers combined with and, or, not and parentheses. An
+    identifier matches when it is a case-insensitive substring of any
+    name. An empty expression matches everything. Raises ValueError on an
+    invalid expression.
+    """
+    from _pytest.mark import expression as pytest_expression
+
+    if not expression.strip():
+        return lambda names: True
+
+    try:
+        compiled = pytest_expression.Expression.compile(expression)
+    # Older pytest versions raise their own ParseError.
+    except (
+        SyntaxError,
+        getattr(pytest_expression, "ParseError", SyntaxError),
+    ) as error:
+        raise ValueError(
+            f'Invalid keyword expression "{expression}": {error}'
+        ) from error
+
+    def _matches(names: Iterable[str]) -> bool:
+        lowered_names = [name.lower() for name in names]
+
+        def _match_name(subname: str, **kwargs: object) -> bool:
+            if kwargs:
+                raise ValueError(
+                    f'Invalid keyword expression "{expression}": keyword '
+                    "arguments are only supported by marker expressions."
+                )
+            subname = subname.lower()
+            return any(subname in name for name in lowered_names)
+
+        return compiled.evaluate(_match_name)
+
+    return _matches
+
+
+def keyword_expression_matches(expression: str, names: Iterable[str]) -> bool:
+    """Evaluate a pytest `-k` expression against the keyword names of a test."""
+    return keyword_expression_compile(expression)(names)
+
+
+def keyword_expression_select_paths(
+    expression: str, node_keywords: dict[str, Iterable[str]]
+) -> list[str]:
+    """Test files holding at least one test matched by the expression, in order.
+
+    Files are far fewer than node ids: passed with the expression itself,
+    they keep the command line short whatever the number of matching tests.
+    """
+    matches = keyword_expression_compile(expression)
+    paths = {}
+    for node_id, names in node_keywords.items():
+        if matches(names):
+            paths[node_id.split("::", 1)[0]] = True
+
+    return list(paths)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from wexample_wex_addon_dev_python.const.python import (
+    PYTHON_TEST_METRICS_SORT_DURATION,
+    PYTHON_TEST_METRICS_SORT_MEMORY,
+)
+
+
+def metrics_add_run(
+    history: list[dict], commit_hash: str, tests: dict, max_runs: int = 20
+) -> list[dict]:
+    """Add the per-test metrics of a run to the history, one entry per commit.
+
+    Runs on the same commit update its entry, so partial runs (shards,
+    affected tests) complete each other. Only the last max_runs commits are
+    kept, oldest first.
+    """
+    history = list(history)
+
+    if history and history[-1]["commit_hash"] == commit_hash:
+        history[-1] = {
+            "commit_hash": commit_hash,
+            "tests": {**history[-1]["tests"], **tests},
+        }
+    else:
+        history.append({"commit_hash": commit_hash, "tests": dict(tests)})
+
+    return history[-max_runs:]
+
+
+def metrics_get_durations(history: list[dict]) -> dict[str, float]:
+    """Latest known total duration of each test, setup and teardown included."""
+    durations = {}
+    for run in history:
+        for node_id, entry in run["tests"].items():
+            durations[node_id] = metrics_get_total_duration(entry)
+
+    return durations
+
+
+def metrics_get_total_duration(entry: dict) -> float:
+    return sum(entry.get(phase, 0) for phase in ("setup", "call", "teardown"))
+
+
+def metrics_rank_slowest(
+    history: list[dict], limit: int = 10, sort: str = PYTHON_TEST_METRICS_SORT_DURATION
+) -> list[dict]:
+    """Return the worst tests of their latest measurement, with their trend.
+
+    The trend compares the latest value to the oldest one of the history,
+    as a ratio: 0.5 means 50% slower (or heavier) than it used to be.
+    """
+    if sort not in (PYTHON_TEST_METRICS_SORT_DURATION, PYTHON_TEST_METRICS_SORT_MEMORY):
+        raise ValueError(
+            f'Invalid sort "{sort}": expected "{PYTHON_TEST_METRICS_SORT_DURATION}" '
+            f'or "{PYTHON_TEST_METRICS_SORT_MEMORY}".'
+        )
+
+    values: dict[str, list[float]] = {}
+    latest: dict[str, dict] = {}
+    for run in history:
+        for node_id, entry in run["tests"].items():
+            if sort == PYTHON_TEST_METRICS_SORT_MEMORY:
+                if "memory_peak" not in entry:
+                    continue
+                value = entry["memory_peak"]
+            else:
+                value = metrics_get_total_duration(entry)
+
+            values.setdefault(node_id, []).append(value)
+            latest[node_id] = entry
+
+    rows = []
+    for node_id, node_values in values.items():
+        first, last = node_values[0], node_values[-1]
+        rows.append(
+            {
+                **latest[node_id],
+                "node_id": node_id,
+                "duration": metrics_get_total_duration(latest[node_id]),
+                "runs": len(node_values),
+                "trend": (last - first) / first if first else None,
+                "value": last,
+            }
+        )
+
+    rows.sort(key=lambda row: (-row["value"], row["node_id"]))
+
+    return rows[:limit]
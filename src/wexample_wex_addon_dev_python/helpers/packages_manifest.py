@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def packages_manifest_build(
+    root: Path,
+    locations: list[str],
+    is_package_directory: Callable[[Path], bool],
+) -> dict:
+    """List the package directories matched by the location globs under root.
+
+    The manifest holds its key (see packages_manifest_get_key()), the
+    relative paths found, the pyproject.toml modification time of each, and
+    the names and local dependencies of the packages, left to None for the
+    caller to fill in.
+    """
+    paths = sorted(
+        {
+            str(path.relative_to(root))
+            for location in locations
+            for path in root.glob(location)
+            if is_package_directory(path)
+        }
+    )
+
+    return {
+        "dependencies": None,
+        "key": packages_manifest_get_key(root, locations),
+        "names": None,
+        "paths": paths,
+        "pyprojects": packages_manifest_get_pyproject_mtimes(root, paths),
+    }
+
+
+def packages_manifest_get_key(root: Path, locations: list[str]) -> list:
+    """Locations and modification time of the directory each one lists.
+
+    A location glob lists the directory before its first wildcard ("pip"
+    for "pip/*"), or the parent of a plain path: adding, removing or
+    renaming a package there changes its modification time.
+    """
+    directories = set()
+    for location in locations:
+        parts = location.split("/")
+        wildcard_index = next(
+            (
+                index
+                for index, part in enumerate(parts)
+                if any(char in part for char in "*?[")
+            ),
+            len(parts) - 1,
+        )
+        directories.add("/".join(parts[:wildcard_index]) or ".")
+
+    return [
+        locations,
+        [
+            [directory, packages_manifest_get_mtime_ns(root / directory)]
+            for directory in sorted(directories)
+        ],
+    ]
+
+
+def packages_manifest_get_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def packages_manifest_get_pyproject_mtimes(
+    root: Path, paths: list[str]
+) -> dict[str, int | None]:
+    return {
+        path: packages_manifest_get_mtime_ns(root / path / "pyproject.toml")
+        for path in paths
+    }
+
+
+def packages_manifest_is_fresh(manifest: object, root: Path, key: list) -> bool:
+    """Whether a stored manifest still describes the packages under root.
+
+    Its key must match, and no pyproject.toml of its packages may have
+    changed: editing one can rename its package, or remove it.
+    """
+    if not isinstance(manifest, dict) or manifest.get("key") != key:
+        return False
+
+    return manifest.get("pyprojects") == packages_manifest_get_pyproject_mtimes(
+        root, manifest.get("paths") or []
+    )
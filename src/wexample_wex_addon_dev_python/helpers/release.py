@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_helpers.const.types import (
+    UPGRADE_TYPE_INTERMEDIATE,
+    UPGRADE_TYPE_MAJOR,
+    UPGRADE_TYPE_MINOR,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from griffe import Module
+
+
+def release_classify_bump(
+    package_path: Path,
+    package_name: str,
+    snapshot_dir: Path,
+    last_tag: str | None,
+    has_changes: bool,
+    has_source_changes: bool,
+) -> dict:
+    """Classify the version bump one package needs since its last publication tag.
+
+    The git state (last tag, changes since it in the package and in src)
+    is looked up by the caller, for every package at once. Self-contained
+    so that a suite compares public APIs in worker processes: takes and
+    returns plain values only. The bump is None when nothing changed, and
+    major when the public API comparison fails, the error being returned
+    for the caller to report.
+    """
+    import time
+
+    started_at = time.perf_counter()
+    result = {"breaking": None, "bump": None, "error": None, "last_tag": last_tag}
+
+    if last_tag is None:
+        # First publication — no previous consumers, nothing to break.
+        result["bump"] = UPGRADE_TYPE_MINOR
+    elif not has_changes:
+        pass
+    elif not has_source_changes:
+        result["bump"] = UPGRADE_TYPE_MINOR
+    else:
+        try:
+            result["breaking"] = release_count_breaking_changes(
+                package_path=package_path,
+                module_name=package_name.replace("-", "_"),
+                tag=last_tag,
+                snapshot_dir=snapshot_dir,
+            )
+            result["bump"] = (
+                UPGRADE_TYPE_MAJOR if result["breaking"] else UPGRADE_TYPE_INTERMEDIATE
+            )
+        except Exception as error:
+            result["bump"] = UPGRADE_TYPE_MAJOR
+            result["error"] = f"{type(error).__name__}: {error}"
+
+    result["duration"] = time.perf_counter() - started_at
+    return result
+
+
+def release_count_breaking_changes(
+    package_path: Path, module_name: str, tag: str, snapshot_dir: Path
+) -> int:
+    """Count the public API breaking changes of the working tree since tag."""
+    import griffe
+
+    previous = release_load_api_snapshot(
+        package_path=package_path,
+        module_name=module_name,
+        tag=tag,
+        snapshot_dir=snapshot_dir,
+    )
+    current = griffe.load(module_name, search_paths=[str(package_path / "src")])
+
+    return len(list(griffe.find_breaking_changes(previous, current)))
+
+
+def release_get_tag_prefix(tag_name: str, version: str) -> str:
+    """Glob matching every tag of the convention tag_name follows for version.
+
+    "helpers/v1.2.0" for version "1.2.0" gives "helpers/v*". Raises
+    ValueError when tag_name does not end with the version.
+    """
+    if not version or not tag_name.endswith(version):
+        raise ValueError(
+            f'Publication tag "{tag_name}" does not end with its version "{version}".'
+        )
+
+    return f"{tag_name[: -len(version)]}*"
+
+
+def release_load_api_snapshot(
+    package_path: Path, module_name: str, tag: str, snapshot_dir: Path
+) -> Module:
+    """Public API of a package at a released tag, cached in snapshot_dir.
+
+    A tag never changes once released: its API is loaded from git once,
+    then decoded from the snapshot, keyed by tag and commit so a moved tag
+    is loaded again. An unreadable snapshot (e.g. written by another griffe
+    version) is loaded again too.
+    """
+    import json
+    import re
+
+    import griffe
+    from wexample_helpers.helpers.shell import shell_run
+
+    commit_hash = shell_run(
+        cmd=["git", "rev-parse", "--verify", f"{tag}^{{commit}}"],
+        cwd=package_path,
+        inherit_stdio=False,
+    ).stdout.strip()
+    safe_tag = re.sub(r"[^\w.-]", "_", tag)
+    snapshot_path = snapshot_dir / f"{safe_tag}-{commit_hash[:12]}.json"
+
+    if snapshot_path.exists():
+        try:
+            module = json.loads(
+                snapshot_path.read_text(), object_hook=griffe.json_decoder
+            )
+        # Missing or unexpected keys come from another griffe version.
+        except (KeyError, OSError, TypeError, ValueError):
+            module = None
+
+        if isinstance(module, griffe.Module):
+            # A decoded module has no collection to resolve its aliases
+            # through, as a loaded one has: adding it to one attaches it.
+            griffe.ModulesCollection().set_member(module.path, module)
+            return module
+
+    module = griffe.load_git(
+        module_name,
+        ref=tag,
+        repo=str(package_path),
+        search_paths=["src"],
+    )
+
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    snapshot_path.write_text(module.as_json(full=True))
+
+    return module
+
+
+def release_propagate_bumps(
+    bumps: dict[str, str | None], dependencies_map: dict[str, list[str]]
+) -> dict[str, str | None]:
+    """Raise to a patch the packages whose local dependencies release a new minor or major.
+
+    Those dependents get their dependency constraint updated, so they need
+    at least a patch release (UPGRADE_TYPE_MINOR). A patch release does not
+    propagate further: constraints already accept it.
+    """
+    propagating = {UPGRADE_TYPE_INTERMEDIATE, UPGRADE_TYPE_MAJOR}
+
+    return {
+        name: (
+            UPGRADE_TYPE_MINOR
+            if bump is None
+            and any(
+                bumps.get(dependency) in propagating
+                for dependency in dependencies_map.get(name, [])
+            )
+            else bump
+        )
+        for name, bump in bumps.items()
+    }
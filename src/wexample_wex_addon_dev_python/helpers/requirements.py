@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+Item = TypeVar("Item")
+
+
+def requirements_compile_wave(
+    items: list[Item],
+    compile_items: Callable[[list[Item], bool], dict[Item, Exception]],
+    on_retry: Callable[[list[Item]], None],
+) -> dict[Item, Exception]:
+    """Compile a wave of locks, retrying once the unsatisfiable ones.
+
+    compile_items(items, refresh) returns the failure of each item that
+    failed. Items reported unsatisfiable (see
+    requirements_is_unsatisfiable_error()) are compiled again with refresh
+    set, after on_retry(retried items); other failures are kept as they are.
+    Returns the remaining failures, in the order of items.
+    """
+    failures = compile_items(items, False)
+    retryable = [
+        item
+        for item in items
+        if item in failures and requirements_is_unsatisfiable_error(str(failures[item]))
+    ]
+    if retryable:
+        on_retry(retryable)
+        for item in retryable:
+            del failures[item]
+        failures.update(compile_items(retryable, True))
+
+    return {item: failures[item] for item in items if item in failures}
+
+
+def requirements_is_unsatisfiable_error(message: str) -> bool:
+    """Whether a uv compile failed on an unsatisfiable resolution.
+
+    Right after a publish, the index can still serve a stale view missing
+    the new version: such failures are worth a retry, others are not.
+    """
+    return "No solution found" in message or "unsatisfiable" in message
+
+
+def requirements_lock_applies(python_version: str | None, lock_version: str) -> bool:
+    """Whether a lock compiled for lock_version (e.g. "3.11") pins python_version.
+
+    Pins can differ from one interpreter to another (markers, wheels), so a
+    lock only applies to the major.minor it was compiled for. An unknown
+    python_version never matches.
+    """
+    if not python_version:
+        return False
+
+    return python_version.split(".")[:2] == lock_version.split(".")[:2]
+
+
+def requirements_read_file(path: Path) -> list[str]:
+    """Return the requirement specs of a requirements.txt, in file order.
+
+    Comments (including uv's "# via" annotations), blank lines and pip
+    options such as "--hash" or "-e" are dropped; continuation lines are
+    joined first.
+    """
+    content = path.read_text().replace("\\\n", " ")
+
+    specs: list[str] = []
+    for line in content.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith(("#", "-")):
+            continue
+        # Per-requirement options (e.g. --hash) follow the spec itself.
+        specs.append(line.split(" --", 1)[0].strip())
+
+    return specs
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+
+def shard_parse_spec(spec: str) -> tuple[int, int]:
+    """Parse an "i/N" shard spec into (index, count), index being 1-based."""
+    index, separator, count = spec.partition("/")
+
+    if not separator or not index.strip().isdigit() or not count.strip().isdigit():
+        raise ValueError(f'Invalid shard "{spec}": expected "i/N", e.g. "2/4".')
+
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(
+            f'Invalid shard "{spec}": index must be between 1 and {max(count, 1)}.'
+        )
+
+    return index, count
+
+
+def shard_parse_report_name(name: str) -> tuple[int, int] | None:
+    """(index, count) of a shard coverage report file name, None for other files."""
+    import re
+
+    match = re.fullmatch(r"coverage\.shard-(\d+)-of-(\d+)\.json", name)
+    if not match:
+        return None
+
+    return int(match.group(1)), int(match.group(2))
+
+
+def shard_partition_node_ids(
+    node_ids: list[str], durations: dict[str, float], count: int
+) -> list[list[str]]:
+    """Split test node ids into count shards of about the same total duration.
+
+    Longest tests are placed first, each on the currently lightest shard.
+    Tests without a recorded duration are given the average of the known
+    ones. The result only depends on its inputs, so every CI node computes
+    the same split independently.
+    """
+    known = [durations[node_id] for node_id in node_ids if node_id in durations]
+    default_duration = sum(known) / len(known) if known else 1.0
+
+    shards: list[list[str]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+
+    for node_id in sorted(
+        node_ids,
+        key=lambda node_id: (-durations.get(node_id, default_duration), node_id),
+    ):
+        lightest = min(range(count), key=lambda index: (totals[index], index))
+        shards[lightest].append(node_id)
+        totals[lightest] += durations.get(node_id, default_duration)
+
+    # Keep the collection order inside each shard.
+    order = {node_id: position for position, node_id in enumerate(node_ids)}
+    for shard in shards:
+        shard.sort(key=order.__getitem__)
+
+    return shards
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wexample_wex_addon_dev_python.dataclass.venv_distribution import (
+        VenvDistribution,
+    )
+
+
+def venv_clone(source_path: Path, target_path: Path, python_bin: str) -> None:
+    """Create target_path as a copy of the source venv, sharing its files.
+
+    A fresh venv is created at the target (so pyvenv.cfg and the interpreter
+    point to the right place), then site-packages is hardlinked from the
+    source, falling back to a plain copy across filesystems. Installers
+    replace files rather than writing them in place, so the source venv is
+    never altered by later installs in the clone. Console scripts are
+    copied with their shebang rewritten to the target interpreter.
+    """
+    import os
+    import shutil
+
+    def _link_or_copy(source: str, target: str) -> None:
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    venv_create(venv_path=target_path, python_bin=python_bin, with_pip=False)
+
+    for source_site_packages in venv_get_site_packages_paths(source_path):
+        shutil.copytree(
+            source_site_packages,
+            target_path / source_site_packages.relative_to(source_path),
+            symlinks=True,
+            copy_function=_link_or_copy,
+            dirs_exist_ok=True,
+        )
+
+    source_shebang = f"#!{source_path / 'bin'}/".encode()
+    target_shebang = f"#!{target_path / 'bin'}/".encode()
+    for source_script in (source_path / "bin").iterdir():
+        target_script = target_path / "bin" / source_script.name
+        if target_script.exists() or source_script.is_symlink():
+            continue
+
+        content = source_script.read_bytes()
+        if content.startswith(source_shebang):
+            content = target_shebang + content[len(source_shebang) :]
+        target_script.write_bytes(content)
+        shutil.copymode(source_script, target_script)
+
+
+def venv_create(venv_path: Path, python_bin: str, with_pip: bool = True) -> None:
+    from wexample_helpers.helpers.shell import shell_run
+
+    cmd = [python_bin, "-m", "venv", "--clear", "--copies"]
+    if not with_pip:
+        cmd.append("--without-pip")
+    cmd.append(str(venv_path))
+
+    shell_run(cmd=cmd, inherit_stdio=True)
+
+
+def venv_distribution_satisfies(
+    inventory: dict[str, VenvDistribution], requirement: str
+) -> bool:
+    """Return True if the inventory already holds a version matching requirement.
+
+    Requirements carrying extras or markers are never considered satisfied:
+    deciding on them needs the installer itself.
+    """
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+
+    req = Requirement(requirement)
+    if req.extras or req.marker or req.url:
+        return False
+
+    distribution = inventory.get(canonicalize_name(req.name))
+    if distribution is None:
+        return False
+
+    return req.specifier.contains(distribution.version, prereleases=True)
+
+
+def venv_find_interpreters(
+    versions: list[str], requires_python: str | None = None
+) -> dict[str, str]:
+    """Map each of the given versions to a local pythonX.Y satisfying requires_python.
+
+    Versions without an interpreter on PATH are left out, as well as
+    interpreters that do not start (e.g. pyenv shims of versions that are
+    not enabled).
+    """
+    import shutil
+
+    from packaging.specifiers import SpecifierSet
+
+    specifier = SpecifierSet(requires_python or "")
+    interpreters = {}
+
+    for version in versions:
+        python_bin = shutil.which(f"python{version}")
+        if not python_bin:
+            continue
+
+        try:
+            full_version = venv_get_interpreter_version(python_bin).split()[0]
+        except Exception:
+            continue
+
+        if specifier.contains(full_version, prereleases=True):
+            interpreters[version] = python_bin
+
+    return interpreters
+
+
+def venv_get_missing_requirements(
+    inventory: dict[str, VenvDistribution],
+    requirements: list[str],
+    excluded_names: set[str] | None = None,
+) -> list[str]:
+    """Requirements the inventory does not satisfy, skipping the excluded names."""
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+
+    excluded_names = excluded_names or set()
+
+    return [
+        requirement
+        for requirement in requirements
+        if canonicalize_name(Requirement(requirement).name) not in excluded_names
+        and not venv_distribution_satisfies(inventory, requirement)
+    ]
+
+
+def venv_get_python_version(venv_path: Path) -> str | None:
+    """Return the interpreter version recorded in the venv's pyvenv.cfg.
+
+    Reading the file avoids spawning the venv interpreter. Returns None when
+    the venv does not exist or does not record its version.
+    """
+    config_path = venv_path / "pyvenv.cfg"
+    if not config_path.is_file():
+        return None
+
+    values = {}
+    for line in config_path.read_text().splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
+            values[key.strip()] = value.strip()
+
+    # venv writes "version", uv writes "version_info".
+    return values.get("version") or values.get("version_info")
+
+
+def venv_get_interpreter_version(python_bin: str) -> str:
+    """Return the full version string of an interpreter, venv or not."""
+    from wexample_helpers.helpers.shell import shell_run
+
+    return shell_run(
+        cmd=[python_bin, "-c", "import sys; print(sys.version)"],
+        inherit_stdio=False,
+    ).stdout.strip()
+
+
+def venv_get_site_packages_paths(venv_path: Path) -> list[Path]:
+    return sorted((venv_path / "lib").glob("python*/site-packages"))
+
+
+def venv_scan_distributions(venv_path: Path) -> dict[str, VenvDistribution]:
+    """Map every distribution installed in the venv to its version and editable path.
+
+    Reads the *.dist-info directories of site-packages in a single pass,
+    instead of asking the venv interpreter about each package one by one.
+    Keys are canonicalized package names.
+    """
+    import json
+    from pathlib import Path
+    from urllib.parse import unquote, urlparse
+    from urllib.request import url2pathname
+
+    from packaging.utils import canonicalize_name
+
+    from wexample_wex_addon_dev_python.dataclass.venv_distribution import (
+        VenvDistribution,
+    )
+
+    inventory: dict[str, VenvDistribution] = {}
+
+    for site_packages in venv_get_site_packages_paths(venv_path):
+        for dist_info in site_packages.glob("*.dist-info"):
+            metadata_path = dist_info / "METADATA"
+            if not metadata_path.is_file():
+                continue
+
+            headers = {}
+            with metadata_path.open(encoding="utf-8", errors="replace") as metadata:
+                # Headers end at the first blank line, the long description follows.
+                for line in metadata:
+                    if not line.strip():
+                        break
+                    key, separator, value = line.partition(":")
+                    if separator and key in ("Name", "Version"):
+                        headers[key] = value.strip()
+
+            if "Name" not in headers or "Version" not in headers:
+                continue
+
+            editable_path = None
+            direct_url_path = dist_info / "direct_url.json"
+            if direct_url_path.is_file():
+                try:
+                    direct_url = json.loads(direct_url_path.read_text())
+                except ValueError:
+                    direct_url = {}
+
+                url = urlparse(direct_url.get("url", ""))
+                if url.scheme == "file" and direct_url.get("dir_info", {}).get(
+                    "editable"
+                ):
+                    editable_path = Path(url2pathname(unquote(url.path)))
+
+            inventory[canonicalize_name(headers["Name"])] = VenvDistribution(
+                version=headers["Version"],
+                editable_path=editable_path,
+            )
+
+    return inventory
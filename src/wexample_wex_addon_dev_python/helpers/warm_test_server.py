@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def warm_test_server_check_socket_owner(socket_path: Path) -> None:
+    """Refuse a socket that is not ours: requests carry the test environment."""
+    import os
+    import stat
+
+    try:
+        socket_stat = os.lstat(socket_path)
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+        raise RuntimeError(
+            f"Refusing to use {socket_path}: not a socket owned by the current user."
+        )
+
+
+def warm_test_server_filter_env(
+    env: dict[str, str], names: list[str], prefixes: list[str]
+) -> dict[str, str]:
+    """Keep the variables listed in names or starting with one of the prefixes."""
+    return {
+        key: value
+        for key, value in env.items()
+        if key in names or key.startswith(tuple(prefixes))
+    }
+
+
+def warm_test_server_get_socket_dir(base_path: Path | None = None) -> Path:
+    """Private directory holding the sockets of the current user's servers.
+
+    Placed in $XDG_RUNTIME_DIR when available, in the temporary directory
+    otherwise. Created with mode 0700; an existing one must be a real
+    directory owned by the current user and closed to others.
+    """
+    import os
+    import stat
+    import tempfile
+
+    if base_path is None:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir and Path(runtime_dir).is_dir():
+            base_path = Path(runtime_dir)
+            name = "wex-test"
+        else:
+            base_path = Path(tempfile.gettempdir())
+            name = f"wex-test-{os.getuid()}"
+    else:
+        name = "wex-test"
+
+    path = base_path / name
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+
+    dir_stat = os.lstat(path)
+    if (
+        not stat.S_ISDIR(dir_stat.st_mode)
+        or dir_stat.st_uid != os.getuid()
+        or dir_stat.st_mode & 0o077
+    ):
+        raise RuntimeError(
+            f"Refusing to use {path}: not a directory private to the current user."
+        )
+
+    return path
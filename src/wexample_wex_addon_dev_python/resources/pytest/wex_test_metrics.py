@@ -0,0 +1,136 @@
+"""pytest plugin reporting collected tests and per-test metrics to wex.
+
+Loaded by wex with `-p wex_test_metrics`, from the package venv: it only
+depends on pytest and the standard library. Results are written as json to
+the path given by WEX_TEST_METRICS_OUTPUT:
+
+    {node_id: {"setup": s, "call": s, "teardown": s, "memory_peak": bytes}}
+
+Memory peaks are measured with tracemalloc, which slows tests down, so only
+when WEX_TEST_METRICS_MEMORY is set.
+
+When WEX_TEST_COLLECTION_OUTPUT is set, the collected tests are written
+there with the names `-k` matches them against (the names of the test and
+its parents, extra keywords and markers), as {node_id: [name, ...]}.
+
+When WEX_TEST_SELECTION_INPUT is set, it is the path of a json list of node
+ids (or test file paths): collected tests not in it are deselected. Long
+selections go through this file rather than the command line.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tracemalloc
+
+import pytest
+
+MEMORY_PEAK_PROPERTY = "wex_memory_peak"
+
+_metrics: dict[str, dict[str, float]] = {}
+
+
+def _get_keyword_names(item: pytest.Item) -> list[str]:
+    # Same names as pytest's own -k matching, see _pytest.mark.KeywordMatcher.
+    names = set()
+    for node in item.listchain():
+        if isinstance(node, pytest.Session):
+            continue
+        if isinstance(node, getattr(pytest, "Directory", ())) and isinstance(
+            node.parent, pytest.Session
+        ):
+            continue
+        names.add(node.name)
+
+    names.update(item.listextrakeywords())
+    function = getattr(item, "function", None)
+    if function:
+        names.update(function.__dict__)
+    names.update(mark.name for mark in item.iter_markers())
+
+    return sorted(names)
+
+
+def _is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def _tracks_memory() -> bool:
+    return bool(os.environ.get("WEX_TEST_METRICS_MEMORY"))
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    output_path = os.environ.get("WEX_TEST_COLLECTION_OUTPUT")
+    if not output_path or _is_xdist_worker(session.config):
+        return
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as output:
+        json.dump(
+            {item.nodeid: _get_keyword_names(item) for item in session.items}, output
+        )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    input_path = os.environ.get("WEX_TEST_SELECTION_INPUT")
+    if not input_path:
+        return
+
+    with open(input_path, encoding="utf-8") as selection_file:
+        selection = set(json.load(selection_file))
+
+    selected = []
+    deselected = []
+    for item in items:
+        if item.nodeid in selection or item.nodeid.partition("::")[0] in selection:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if _tracks_memory() and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    if not _tracks_memory():
+        yield
+        return
+
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    yield
+    # Memory allocated by the test on top of what was already there. User
+    # properties travel with the report, from xdist workers too.
+    item.user_properties.append(
+        (MEMORY_PEAK_PROPERTY, tracemalloc.get_traced_memory()[1] - baseline)
+    )
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    entry = _metrics.setdefault(report.nodeid, {})
+    entry[report.when] = round(report.duration, 6)
+
+    for name, value in report.user_properties:
+        if name == MEMORY_PEAK_PROPERTY:
+            entry["memory_peak"] = value
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    output_path = os.environ.get("WEX_TEST_METRICS_OUTPUT")
+    # Workers report to the controller, which writes for everyone.
+    if not output_path or _is_xdist_worker(session.config):
+        return
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as output:
+        json.dump(_metrics, output)
@@ -0,0 +1,183 @@
+"""Warm pytest server: imports once, then forks a fresh process per test run.
+
+Started by wex from the package venv:
+
+    python wex_test_server.py SOCKET_PATH IMPORT_NAME [IDLE_TIMEOUT]
+
+It imports pytest and the package (hence most of its dependencies), then
+listens on a unix socket. Each request is one json line:
+
+    {"args": [pytest arguments], "cwd": "...", "env": {...}}
+
+A child is forked for every request: it runs pytest.main(args) with its
+output sent to the connection, then ends the stream with EXIT_MARKER and
+the exit code. Imported modules are never reloaded: when the file of one
+of them changed since startup, the server answers RESTART_MARKER and exits
+so that the client starts a fresh one. Only the standard library and
+pytest are used, the package venv does not depend on wex.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+
+EXIT_MARKER = b"\n\x00wex-test-server-exit:"
+RESTART_MARKER = b"\x00wex-test-server-restart\n"
+
+
+def _get_modules_mtimes() -> dict[str, float]:
+    mtimes = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        try:
+            mtimes[path] = os.stat(path).st_mtime
+        except OSError:
+            continue
+
+    return mtimes
+
+
+def _modules_changed(mtimes: dict[str, float]) -> bool:
+    for path, mtime in mtimes.items():
+        try:
+            if os.stat(path).st_mtime != mtime:
+                return True
+        except OSError:
+            return True
+
+    return False
+
+
+def _preload_pytest_plugins(pytest) -> None:
+    """Import the plugins pytest loads on startup, collecting an empty directory.
+
+    Plugins are found through entry points and imported by every
+    pytest.main() call: preloading them spares each run this cost. No file
+    of the package is collected, its tests are always imported fresh.
+    """
+    import contextlib
+    import io
+    import tempfile
+
+    with (
+        tempfile.TemporaryDirectory() as empty_path,
+        contextlib.redirect_stdout(io.StringIO()),
+    ):
+        pytest.main(
+            [
+                "--collect-only",
+                "-q",
+                "-p",
+                "no:cacheprovider",
+                "-c",
+                os.devnull,
+                "--rootdir",
+                empty_path,
+                empty_path,
+            ]
+        )
+
+
+def _run_child(connection: socket.socket, request: dict) -> None:
+    import pytest
+
+    exit_code = 1
+    try:
+        # Tests spawning subprocesses need to wait for them.
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.setsid()
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+
+        fd = connection.fileno()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+
+        exit_code = int(pytest.main(request["args"]))
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            connection.sendall(EXIT_MARKER + str(exit_code).encode() + b"\n")
+        finally:
+            os._exit(exit_code)
+
+
+def _serve(socket_path: str, idle_timeout: float) -> None:
+    # Children are reaped automatically, the server never waits for them.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    mtimes = _get_modules_mtimes()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    socket_inode = os.stat(socket_path).st_ino
+    server.listen()
+    server.settimeout(idle_timeout)
+
+    try:
+        while True:
+            try:
+                connection, _ = server.accept()
+            except TimeoutError:
+                return
+
+            with connection:
+                with connection.makefile("rb") as reader:
+                    line = reader.readline()
+                # Empty requests only check that the server listens.
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+
+                if _modules_changed(mtimes):
+                    # Stop listening first, so the client's next attempt
+                    # starts a new server instead of reaching this one.
+                    server.close()
+                    _unlink_own_socket(socket_path, socket_inode)
+                    connection.sendall(RESTART_MARKER)
+                    return
+
+                if os.fork() == 0:
+                    server.close()
+                    _run_child(connection, request)
+    finally:
+        server.close()
+        _unlink_own_socket(socket_path, socket_inode)
+
+
+def _unlink_own_socket(socket_path: str, socket_inode: int) -> None:
+    # A server started meanwhile may already listen on the same path.
+    try:
+        if os.stat(socket_path).st_ino == socket_inode:
+            os.unlink(socket_path)
+    except OSError:
+        pass
+
+
+def main() -> None:
+    socket_path, import_name = sys.argv[1], sys.argv[2]
+    idle_timeout = float(sys.argv[3]) if len(sys.argv) > 3 else 1800.0
+
+    import pytest
+
+    importlib.import_module(import_name)
+    _preload_pytest_plugins(pytest)
+
+    _serve(socket_path=socket_path, idle_timeout=idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
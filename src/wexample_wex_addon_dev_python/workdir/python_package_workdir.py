@@ -5,10 +5,6 @@ from typing import TYPE_CHECKING
 
 from wexample_filestate.const.disk import DiskItemType
 from wexample_helpers.decorator.base_class import base_class
-from wexample_wex_addon_app.helpers.python import (
-    python_install_dependency_in_venv,
-    python_is_package_installed_editable_in_venv,
-)
 
 from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
 
@@ -129,6 +125,10 @@ class PythonPackageWorkdir(PythonWorkdir):
                     "pytest_cache/",
                     ".coverage",
                     "htmlcov/",
+                    # Untracked reports would make every affected run a
+                    # full one, see PythonWorkdir._get_test_affected_node_ids().
+                    "/coverage.json",
+                    "/coverage.shard-*-of-*.json",
                 ],
                 "Editor and IDE settings": [
                     ".vscode/",
@@ -197,6 +197,8 @@ class PythonPackageWorkdir(PythonWorkdir):
         return found
 
     def _classify_version_bump(self, last_tag: str) -> str:
+        import time
+
         from wexample_helpers.const.types import (
             UPGRADE_TYPE_INTERMEDIATE,
             UPGRADE_TYPE_MAJOR,
@@ -207,30 +209,32 @@ class PythonPackageWorkdir(PythonWorkdir):
         if not git_has_changes_since_tag(last_tag, "src", cwd=self.get_path()):
             return UPGRADE_TYPE_MINOR
 
-        try:
-            import griffe
-
-            module_name = self.get_package_name().replace("-", "_")
-            repo_path = str(self.get_path())
+        from wexample_wex_addon_dev_python.helpers.release import (
+            release_count_breaking_changes,
+        )
 
-            previous = griffe.load_git(
-                module_name,
-                ref=last_tag,
-                repo=repo_path,
-                search_paths=["src"],
+        started_at = time.perf_counter()
+        try:
+            breaking = release_count_breaking_changes(
+                package_path=self.get_path(),
+                module_name=self.get_package_name().replace("-", "_"),
+                tag=last_tag,
+                snapshot_dir=self.get_local_dir_path() / "api_snapshots",
             )
-            current = griffe.load(
-                module_name,
-                search_paths=[str(self.get_path() / "src")],
+        except Exception as error:
+            self.warning(
+                f"Public API comparison with {last_tag} failed "
+                f"({type(error).__name__}: {error}), classifying the bump as major"
             )
+            return UPGRADE_TYPE_MAJOR
 
-            if list(griffe.find_breaking_changes(previous, current)):
-                return UPGRADE_TYPE_MAJOR
-
-            return UPGRADE_TYPE_INTERMEDIATE
+        self.log(
+            f"Public API compared with {last_tag} in "
+            f"{time.perf_counter() - started_at:.1f}s: "
+            f"{breaking} breaking change(s)"
+        )
 
-        except Exception:
-            return UPGRADE_TYPE_MAJOR
+        return UPGRADE_TYPE_MAJOR if breaking else UPGRADE_TYPE_INTERMEDIATE
 
     def _collect_suite_dependencies(
         self,
@@ -276,6 +280,23 @@ class PythonPackageWorkdir(PythonWorkdir):
     def _get_critical_directories(self) -> list[str]:
         return ["src"]
 
+    def _get_install_fingerprint_data(self, venv_path: Path, env: str | None) -> dict:
+        from wexample_app.const.env import ENV_NAME_LOCAL
+
+        data = super()._get_install_fingerprint_data(venv_path=venv_path, env=env)
+
+        suite_workdir = self.get_shallow_suite_workdir()
+        if env == ENV_NAME_LOCAL and suite_workdir:
+            # Suite packages are installed from their paths: a bumped version
+            # or a relocated package must trigger a new install.
+            data["suite_editables"] = (
+                suite_workdir.get_editable_dependencies_fingerprint(
+                    self.get_package_name()
+                )
+            )
+
+        return data
+
     def _get_readme_content(self) -> ReadmeContentConfigValue | None:
         from wexample_wex_addon_dev_python.config_value.python_package_readme_config_value import (
             PythonPackageReadmeContentConfigValue,
@@ -290,99 +311,138 @@ class PythonPackageWorkdir(PythonWorkdir):
 
         return PythonPackagesSuiteWorkdir
 
-    def _install_dependencies_in_venv(
-        self, venv_path: Path, env: str | None = None, force: bool = False
-    ) -> None:
+    def _get_venv_template_requirements(
+        self, env: str | None, python_version: str | None
+    ) -> list[str]:
+        from packaging.requirements import Requirement
+        from packaging.utils import canonicalize_name
         from wexample_app.const.env import ENV_NAME_LOCAL
-        from wexample_wex_addon_app.helpers.python import (
-            python_install_dependencies_in_venv,
+
+        requirements = super()._get_venv_template_requirements(
+            env=env, python_version=python_version
         )
 
         suite_workdir = self.get_shallow_suite_workdir()
-        toml_file = self.get_app_config_file()
-
-        # Check for suite only in local env.
-        if env == ENV_NAME_LOCAL:
-            # Package is part of a suite that may have a venv configured.
-            if suite_workdir:
-                # Get all dependencies from pyproject.toml
-                pyproject_toml_dependencies = (
-                    toml_file.get_dependencies_versions().keys()
-                )
-
-                # Get all packages from the suite ordered by dependencies (leaf -> trunk)
-                suite_packages = suite_workdir.get_ordered_packages()
-                suite_package_names = {pkg.get_package_name() for pkg in suite_packages}
-
-                # Collect all suite packages that need to be installed (including transitive dependencies)
-                suite_dependencies_ordered = self._collect_suite_dependencies(
-                    pyproject_toml_dependencies, suite_workdir, suite_package_names
-                )
+        if env != ENV_NAME_LOCAL or not suite_workdir:
+            return requirements
+
+        # Suite packages are installed in editable mode on top of the clone:
+        # keeping them out of the template lets every package share it.
+        suite_package_names = set(suite_workdir.get_local_packages_names())
+        return [
+            requirement
+            for requirement in requirements
+            if canonicalize_name(Requirement(requirement).name)
+            not in suite_package_names
+        ]
 
-                # External dependencies are those not in the suite
-                external_dependencies = [
-                    dep
-                    for dep in pyproject_toml_dependencies
-                    if dep not in suite_package_names
-                ]
+    def _install_dependencies_in_venv(
+        self, venv_path: Path, env: str | None = None, force: bool = False
+    ) -> None:
+        import time
 
-                self.subtitle(
-                    f"Installing {len(external_dependencies)} external packages",
-                    indentation=1,
-                )
-                python_install_dependencies_in_venv(
-                    venv_path=venv_path, names=external_dependencies
-                )
+        from packaging.requirements import Requirement
+        from packaging.utils import canonicalize_name
+        from wexample_app.const.env import ENV_NAME_LOCAL
 
-                # Install suite packages in editable mode (leaf -> trunk order)
-                if suite_dependencies_ordered:
-                    self.subtitle(
-                        f"Installing {len(suite_dependencies_ordered)} suite packages in editable mode (leaf -> trunk)",
-                        indentation=1,
-                    )
-
-                    editable_paths = []
-
-                    for pkg in suite_dependencies_ordered:
-                        pkg_path = pkg.get_path()
-                        pkg_name = pkg.get_package_name()
-
-                        if force or not python_is_package_installed_editable_in_venv(
-                            venv_path=venv_path,
-                            package_name=pkg_name,
-                            package_path=pkg_path,
-                        ):
-                            editable_paths.append(str(pkg_path))
-
-                    python_install_dependencies_in_venv(
-                        venv_path=venv_path,
-                        names=editable_paths,
-                        editable=True,
-                    )
-
-                self.subtitle(
-                    "Installing dev group dependencies",
-                    indentation=1,
-                )
-                python_install_dependencies_in_venv(
-                    venv_path=venv_path,
-                    names=self.get_app_config_file().optional_group_array(group="dev"),
-                )
+        from wexample_wex_addon_dev_python.common.venv_install_plan import (
+            VenvInstallPlan,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_distribution_satisfies,
+            venv_get_missing_requirements,
+            venv_get_python_version,
+            venv_scan_distributions,
+        )
 
-            self.subtitle(
-                "Installing itself in editable mode",
-                indentation=1,
+        # Check for suite only in local env.
+        if env != ENV_NAME_LOCAL:
+            # Fallback to parent behaviour
+            super()._install_dependencies_in_venv(
+                venv_path=venv_path, env=env, force=force
             )
+            return
 
-            # Install itself as editable.
-            python_install_dependency_in_venv(
-                venv_path=venv_path, name=self.get_path(), editable=True
-            )
+        started_at = time.perf_counter()
+        suite_workdir = self.get_shallow_suite_workdir()
+        toml_file = self.get_app_config_file()
+        pyproject_toml_dependencies = toml_file.get_dependencies_versions()
+        suite_package_names = (
+            set(suite_workdir.get_local_packages_names()) if suite_workdir else set()
+        )
 
-            return
+        # One scan of site-packages answers every "already installed?"
+        # question below, instead of one venv round trip per package.
+        inventory = {} if force else venv_scan_distributions(venv_path)
+        plans = []
 
-        # Fallback to parent behaviour
-        super()._install_dependencies_in_venv(venv_path=venv_path, env=env, force=force)
+        lock_requirements = self._get_lock_requirements(
+            python_version=venv_get_python_version(venv_path)
+        )
+        if lock_requirements is not None:
+            # The lock is fully pinned: install it without resolution. Suite
+            # packages are pinned to their published version there, but are
+            # installed from their local path below.
+            locked_plan = VenvInstallPlan(venv_path=venv_path, no_deps=True)
+            for spec in lock_requirements:
+                if canonicalize_name(
+                    Requirement(spec).name
+                ) not in suite_package_names and not venv_distribution_satisfies(
+                    inventory, spec
+                ):
+                    locked_plan.add_requirement(spec)
+            plans.append(locked_plan)
+
+        # Everything else lands in a single plan: one resolver pass sees the
+        # editable suite packages together with the requirements that
+        # depend on them.
+        plan = VenvInstallPlan(venv_path=venv_path)
+
+        # External dependencies are those not in the suite nor in the lock.
+        # They are planned whether or not the package is in a suite: the
+        # editable self-install below is skipped once in place, so it cannot
+        # be relied on to bring a dependency added to pyproject.toml since.
+        locked_names = {
+            canonicalize_name(Requirement(spec).name)
+            for spec in lock_requirements or []
+        }
+        for spec in venv_get_missing_requirements(
+            inventory,
+            [
+                f"{name}{specifier}"
+                for name, specifier in pyproject_toml_dependencies.items()
+            ],
+            excluded_names=suite_package_names | locked_names,
+        ):
+            plan.add_requirement(spec)
+
+        # Package is part of a suite that may have a venv configured.
+        if suite_workdir:
+            # Collect all suite packages that need to be installed (including
+            # transitive dependencies), leaf -> trunk.
+            for pkg in self._collect_suite_dependencies(
+                list(pyproject_toml_dependencies.keys()),
+                suite_workdir,
+                suite_package_names,
+            ):
+                distribution = inventory.get(pkg.get_package_name())
+                if distribution is None or not distribution.is_editable_at(
+                    pkg.get_path()
+                ):
+                    plan.add_editable(pkg.get_path())
+
+            for spec in toml_file.get_dependencies_specs(optional=True, group="dev"):
+                if not venv_distribution_satisfies(inventory, spec):
+                    plan.add_requirement(spec)
+
+        # Install itself as editable.
+        distribution = inventory.get(self.get_package_name())
+        if distribution is None or not distribution.is_editable_at(self.get_path()):
+            plan.add_editable(self.get_path())
+
+        plans.append(plan)
+
+        self._run_install_plans(plans=plans, started_at=started_at)
 
     def _post_publish(self) -> None:
         from wexample_helpers_git.const.common import GIT_BRANCH_MAIN
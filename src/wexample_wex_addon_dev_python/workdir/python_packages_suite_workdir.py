@@ -1,26 +1,81 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 from wexample_wex_addon_app.workdir.framework_packages_suite_workdir import (
     FrameworkPackageSuiteWorkdir,
 )
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from wexample_wex_addon_app.workdir.code_base_workdir import (
         CodeBaseWorkdir,
     )
 
+    from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+        SuiteDependencyGraph,
+    )
+    from wexample_wex_addon_dev_python.common.suite_git_queries import (
+        SuiteGitQueries,
+    )
     from wexample_wex_addon_dev_python.workdir.python_package_workdir import (
         PythonPackageWorkdir,
     )
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
 
 
 @base_class
 class PythonPackagesSuiteWorkdir(FrameworkPackageSuiteWorkdir):
+    _dependency_graph_memo: SuiteDependencyGraph | None = private_field(
+        default=None,
+        description="Dependency graph of this process, rebuilt when a package pyproject.toml changes",
+    )
+    _dependency_graph_memo_key: tuple | None = private_field(
+        default=None,
+        description="Modification times of the pyproject.toml files behind the memoized graph",
+    )
+    _git_queries: SuiteGitQueries | None = private_field(
+        default=None,
+        description="Git lookups over the packages, memoized for the command",
+    )
+    _packages_lazy_cache: dict = private_field(
+        factory=dict,
+        description="Packages instantiated one by one, before the full list is loaded",
+    )
+    _packages_manifest_cache: dict | None = private_field(
+        default=None,
+        description="Discovered package paths and names, as stored in local data",
+    )
+
+    def build_dependencies_map(self) -> dict[str, list[str]]:
+        """Local dependencies of every package, kept in the packages manifest.
+
+        Packages are only instantiated to read their dependencies when the
+        manifest has none yet, or when a pyproject.toml changed since it was
+        built.
+        """
+        from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+            packages_manifest_get_pyproject_mtimes,
+        )
+
+        manifest = self._get_packages_manifest()
+        if manifest["pyprojects"] != packages_manifest_get_pyproject_mtimes(
+            self.get_path(), manifest["paths"]
+        ):
+            self._packages_manifest_cache = None
+            manifest = self._get_packages_manifest()
+
+        if manifest.get("dependencies") is None:
+            manifest["dependencies"] = super().build_dependencies_map()
+            self.set_local_data_value("packages", "manifest", manifest)
+
+        return {
+            name: list(dependencies)
+            for name, dependencies in manifest["dependencies"].items()
+        }
+
     def build_dependencies_stack(
         self,
         package: PythonPackageWorkdir,
@@ -29,12 +84,15 @@ class PythonPackagesSuiteWorkdir(FrameworkPackageSuiteWorkdir):
     ) -> list[PythonPackageWorkdir]:
         """Return the declared dependency chain from `package` to `dependency`.
 
-        Uses NetworkX (if available) to build a directed graph of local declared
-        dependencies and compute a shortest path from `package` to `dependency`.
-        Falls back to an internal deterministic DFS if NetworkX is not installed.
-        Returns a list of PythonPackageWorkdir objects [package, ..., dependency],
-        or an empty list if no path exists.
+        Answered by the memoized suite dependency graph (see
+        get_dependency_graph()), unless dependencies_map differs from the
+        suite one. Returns a list of PythonPackageWorkdir objects
+        [package, ..., dependency], or an empty list if no path exists.
         """
+        from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+            SuiteDependencyGraph,
+        )
+
         start = package.get_package_name()
         target = dependency.get_package_name()
 
@@ -42,40 +100,515 @@ class PythonPackagesSuiteWorkdir(FrameworkPackageSuiteWorkdir):
         if start == target:
             return [package]
 
-        import networkx as nx
-
-        # Build a deterministic DiGraph: add nodes/edges in sorted order
-        nodes = set(dependencies_map.keys()) | {
-            d for deps in dependencies_map.values() for d in deps
-        }
-        G = nx.DiGraph()
-        for n in sorted(nodes):
-            G.add_node(n)
-        for src in sorted(dependencies_map.keys()):
-            for dst in sorted(dependencies_map.get(src, [])):
-                if dst in nodes:
-                    G.add_edge(src, dst)
-
-        if not (G.has_node(start) and G.has_node(target)):
-            return []
-
-        try:
-            name_path = nx.shortest_path(G, source=start, target=target)
-        except nx.NetworkXNoPath:
-            return []
+        graph = self.get_dependency_graph()
+        if dependencies_map != graph.dependencies_map:
+            graph = SuiteDependencyGraph(dependencies_map=dependencies_map)
 
         # Convert path of names to concrete package objects
         stack: list[PythonPackageWorkdir] = []
-        for name in name_path:
+        for name in graph.get_path(start, target):
             pkg = self.get_package(name)
             if pkg is not None:
                 stack.append(pkg)
 
         return stack if stack and stack[-1].get_package_name() == target else []
 
+    def build_ordered_dependencies(self) -> list[str]:
+        """Return package names ordered leaves -> trunk."""
+        return self.get_dependency_graph().get_order()
+
+    def compile_requirements(
+        self, max_workers: int | None = None, retry_delay: float = 15.0
+    ) -> None:
+        """Compile the requirements.txt of every package, concurrently, in dependency waves.
+
+        A wave holds the packages whose local dependencies were all compiled
+        by earlier waves. Every compile of the run shares one uv cache, so
+        transitive dependencies common to the suite are resolved once. An
+        unsatisfiable resolution (usually PyPI index propagation right after
+        a publish) is retried once per wave, after retry_delay seconds and
+        with refreshed index data, instead of once per package; the other
+        failures of the wave are reported with the retried ones.
+        """
+        import tempfile
+        import time
+
+        from wexample_wex_addon_dev_python.helpers.requirements import (
+            requirements_compile_wave,
+        )
+        from wexample_wex_addon_dev_python.workdir.python_workdir import (
+            PythonWorkdir,
+        )
+
+        def _wait_for_retry(retryable: list[PythonWorkdir]) -> None:
+            self.log(
+                f"{len(retryable)} compile(s) report unsatisfiable "
+                f"(likely PyPI index propagation); retrying them "
+                f"in {retry_delay}s…"
+            )
+            time.sleep(retry_delay)
+
+        waves: list[list[PythonWorkdir]] = []
+        for names in self.get_dependency_graph().get_levels():
+            wave = [
+                package
+                for package in (self.get_package(name) for name in names)
+                if isinstance(package, PythonWorkdir)
+                and (package.get_path() / "requirements.txt").exists()
+            ]
+            if wave:
+                waves.append(wave)
+
+        if not waves:
+            self.log("No package lock to compile")
+            return
+
+        with tempfile.TemporaryDirectory(prefix="wex-uv-cache-") as cache_dir:
+            for index, wave in enumerate(waves, start=1):
+                self.subtitle(
+                    f"Compiling wave {index}/{len(waves)}: "
+                    + ", ".join(package.get_package_name() for package in wave)
+                )
+                failures = requirements_compile_wave(
+                    items=wave,
+                    compile_items=lambda packages, refresh: (
+                        self._compile_requirements_wave(
+                            packages=packages,
+                            cache_dir=Path(cache_dir),
+                            max_workers=max_workers,
+                            refresh=refresh,
+                        )
+                    ),
+                    on_retry=_wait_for_retry,
+                )
+
+                if failures:
+                    raise RuntimeError(
+                        "\n".join(str(error) for error in failures.values())
+                    )
+
+        self.success(f"Compiled {sum(len(wave) for wave in waves)} package locks")
+
+    def compute_packages_to_publish(self) -> list[PythonPackageWorkdir]:
+        """Packages changed since their last publication tag, or never published.
+
+        Tags and changes of every package are looked up concurrently.
+        """
+        packages = self.get_packages()
+        last_tags = self._get_last_publication_tags(packages)
+        has_changes = self._raise_git_failure(
+            self.get_git_queries().has_changes_since(
+                {path: tag for path, tag in last_tags.items() if tag is not None}
+            )
+        )
+
+        return [
+            package for package in packages if has_changes.get(package.get_path(), True)
+        ]
+
+    def get_affected_packages(self, base_ref: str) -> dict[str, str]:
+        """Packages to re-test or re-release after the changes since base_ref.
+
+        A package is affected when it changed since base_ref, or when one of
+        its local dependencies, direct or not, did. Returns the reason of
+        each affected package, leaves first.
+        """
+        graph = self.get_dependency_graph()
+        packages = self.get_ordered_packages()
+        has_changes = self.get_git_queries().has_changes_since(
+            {package.get_path(): base_ref for package in packages}
+        )
+
+        changed = []
+        for package in packages:
+            package_has_changes = has_changes[package.get_path()]
+            if isinstance(package_has_changes, Exception):
+                self.warning(
+                    f"{package.get_package_name()}: cannot compare with {base_ref} "
+                    f"({package_has_changes}), considered changed"
+                )
+                package_has_changes = True
+            if package_has_changes:
+                changed.append(package.get_package_name())
+
+        reasons = {name: "changed" for name in changed}
+        for name in changed:
+            for dependent in graph.get_dependents(name):
+                if dependent not in reasons:
+                    reasons[dependent] = f"depends on {name}"
+
+        return {name: reasons[name] for name in graph.get_order() if name in reasons}
+
+    def get_dependency_graph(self) -> SuiteDependencyGraph:
+        """The suite dependency graph, memoized for the process while no pyproject.toml changes.
+
+        Only the graph lives in memory: the dependencies it is built from
+        are persisted in the packages manifest (see build_dependencies_map()),
+        so a new process builds it without instantiating any package.
+        """
+        from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+            SuiteDependencyGraph,
+        )
+
+        key = tuple(
+            sorted(
+                (str(path), path.stat().st_mtime_ns if path.exists() else None)
+                for path in (
+                    package_path / "pyproject.toml"
+                    for package_path in self.get_packages_paths()
+                )
+            )
+        )
+        if (
+            self._dependency_graph_memo is None
+            or key != self._dependency_graph_memo_key
+        ):
+            self._dependency_graph_memo = SuiteDependencyGraph(
+                dependencies_map=self.build_dependencies_map()
+            )
+            self._dependency_graph_memo_key = key
+
+        return self._dependency_graph_memo
+
+    def get_editable_dependencies_fingerprint(
+        self, package_name: str
+    ) -> dict[str, list]:
+        """Path and pyproject.toml modification time of every suite package package_name depends on.
+
+        Read from the packages manifest, no package is instantiated. A
+        bumped version changes the pyproject.toml, so its time.
+        """
+        closure = self.get_dependency_graph().get_closure(package_name)
+        names = self._get_packages_names()
+        pyprojects = self._get_packages_manifest()["pyprojects"]
+
+        return {
+            name: [str(self.get_path() / names[name]), pyprojects.get(names[name])]
+            for name in sorted(closure)
+            if name in names
+        }
+
+    def get_git_queries(self) -> SuiteGitQueries:
+        """Concurrent git lookups over the packages, answered once per command."""
+        from wexample_wex_addon_dev_python.common.suite_git_queries import (
+            SuiteGitQueries,
+        )
+
+        if self._git_queries is None:
+            self._git_queries = SuiteGitQueries()
+
+        return self._git_queries
+
+    def get_local_packages_names(self) -> list[str]:
+        names = self._get_packages_manifest()["names"]
+        if names is None:
+            return super().get_local_packages_names()
+
+        return list(names)
+
+    def get_package(
+        self, package_name: str, reload: bool = False
+    ) -> PythonPackageWorkdir | None:
+        """Package of the suite named package_name, instantiating only this one.
+
+        Once the names of the discovered packages are known (see
+        get_packages()), a package is created alone from its path, unless the
+        full package list is already loaded.
+        """
+        if reload or self._packages_cache is not None:
+            return super().get_package(package_name, reload=reload)
+
+        if package_name not in self._packages_lazy_cache:
+            names = self._get_packages_manifest()["names"]
+            if names is None:
+                return super().get_package(package_name)
+
+            relative_path = names.get(package_name)
+            self._packages_lazy_cache[package_name] = (
+                self._create_package_workdir(self.get_path() / relative_path)
+                if relative_path is not None
+                else None
+            )
+
+        return self._packages_lazy_cache[package_name]
+
+    def get_packages(self, reload: bool = False) -> list[PythonPackageWorkdir]:
+        loaded = self._packages_cache is not None
+        packages = super().get_packages(reload=reload)
+
+        if reload or not loaded:
+            self._packages_lazy_cache = {}
+            manifest = self._get_packages_manifest()
+            manifest["names"] = {
+                package.get_package_name(): str(
+                    package.get_path().relative_to(self.get_path())
+                )
+                for package in packages
+            }
+            self.set_local_data_value("packages", "manifest", manifest)
+
+        return packages
+
+    def get_packages_paths(self) -> list[Path]:
+        """Package directories of the suite, discovered once while their locations do not change."""
+        return [
+            self.get_path() / relative_path
+            for relative_path in self._get_packages_manifest()["paths"]
+        ]
+
+    def packages_execute_in_waves(
+        self,
+        command: str,
+        arguments: list[str] | None = None,
+        max_workers: int | None = None,
+        fail_fast: bool = True,
+    ) -> dict[str, str]:
+        """Run a manager command (e.g. python::test/run) on every package, level by level.
+
+        Packages of one dependency level run concurrently, each in its own
+        app manager process, at most max_workers at once (one per core by
+        default); a level starts once the previous one is done. With
+        fail_fast, the first failure stops starting new packages; otherwise
+        only the dependents of a failed package are skipped. Output goes to
+        one log per package, a timeline of the run is printed at the end.
+        Returns the status of each package.
+        """
+        import subprocess
+        import time
+
+        from wexample_app.const.globals import APP_PATH_BIN_APP_MANAGER
+
+        from wexample_wex_addon_dev_python.common.suite_waves_run import (
+            SuiteWavesRun,
+        )
+
+        graph = self.get_dependency_graph()
+        logs_path = self.get_local_dir_path() / "waves"
+        logs_path.mkdir(parents=True, exist_ok=True)
+
+        levels = graph.get_levels()
+        # Resolved before any thread starts: the lazy package cache is not
+        # thread safe.
+        packages_paths = {}
+        for name in (name for level in levels for name in level):
+            package = self.get_package(name)
+            if package is not None:
+                packages_paths[name] = package.get_path()
+
+        def _task(name: str) -> bool:
+            if name not in packages_paths:
+                raise RuntimeError(f"Package {name} not found in the suite")
+
+            with (logs_path / f"{name}.log").open("w") as log:
+                return (
+                    subprocess.run(
+                        [str(APP_PATH_BIN_APP_MANAGER), "--subprocess", command]
+                        + (arguments or []),
+                        cwd=packages_paths[name],
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                    ).returncode
+                    == 0
+                )
+
+        waves_run = SuiteWavesRun(
+            fail_fast=fail_fast,
+            get_closure=graph.get_closure,
+            levels=levels,
+            max_workers=max_workers,
+        )
+        started_at = time.perf_counter()
+        statuses = waves_run.run(
+            task=_task,
+            on_level=lambda index, names: self.subtitle(
+                f"Level {index}/{len(levels)}: {command} on {len(names)} package(s)"
+            ),
+            on_done=lambda name, status: self.log(f"  {name}: {status}"),
+        )
+
+        self._print_waves_timeline(
+            levels=levels,
+            statuses=statuses,
+            timings=waves_run.get_timings(),
+            duration=time.perf_counter() - started_at,
+        )
+        for name, error in waves_run.get_errors().items():
+            self.warning(f"{name}: {error}")
+
+        failed = [name for name, status in statuses.items() if status == "failed"]
+        if failed:
+            raise RuntimeError(
+                f"{command} failed on {', '.join(failed)}, logs in {logs_path}"
+            )
+
+        return statuses
+
+    def packages_update_dependencies(self, dependencies_map: dict[str, str]) -> None:
+        """Update the dependencies of every package, then compile all the locks at once."""
+        from wexample_wex_addon_dev_python.workdir.python_workdir import (
+            PythonWorkdir,
+        )
+
+        for package in self.get_ordered_packages():
+            if isinstance(package, PythonWorkdir):
+                package.update_dependencies(dependencies_map, compile_lock=False)
+
+        self.compile_requirements()
+
+    def release_plan(self, max_workers: int | None = None) -> dict[str, str | None]:
+        """Compute and print the version bump of every package, before any release.
+
+        The git state of every package is looked up concurrently first, then
+        packages are classified in worker processes (public API diff), and
+        bumps are propagated to the dependents of packages releasing a new
+        minor or major. Returns the planned bump of each package, None when
+        it is not released.
+        """
+        import time
+        from concurrent.futures import ProcessPoolExecutor
+
+        from wexample_wex_addon_dev_python.helpers.release import (
+            release_classify_bump,
+            release_propagate_bumps,
+        )
+        from wexample_wex_addon_dev_python.workdir.python_package_workdir import (
+            PythonPackageWorkdir,
+        )
+
+        packages = [
+            package
+            for package in self.get_ordered_packages()
+            if isinstance(package, PythonPackageWorkdir)
+        ]
+        if not packages:
+            self.log("No package to plan")
+            return {}
+
+        started_at = time.perf_counter()
+        paths = [package.get_path() for package in packages]
+        git_queries = self.get_git_queries()
+        last_tags = self._get_last_publication_tags(packages)
+        tags = {path: tag for path, tag in last_tags.items() if tag is not None}
+        has_changes = self._raise_git_failure(git_queries.has_changes_since(tags))
+        has_source_changes = self._raise_git_failure(
+            git_queries.has_changes_since(
+                {path: tag for path, tag in tags.items() if has_changes[path]},
+                pathspec="src",
+            )
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(
+                zip(
+                    [package.get_package_name() for package in packages],
+                    executor.map(
+                        release_classify_bump,
+                        paths,
+                        [package.get_package_name() for package in packages],
+                        [
+                            package.get_local_dir_path() / "api_snapshots"
+                            for package in packages
+                        ],
+                        [last_tags[path] for path in paths],
+                        [has_changes.get(path, True) for path in paths],
+                        [has_source_changes.get(path, False) for path in paths],
+                    ),
+                )
+            )
+        duration = time.perf_counter() - started_at
+
+        for name, result in results.items():
+            if result["error"]:
+                self.warning(
+                    f"{name}: public API comparison with {result['last_tag']} "
+                    f"failed ({result['error']}), classified as major"
+                )
+
+        plan = release_propagate_bumps(
+            bumps={name: result["bump"] for name, result in results.items()},
+            dependencies_map=self.get_dependency_graph().dependencies_map,
+        )
+
+        self.io.table(
+            data=[
+                [
+                    name,
+                    result["last_tag"] or "-",
+                    result["bump"] or "-",
+                    plan[name] or "-",
+                    "-" if result["breaking"] is None else result["breaking"],
+                    f"{result['duration']:.2f}s",
+                ]
+                for name, result in results.items()
+            ],
+            headers=[
+                "Package",
+                "Last tag",
+                "Changes",
+                "Planned",
+                "Breaking",
+                "Duration",
+            ],
+            title="Release plan",
+        )
+        self.log(
+            f"{sum(1 for bump in plan.values() if bump)} of {len(plan)} packages "
+            f"to release, planned in {duration:.1f}s "
+            f"({sum(result['duration'] for result in results.values()):.1f}s of "
+            "classification)"
+        )
+
+        return plan
+
     def _child_is_package_directory(self, entry: Path) -> bool:
         return entry.is_dir() and (entry / "pyproject.toml").is_file()
 
+    def _compile_requirements_wave(
+        self,
+        packages: list[PythonWorkdir],
+        cache_dir: Path,
+        max_workers: int | None,
+        refresh: bool,
+    ) -> dict[PythonWorkdir, Exception]:
+        """Compile the locks of independent packages at once, returning the failures."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _compile(package: PythonWorkdir) -> Exception | None:
+            started_at = time.perf_counter()
+            try:
+                package.compile_requirements(
+                    cache_dir=cache_dir, refresh=refresh, retry=False
+                )
+            except Exception as error:
+                return error
+
+            self.log(
+                f"  {package.get_package_name()} "
+                f"({time.perf_counter() - started_at:.1f}s)"
+            )
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(packages)) as executor:
+            errors = list(executor.map(_compile, packages))
+
+        return {
+            package: error
+            for package, error in zip(packages, errors)
+            if error is not None
+        }
+
+    def _create_package_workdir(
+        self, package_path: Path
+    ) -> PythonPackageWorkdir | None:
+        if not self._child_is_package_directory(package_path):
+            return None
+
+        return self._get_children_package_workdir_class().create_from_path(
+            path=package_path,
+            io=self.io,
+        )
+
     def _get_children_package_directory_name(self) -> str:
         return "pip"
 
@@ -85,3 +618,148 @@ class PythonPackagesSuiteWorkdir(FrameworkPackageSuiteWorkdir):
         )
 
         return PythonPackageWorkdir
+
+    def _get_last_publication_tags(
+        self, packages: list[PythonPackageWorkdir]
+    ) -> dict[Path, str | None]:
+        return self._raise_git_failure(
+            self.get_git_queries().get_last_tags(
+                {
+                    package.get_path(): package.get_publication_tag_prefix()
+                    for package in packages
+                }
+            )
+        )
+
+    def _get_packages_manifest(self) -> dict:
+        """Discovered packages, stored in local data with what they depend on.
+
+        Listing the suite stats every entry of its locations, which is slow on
+        large or network filesystems: it is only done again when a directory
+        listed by the configured locations changes, which adding, removing or
+        renaming a package directory does, or when the pyproject.toml of a
+        package changes (its name may have). Package names are filled in by
+        get_packages(), their dependencies by build_dependencies_map().
+        """
+        from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+            packages_manifest_build,
+            packages_manifest_get_key,
+            packages_manifest_is_fresh,
+        )
+
+        if self._packages_manifest_cache is not None:
+            return self._packages_manifest_cache
+
+        locations = [
+            location.get_str()
+            for location in self.get_config()
+            .search("package_suite.location")
+            .get_list()
+        ]
+        key = packages_manifest_get_key(self.get_path(), locations)
+
+        manifest = self.get_local_data_value("packages", "manifest")
+        if not packages_manifest_is_fresh(manifest, self.get_path(), key):
+            manifest = packages_manifest_build(
+                self.get_path(),
+                locations,
+                is_package_directory=self._child_is_package_directory,
+            )
+            self.set_local_data_value("packages", "manifest", manifest)
+
+        self._packages_manifest_cache = manifest
+        return manifest
+
+    def _get_packages_names(self) -> dict[str, str]:
+        """Relative path of every package by name, loading the packages if the manifest has no names."""
+        names = self._get_packages_manifest()["names"]
+        if names is None:
+            self.get_packages(reload=self._packages_cache is not None)
+            names = self._get_packages_manifest()["names"]
+
+        return names
+
+    def _pre_install_python_packages_editable(self, force: bool = False) -> None:
+        from wexample_wex_addon_app.helpers.python import (
+            python_install_dependency_in_venv,
+        )
+
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_scan_distributions,
+        )
+
+        venv_path_config = self.search_app_or_suite_runtime_config("python.venv_path")
+        if venv_path_config.is_none():
+            return
+
+        venv_path = Path(venv_path_config.get_str())
+        python_packages = [
+            p
+            for p in self.get_ordered_packages()
+            if (p.get_path() / "pyproject.toml").exists()
+        ]
+
+        if not python_packages:
+            return
+
+        # Single site-packages scan instead of one `pip show` per package.
+        inventory = {} if force else venv_scan_distributions(venv_path)
+
+        self.subtitle(
+            f"Pre-installing {len(python_packages)} Python packages in editable mode"
+        )
+        for pkg in python_packages:
+            pkg_path = pkg.get_path()
+            pkg_name = pkg.get_package_name()
+            distribution = inventory.get(pkg_name)
+            if distribution is None or not distribution.is_editable_at(pkg_path):
+                self.log(f"  -e {pkg_name}")
+                python_install_dependency_in_venv(
+                    venv_path=venv_path, name=pkg_path, editable=True
+                )
+            else:
+                self.log(f"  [skip] {pkg_name} (already editable)")
+
+    def _print_waves_timeline(
+        self,
+        levels: list[list[str]],
+        statuses: dict[str, str],
+        timings: dict[str, tuple[float, float]],
+        duration: float,
+        width: int = 40,
+    ) -> None:
+        # One row per package, its run drawn on a shared time scale.
+        scale = width / duration if duration else 0
+
+        rows = []
+        for index, names in enumerate(levels, start=1):
+            for name in names:
+                start, end = timings.get(name, (None, None))
+                if start is None:
+                    rows.append([name, index, statuses.get(name, "-"), "-", ""])
+                    continue
+
+                offset = int(start * scale)
+                length = max(1, int(end * scale) - offset)
+                rows.append(
+                    [
+                        name,
+                        index,
+                        statuses[name],
+                        f"{end - start:.1f}s",
+                        " " * offset + "█" * length,
+                    ]
+                )
+
+        self.io.table(
+            data=rows,
+            headers=["Package", "Level", "Status", "Duration", "Timeline"],
+            title=f"Suite run in {duration:.1f}s",
+        )
+
+    def _raise_git_failure(self, answers: dict[Path, Any]) -> dict[Path, Any]:
+        for path, answer in answers.items():
+            if isinstance(answer, Exception):
+                raise RuntimeError(f"Git query failed in {path}: {answer}") from answer
+
+        return answers
@@ -7,7 +7,6 @@ from wexample_app.item.file.iml_file import ImlFile
 from wexample_event.dataclass.event import Event
 from wexample_event.dataclass.listener_record import EventCallback
 from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
-from wexample_filestate.item.file.json_file import JsonFile
 from wexample_filestate.operation.abstract_operation import AbstractOperation
 from wexample_filestate.operation.file_rename_operation import FileRenameOperation
 from wexample_filestate_python.const.path import PATH_DIR_SRC, PATH_DIR_TESTS
@@ -24,9 +23,17 @@ from wexample_wex_addon_app.workdir.code_base_workdir import (
 )
 
 from wexample_wex_addon_dev_python.const.python import (
+    PYTHON_LOCK_VERSION,
     PYTHON_PYTEST_COV_FORMAT_HTML,
     PYTHON_PYTEST_COV_FORMAT_JSON,
     PYTHON_PYTEST_COV_REPORT_DIR,
+    PYTHON_PYTEST_COV_SHARD_JSON_GLOB,
+    PYTHON_PYTEST_PARALLEL_AUTO,
+    PYTHON_TEST_COVERAGE_NONE,
+    PYTHON_TEST_COVERAGE_SYSMON,
+    PYTHON_TEST_COVERAGE_TRACE,
+    PYTHON_TEST_DURATIONS_FILE_NAME,
+    PYTHON_TEST_METRICS_SORT_DURATION,
 )
 from wexample_wex_addon_dev_python.file.python_app_iml_file import PythonAppImlFile
 from wexample_wex_addon_dev_python.workdir.mixin.with_profiling_python_workdir_mixin import (
@@ -46,6 +53,16 @@ if TYPE_CHECKING:
     )
     from wexample_helpers.const.types import StructuredData
 
+    from wexample_wex_addon_dev_python.common.coverage_store import CoverageStore
+    from wexample_wex_addon_dev_python.common.venv_install_plan import (
+        VenvInstallPlan,
+    )
+    from wexample_wex_addon_dev_python.common.warm_test_server_client import (
+        WarmTestServerClient,
+    )
+    from wexample_wex_addon_dev_python.dataclass.venv_distribution import (
+        VenvDistribution,
+    )
     from wexample_wex_addon_dev_python.file.python_pyproject_toml_file import (
         PythonPyprojectTomlFile,
     )
@@ -56,32 +73,106 @@ class PythonWorkdir(
     WithAiWorkdirMixin, WithProfilingPythonWorkdirMixin, CodeBaseWorkdir
 ):
     def app_install(self, env: str | None = None, force: bool = False) -> Path:
-        from wexample_wex_addon_app.helpers.python import (
-            python_ensure_pip_or_fail,
-            python_install_environment,
-        )
+        venv_path = self.get_venv_path()
 
         # Check if a venv path is somewhere in the config hierarchy.
         venv_path_config = self.search_app_or_suite_runtime_config("python.venv_path")
 
-        # There is no venv, so create a venv for this project.
-        if venv_path_config.is_none():
-            venv_path = python_install_environment(path=self.get_path())
-        else:
-            venv_path = Path(venv_path_config.get_str())
-
-        self.log(f"Using venv: @path{{{venv_path}}}")
-        python_ensure_pip_or_fail(venv_path)
-
-        self._install_dependencies_in_venv(
+        self._install_venv(
             venv_path=venv_path,
             env=env,
             force=force,
+            # There is no venv, so create a venv for this project.
+            create_venv=venv_path_config.is_none(),
         )
 
         # Use standard PDM install
         return venv_path
 
+    def compile_requirements(
+        self,
+        cache_dir: Path | None = None,
+        refresh: bool = True,
+        retry: bool = True,
+    ) -> bool:
+        """Compile requirements.txt from pyproject.toml with uv, when the package has one.
+
+        A shared cache_dir lets several compiles reuse each other's
+        resolutions; refresh revalidates cached index data. Without retry,
+        an unsatisfiable resolution raises at once and the caller owns the
+        retry policy. Returns False when there is no lock to compile.
+        """
+        import subprocess
+
+        from wexample_helpers.helpers.retryable_callback_manager import (
+            RetryableCallbackManager,
+        )
+
+        requirements_path = self.get_path() / "requirements.txt"
+        if not requirements_path.exists():
+            return False
+
+        wheelhouse_path = self._get_wheelhouse_path()
+        wheelhouse_path.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            "uv",
+            "pip",
+            "compile",
+            str(self.get_path() / "pyproject.toml"),
+            "--output-file",
+            str(requirements_path),
+            "--python-version",
+            PYTHON_LOCK_VERSION,
+            # Wheels collected by suite installs answer first; the index is
+            # still searched.
+            "--find-links",
+            str(wheelhouse_path),
+            # Force re-resolution from scratch so transitive deps pick up
+            # patches published since the last compile. Without this, uv
+            # preserves existing pins in requirements.txt as long as they
+            # satisfy constraints — causing stale transitives even after
+            # their direct dependents bumped.
+            "--upgrade",
+        ]
+        if cache_dir:
+            cmd.extend(["--cache-dir", str(cache_dir)])
+        if refresh:
+            # Revalidates cached index metadata so freshly-published
+            # versions are seen (without discarding the downloaded wheels,
+            # as --no-cache did).
+            cmd.append("--refresh")
+
+        def _run_uv_compile() -> None:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"uv pip compile failed for {self.get_path()}:\n{result.stderr}"
+                )
+
+        if not retry:
+            _run_uv_compile()
+            return True
+
+        # Right after a publish, PyPI's index can still serve a stale view of the
+        # registry, making uv conclude that the freshly-published version is
+        # "unsatisfiable". Retry a few times with backoff to absorb this race.
+        # Real dependency conflicts will still fail after retries.
+        RetryableCallbackManager(
+            callback=_run_uv_compile,
+            max_attempts=4,
+            backoff_base_seconds=4,
+            should_retry_callback=lambda exc, msg, attempt, max_a: (
+                self.is_unsatisfiable_compile_error(msg)
+            ),
+            on_retry_callback=lambda attempt, max_a, delay, exc, msg: self.log(
+                f"uv pip compile reports unsatisfiable on attempt {attempt}/{max_a} "
+                f"(likely PyPI index propagation); retrying in {delay}s…"
+            ),
+        ).run()
+
+        return True
+
     def count_tests(self) -> int:
         import re
 
@@ -138,6 +229,20 @@ class PythonWorkdir(
 
         return string_to_kebab_case(self.get_package_import_name())
 
+    def get_publication_tag_prefix(self) -> str:
+        """Glob matching every publication tag of the package, e.g. "name/v*".
+
+        Derived from get_publication_tag_name(), so that a package changing
+        its tag convention is still looked up by its own tags.
+        """
+        from wexample_wex_addon_dev_python.helpers.release import (
+            release_get_tag_prefix,
+        )
+
+        return release_get_tag_prefix(
+            self.get_publication_tag_name(), self.get_setup_version()
+        )
+
     def get_python_exec_module_command(self, module_name: str) -> list[str]:
         return [str(self.get_python_path()), "-m", module_name]
 
@@ -164,6 +269,13 @@ class PythonWorkdir(
             return False
         return any(tests_path.rglob("test_*.py"))
 
+    def is_unsatisfiable_compile_error(self, message: str) -> bool:
+        from wexample_wex_addon_dev_python.helpers.requirements import (
+            requirements_is_unsatisfiable_error,
+        )
+
+        return requirements_is_unsatisfiable_error(message)
+
     def operation_add_event_listener(
         self,
         operation: AbstractOperation | type[AbstractOperation],
@@ -203,6 +315,7 @@ class PythonWorkdir(
                 ".pdm-python",
                 ".python-version",
                 f"/{PYTHON_FILE_PYTEST_COVERAGE_JSON}",
+                f"/{PYTHON_PYTEST_COV_SHARD_JSON_GLOB}",
             ]
         )
 
@@ -285,26 +398,403 @@ class PythonWorkdir(
         config_file = self.get_app_config_file()
         config_file.write(config)
 
+    def test_coverage_diff(self, base_ref: str = "HEAD") -> None:
+        """Print the changed lines since base_ref that no test covers.
+
+        Lines come from the coverage stored for the current commit, so a
+        change made after the last test run is reported as it was measured.
+        """
+        from wexample_helpers.helpers.shell import shell_run
+
+        from wexample_wex_addon_dev_python.helpers.coverage import (
+            coverage_format_line_ranges,
+        )
+        from wexample_wex_addon_dev_python.helpers.impact import impact_parse_diff
+
+        commit_hash = self._get_git_commit_hash("HEAD")
+        store = self._get_test_coverage_store()
+        if not store.has_report(commit_hash):
+            self.warning(
+                f"No coverage stored for commit {commit_hash[:12]}, "
+                "run python::test/run first"
+            )
+            return
+
+        diff = shell_run(
+            cmd=[
+                "git",
+                "diff",
+                "-U0",
+                "--relative",
+                "--no-color",
+                "--no-ext-diff",
+                base_ref,
+            ],
+            cwd=self.get_path(),
+            inherit_stdio=False,
+        ).stdout
+        added = {
+            path: {line for start, end in ranges for line in range(start, end + 1)}
+            for path, ranges in impact_parse_diff(diff, new_side=True).items()
+        }
+
+        rows = []
+        for path, missing in store.get_missing_lines(commit_hash, list(added)).items():
+            uncovered = sorted(added[path].intersection(missing))
+            if uncovered:
+                rows.append(
+                    [path, len(uncovered), coverage_format_line_ranges(uncovered)]
+                )
+
+        if not rows:
+            self.success(f"Every changed statement since {base_ref} is covered")
+            return
+
+        self.io.table(
+            data=rows,
+            headers=["File", "Uncovered", "Lines"],
+            title=f"Uncovered changes since {base_ref}",
+        )
+
+    def test_coverage_lost(self, since: str) -> None:
+        """Print the files whose coverage went down since the given commit."""
+        commit_hash = self._get_git_commit_hash("HEAD")
+        since_commit = self._get_git_commit_hash(since)
+        store = self._get_test_coverage_store()
+
+        for checked in (since_commit, commit_hash):
+            if not store.has_report(checked):
+                self.warning(f"No coverage stored for commit {checked[:12]}")
+                return
+
+        lost = store.get_lost_coverage(
+            since_commit=since_commit, commit_hash=commit_hash
+        )
+        if not lost:
+            self.success(f"No file lost coverage since {since}")
+            return
+
+        self.io.table(
+            data=[
+                [
+                    row["path"],
+                    f"{row['percent_before']:.2f}%",
+                    f"{row['percent_after']:.2f}%",
+                    f"{row['percent_after'] - row['percent_before']:+.2f}",
+                    row["missing_after"] - row["missing_before"],
+                ]
+                for row in lost
+            ],
+            headers=["File", "Before", "After", "Delta", "New missing"],
+            title=f"Coverage lost since {since}",
+        )
+
     def test_get_command(
-        self, format: str = PYTHON_PYTEST_COV_FORMAT_JSON
+        self,
+        format: str = PYTHON_PYTEST_COV_FORMAT_JSON,
+        parallel: int | str | None = None,
+        node_ids: list[str] | None = None,
+        json_report_path: Path | None = None,
+        coverage_contexts: bool = False,
+        coverage: str = PYTHON_TEST_COVERAGE_TRACE,
+        keyword: str | None = None,
+        metrics: bool = False,
     ) -> list[str]:
         cmd = self.get_python_exec_module_command("pytest")
-        # The json report is always produced: it feeds test.coverage.last_report.
-        # The requested format is added as an extra view when it differs.
-        cmd.extend(
-            [
-                "--cov",
-                f"--cov-report={PYTHON_PYTEST_COV_FORMAT_JSON}",
-            ]
-        )
-        if format != PYTHON_PYTEST_COV_FORMAT_JSON:
-            cmd.append(f"--cov-report={format}")
+        if metrics:
+            # Per-test durations and memory, see resources/pytest/; the
+            # command must then run with the environment of _get_test_env(),
+            # which makes the plugin importable.
+            cmd.extend(["-p", "wex_test_metrics"])
+
+        # The coverage engine itself is chosen through the environment,
+        # see _get_test_env().
+        if coverage != PYTHON_TEST_COVERAGE_NONE:
+            json_report = PYTHON_PYTEST_COV_FORMAT_JSON
+            if json_report_path:
+                json_report = f"{json_report}:{json_report_path}"
+
+            # The json report is always produced: it feeds
+            # test.coverage.last_report. The requested format is added as an
+            # extra view when it differs.
+            cmd.extend(["--cov", f"--cov-report={json_report}"])
+            if format != PYTHON_PYTEST_COV_FORMAT_JSON:
+                cmd.append(f"--cov-report={format}")
+            if coverage_contexts:
+                # Records which test ran each line, see _save_test_impact_map().
+                cmd.append("--cov-context=test")
+
+        parallel = self._parse_test_parallel(parallel)
+        if parallel:
+            # pytest-cov collects the data of every xdist worker and combines
+            # it before writing the reports, so they cover the whole run.
+            cmd.extend(["-n", parallel])
+
+        if keyword:
+            cmd.extend(["-k", keyword])
+        if node_ids:
+            cmd.extend(node_ids)
 
         return cmd
 
-    def test_run(self, format: str | None = None) -> None:
+    def test_merge_coverage(
+        self, directory: Path | None = None, count: int | None = None
+    ) -> None:
+        """Store the coverage of a sharded run, from the json report of each shard.
+
+        Only the reports of a run split in count shards are merged; count
+        can be left out when every report present comes from the same split.
+        """
+        from wexample_wex_addon_dev_python.helpers.shard import (
+            shard_parse_report_name,
+        )
+
+        directory = directory or self.get_path()
+        reports: dict[int, dict[int, Path]] = {}
+        for path in directory.glob(PYTHON_PYTEST_COV_SHARD_JSON_GLOB):
+            parsed = shard_parse_report_name(path.name)
+            if parsed:
+                reports.setdefault(parsed[1], {})[parsed[0]] = path
+
+        if count is None and len(reports) > 1:
+            self.warning(
+                "Shard coverage reports of several splits found "
+                f"({', '.join(str(found) for found in sorted(reports))} shards), "
+                "give the shard count to merge"
+            )
+            return
+
+        if count is None and reports:
+            count = next(iter(reports))
+
+        report_paths = [path for _, path in sorted(reports.get(count, {}).items())]
+        if not report_paths:
+            self.warning(f"No shard coverage report found in @path{{{directory}}}")
+            return
+
+        missing = sorted(set(range(1, count + 1)) - set(reports[count]))
+        if missing:
+            self.warning(
+                f"Missing coverage of shard(s) {', '.join(map(str, missing))} "
+                f"of {count}, merging the others"
+            )
+
+        totals = self._store_coverage_reports(report_paths)
+
+        self.io.properties(
+            properties={
+                "shards": len(report_paths),
+                "covered": totals["covered_lines"],
+                "total": totals["num_statements"],
+                "percent": f"{totals['percent_covered']:.2f}%",
+            },
+            title="Merged coverage",
+        )
+
+    def test_report_slowest(
+        self, limit: int = 10, sort: str = PYTHON_TEST_METRICS_SORT_DURATION
+    ) -> None:
+        """Print the slowest (or most memory hungry) tests and their trend."""
+        from wexample_wex_addon_dev_python.helpers.metrics import metrics_rank_slowest
+
+        history = self.get_local_data_value("test_metrics", "history", default=[])
+        rows = metrics_rank_slowest(history=history, limit=limit, sort=sort)
+        if not rows:
+            self.warning("No test metrics recorded yet, run the tests first.")
+            return
+
+        def _format_memory(value: int | None) -> str:
+            return "-" if value is None else f"{value / 1024 / 1024:.1f} MB"
+
+        self.io.table(
+            data=[
+                [
+                    row["node_id"],
+                    f"{row['duration']:.3f}s",
+                    f"{row.get('setup', 0):.3f}s",
+                    f"{row.get('call', 0):.3f}s",
+                    f"{row.get('teardown', 0):.3f}s",
+                    _format_memory(row.get("memory_peak")),
+                    "-" if row["trend"] is None else f"{row['trend']:+.0%}",
+                ]
+                for row in rows
+            ],
+            headers=[
+                "Test",
+                "Total",
+                "Setup",
+                "Call",
+                "Teardown",
+                "Memory peak",
+                f"Trend ({len(history)} commits)",
+            ],
+            title=f"Slowest tests by {sort}",
+        )
+
+    def test_run(
+        self,
+        format: str | None = None,
+        parallel: int | str | None = None,
+        shard: str | None = None,
+        affected: bool = False,
+        coverage: str | None = None,
+        track_memory: bool = False,
+        warm: bool = False,
+        keyword: str | None = None,
+        matrix: bool = False,
+    ) -> None:
+        import json
+
+        from wexample_helpers.helpers.shell import shell_run
+
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_scan_distributions,
+        )
+
+        if matrix:
+            self._test_run_matrix()
+            return
+
+        inventory = venv_scan_distributions(self.get_venv_path())
+
         format = format or PYTHON_PYTEST_COV_FORMAT_JSON
-        self.shell_run_for_app(cmd=self.test_get_command(format=format))
+
+        # Callers that know nothing about parallelism (publication, suite
+        # runs) follow the python.test.parallel config.
+        if parallel is None:
+            parallel = self.search_app_or_suite_runtime_config(
+                "python.test.parallel"
+            ).to_str_or_none()
+
+        parallel = self._parse_test_parallel(parallel)
+        if parallel and "pytest-xdist" not in inventory:
+            self.warning(
+                "pytest-xdist is not installed in the venv, running tests serially."
+            )
+            parallel = None
+
+        if shard and affected:
+            raise ValueError("Sharded and affected test runs cannot be combined.")
+
+        if warm:
+            # The warm server imports the package before any run: coverage
+            # would miss every import-time line and report wrong totals.
+            if coverage not in (None, PYTHON_TEST_COVERAGE_NONE):
+                self.warning("Coverage is disabled in warm mode.")
+            coverage = PYTHON_TEST_COVERAGE_NONE
+
+        coverage = self._get_test_coverage_engine(
+            coverage=coverage, inventory=inventory
+        )
+
+        node_ids = None
+        shard_json_path = None
+        if affected:
+            node_ids = self._get_test_affected_node_ids()
+            if node_ids == []:
+                self.success("No test affected by the changes")
+                return
+            if node_ids is None and coverage == PYTHON_TEST_COVERAGE_NONE:
+                self.warning(
+                    "Recording the test impact map needs coverage, using the "
+                    f"{PYTHON_TEST_COVERAGE_TRACE} engine and a cold run."
+                )
+                coverage = PYTHON_TEST_COVERAGE_TRACE
+                warm = False
+        if shard:
+            from wexample_wex_addon_dev_python.helpers.shard import shard_parse_spec
+
+            index, count = shard_parse_spec(shard)
+            node_ids = self._get_test_shard_node_ids(
+                index=index, count=count, keyword=keyword
+            )
+            if not node_ids:
+                self.log(f"Shard {shard} has no test to run")
+                return
+            shard_json_path = (
+                self.get_path()
+                / PYTHON_PYTEST_COV_SHARD_JSON_GLOB.replace(
+                    "*-of-*", f"{index}-of-{count}"
+                )
+            )
+            self._remove_stale_shard_reports(index=index, count=count)
+        elif keyword and not affected:
+            # Selected from the collection cache, pytest then only imports
+            # the test files holding matching tests. Files are passed rather
+            # than node ids, which could exceed the command line limit, and
+            # pytest applies the expression to them.
+            node_ids = self._get_test_keyword_paths(keyword=keyword)
+            if not node_ids:
+                self.warning(f'No test matches "{keyword}"')
+                return
+
+        test_paths = node_ids
+        selection_path = None
+        if node_ids and (shard or affected):
+            # Node ids could exceed the command line limit: pytest is given
+            # their files, the metrics plugin deselects the other tests.
+            selection_path = self._get_test_selection_path()
+            selection_path.parent.mkdir(parents=True, exist_ok=True)
+            selection_path.write_text(json.dumps(node_ids))
+            test_paths = list(
+                dict.fromkeys(node_id.partition("::")[0] for node_id in node_ids)
+            )
+
+        cmd = self.test_get_command(
+            format=format,
+            parallel=parallel,
+            node_ids=test_paths,
+            json_report_path=shard_json_path,
+            # A full run of the affected mode records the map it then
+            # selects tests from.
+            coverage_contexts=affected and node_ids is None,
+            coverage=coverage,
+            # Shard node ids already match the expression, affected tests
+            # and keyword paths are filtered by pytest.
+            keyword=None if shard else keyword,
+            metrics=True,
+        )
+        env = self._get_test_env(
+            coverage=coverage,
+            track_memory=track_memory,
+            selection_path=selection_path,
+        )
+
+        # Metrics are kept for failed runs too, slow tests often are the
+        # failing ones.
+        try:
+            if warm:
+                self._run_test_command_warm(cmd=cmd, env=env)
+            else:
+                shell_run(
+                    cmd=cmd,
+                    cwd=str(self.get_path()),
+                    env=env,
+                    inherit_stdio=True,
+                )
+        finally:
+            self._save_test_metrics()
+
+        if coverage == PYTHON_TEST_COVERAGE_NONE:
+            self.info("Coverage disabled, the last coverage report is kept")
+            return
+
+        if affected and node_ids is None:
+            self._save_test_impact_map()
+
+        # A shard only measured part of the tests: its report is merged with
+        # the others once every shard ran, see test_merge_coverage().
+        if shard_json_path:
+            self.info(
+                f"Shard {shard} coverage: @path{{{shard_json_path}}}, "
+                "merge all shards with python::test/coverage-merge"
+            )
+            return
+
+        # Coverage of a selection of tests would lower the stored totals.
+        if node_ids is not None or keyword:
+            self.info("Ran a selection of the tests, coverage report not stored")
+            return
 
         # pytest-cov writes no report at all when nothing was measured
         # (e.g. tests that never import the covered module) — a legitimate
@@ -317,89 +807,134 @@ class PythonWorkdir(
             )
             return
 
-        json_file = JsonFile.create_from_path(path=json_path)
-        totals = json_file.read_config().search("totals", default={}).get_dict()
-
-        from wexample_helpers_git.helpers.git import git_get_current_commit_hash
-
-        # Derived state, not configuration: lives in .wex/local/ (untracked)
-        # so test runs never dirty the repository.
-        self.set_local_data_value(
-            "test",
-            "coverage_last_report",
-            {
-                "commit_hash": git_get_current_commit_hash(cwd=self.get_path()),
-                "covered": totals.get("covered_lines", 0),
-                "excluded": totals.get("excluded_lines", 0),
-                "missing": totals.get("missing_lines", 0),
-                "percent": totals.get("percent_covered", 0),
-                "total": totals.get("num_statements", 0),
-            },
-        )
+        self._store_coverage_reports([json_path])
 
         if format == PYTHON_PYTEST_COV_FORMAT_HTML:
             report_path = self.get_path() / PYTHON_PYTEST_COV_REPORT_DIR / "index.html"
             if report_path.exists():
                 self.info(f"Report: @path{{{report_path}}}")
 
-    def update_dependencies(self, dependencies_map: dict[str, str]) -> None:
-        import subprocess
+    def test_save_durations(self) -> None:
+        """Write the recorded test durations to the file shards are balanced from.
 
-        from wexample_helpers.helpers.retryable_callback_manager import (
-            RetryableCallbackManager,
-        )
+        The file is meant to be committed: CI nodes then split the tests the
+        same way, whatever their own history holds.
+        """
+        import json
 
-        super().update_dependencies(dependencies_map)
+        from wexample_wex_addon_dev_python.helpers.metrics import metrics_get_durations
 
-        requirements_path = self.get_path() / "requirements.txt"
-        if not requirements_path.exists():
+        durations = metrics_get_durations(
+            self.get_local_data_value("test_metrics", "history", default=[])
+        )
+        if not durations:
+            self.warning("No test metrics recorded yet, run the tests first.")
             return
 
-        pyproject_path = self.get_path() / "pyproject.toml"
+        durations_path = self.get_path() / PYTHON_TEST_DURATIONS_FILE_NAME
+        durations_path.write_text(
+            json.dumps(
+                {
+                    node_id: round(duration, 3)
+                    for node_id, duration in sorted(durations.items())
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        self.success(
+            f"Saved durations of {len(durations)} tests: @path{{{durations_path}}}"
+        )
 
-        def _run_uv_compile() -> None:
-            result = subprocess.run(
-                [
-                    "uv",
-                    "pip",
-                    "compile",
-                    str(pyproject_path),
-                    "--output-file",
-                    str(requirements_path),
-                    "--python-version",
-                    "3.11",
-                    "--no-cache",
-                    # Force re-resolution from scratch so transitive deps pick
-                    # up patches published since the last compile. Without
-                    # this, uv preserves existing pins in requirements.txt as
-                    # long as they satisfy constraints — causing stale
-                    # transitives even after their direct dependents bumped.
-                    "--upgrade",
-                ],
-                capture_output=True,
-                text=True,
+    def update_dependencies(
+        self, dependencies_map: dict[str, str], compile_lock: bool = True
+    ) -> dict[str, dict[str, str]]:
+        """Set the version of the dependencies in dependencies_map, keeping their operator.
+
+        Every entry is edited in one batch, pyproject.toml being written once;
+        extras and markers are kept. Returns the changes per manifest, as
+        the parent method does.
+        """
+        config_file = self.get_app_config_file()
+        with config_file.batch_edit() as batch:
+            changed = super().update_dependencies(dependencies_map)
+
+        for change in batch.get_changes():
+            self.log(f"{change['old']} → {change['new']}")
+
+        # A suite compiles every lock at once, see
+        # PythonPackagesSuiteWorkdir.compile_requirements().
+        if compile_lock:
+            self.compile_requirements()
+
+        return changed
+
+    def _build_venv_template(
+        self, template_path: Path, python_bin: str, requirements: list[str]
+    ) -> None:
+        import os
+        import shutil
+
+        from wexample_wex_addon_dev_python.common.venv_install_plan import (
+            VenvInstallPlan,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import venv_create
+
+        self.log(
+            f"Building venv template ({len(requirements)} requirements): "
+            f"@path{{{template_path}}}"
+        )
+
+        # Build aside then rename, so that an interrupted build or a
+        # concurrent one never leaves a half-populated template behind.
+        build_path = template_path.with_name(f"{template_path.name}.{os.getpid()}")
+        venv_create(venv_path=build_path, python_bin=python_bin)
+
+        plan = VenvInstallPlan(venv_path=build_path)
+        for requirement in requirements:
+            plan.add_requirement(requirement)
+        self._run_install_plan(plan)
+
+        try:
+            build_path.rename(template_path)
+        except OSError:
+            # Another process published the same template meanwhile.
+            shutil.rmtree(build_path, ignore_errors=True)
+
+    def _collect_test_node_keywords(self, paths: list[str]) -> dict[str, list[str]]:
+        """Collect the given test files, without running them."""
+        import json
+
+        from wexample_helpers.helpers.shell import shell_run
+
+        output_path = self.get_local_dir_path() / "test_collection_output.json"
+        env = self._get_test_env(coverage=PYTHON_TEST_COVERAGE_NONE, track_memory=False)
+        env["WEX_TEST_COLLECTION_OUTPUT"] = str(output_path)
+
+        result = shell_run(
+            cmd=[
+                *self.get_python_exec_module_command("pytest"),
+                "--collect-only",
+                "-q",
+                "-p",
+                "wex_test_metrics",
+                *paths,
+            ],
+            cwd=str(self.get_path()),
+            env=env,
+            inherit_stdio=False,
+            check=False,
+        )
+        # Exit code 5: the files hold no test, a valid result.
+        if result.returncode not in (0, 5) or not output_path.exists():
+            raise RuntimeError(
+                f"Test collection failed for {self.get_path()}:\n{result.stdout}"
             )
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"uv pip compile failed for {self.get_path()}:\n{result.stderr}"
-                )
 
-        # Right after a publish, PyPI's index can still serve a stale view of the
-        # registry, making uv conclude that the freshly-published version is
-        # "unsatisfiable". Retry a few times with backoff to absorb this race.
-        # Real dependency conflicts will still fail after retries.
-        RetryableCallbackManager(
-            callback=_run_uv_compile,
-            max_attempts=4,
-            backoff_base_seconds=4,
-            should_retry_callback=lambda exc, msg, attempt, max_a: (
-                "No solution found" in msg or "unsatisfiable" in msg
-            ),
-            on_retry_callback=lambda attempt, max_a, delay, exc, msg: self.log(
-                f"uv pip compile reports unsatisfiable on attempt {attempt}/{max_a} "
-                f"(likely PyPI index propagation); retrying in {delay}s…"
-            ),
-        ).run()
+        node_keywords = json.loads(output_path.read_text())
+        output_path.unlink()
+
+        return node_keywords
 
     def _create_init_children_factory(self) -> ChildrenFileFactoryOption:
         from wexample_filestate.const.disk import DiskItemType
@@ -544,9 +1079,130 @@ class PythonWorkdir(
             recursive=True,
         )
 
+    def _create_venv_from_template(
+        self, venv_path: Path, env: str | None, python_bin: str = "python3"
+    ) -> None:
+        """Create the venv by cloning a template holding its dependency set.
+
+        Templates are keyed by the interpreter and the requirements they hold,
+        and shared by every package of the suite: a fresh suite bootstrap
+        builds one template per distinct dependency set, then each package
+        venv is a cheap clone that only receives its own delta.
+        """
+        from wexample_wex_addon_dev_python.helpers.fingerprint import (
+            fingerprint_from_data,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_clone,
+            venv_get_interpreter_version,
+        )
+
+        python_version = venv_get_interpreter_version(python_bin)
+        requirements = self._get_venv_template_requirements(
+            env=env, python_version=python_version
+        )
+        template_key = fingerprint_from_data(
+            {
+                "python": python_version,
+                "requirements": requirements,
+            }
+        )
+        template_path = self._get_venv_templates_path() / template_key[:16]
+
+        if not (template_path / "bin" / "python").exists():
+            template_path.parent.mkdir(parents=True, exist_ok=True)
+            self._build_venv_template(
+                template_path=template_path,
+                python_bin=python_bin,
+                requirements=requirements,
+            )
+
+        self.log(f"Cloning venv template @path{{{template_path}}}")
+        venv_clone(
+            source_path=template_path, target_path=venv_path, python_bin=python_bin
+        )
+
+    def _get_git_commit_hash(self, ref: str) -> str:
+        from wexample_helpers.helpers.shell import shell_run
+
+        return shell_run(
+            cmd=["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+            cwd=self.get_path(),
+            inherit_stdio=False,
+        ).stdout.strip()
+
     def _get_iml_file_class(self) -> type[ImlFile]:
         return PythonAppImlFile
 
+    def _get_install_fingerprint(self, venv_path: Path, env: str | None) -> str:
+        from wexample_wex_addon_dev_python.helpers.fingerprint import (
+            fingerprint_from_data,
+        )
+
+        return fingerprint_from_data(
+            self._get_install_fingerprint_data(venv_path=venv_path, env=env)
+        )
+
+    def _get_install_fingerprint_data(self, venv_path: Path, env: str | None) -> dict:
+        """Inputs that, when unchanged, make a new install a no-op."""
+        from wexample_wex_addon_dev_python.helpers.requirements import (
+            requirements_read_file,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import venv_get_python_version
+
+        config = self.get_app_config_file()
+        requirements_path = self.get_path() / "requirements.txt"
+
+        return {
+            "dependencies": config.get_dependencies_specs(),
+            "dev": config.get_dependencies_specs(optional=True, group="dev"),
+            "env": env,
+            "lock": (
+                requirements_read_file(requirements_path)
+                if requirements_path.exists()
+                else None
+            ),
+            "python_version": venv_get_python_version(venv_path),
+            "venv_path": str(venv_path),
+        }
+
+    def _get_lock_requirements(self, python_version: str | None) -> list[str] | None:
+        """Pinned requirements from requirements.txt, or None when unusable.
+
+        The lock is only trusted for the interpreter version it is compiled
+        for (e.g. not in a test matrix venv of another Python) and when it
+        is newer than pyproject.toml; a stale lock means dependencies
+        changed since the last compile. The caller then falls back to
+        resolving from pyproject ranges.
+        """
+        from wexample_wex_addon_dev_python.helpers.requirements import (
+            requirements_lock_applies,
+            requirements_read_file,
+        )
+
+        requirements_path = self.get_path() / "requirements.txt"
+        if not requirements_path.exists():
+            return None
+
+        if not requirements_lock_applies(python_version, PYTHON_LOCK_VERSION):
+            self.log(
+                f"requirements.txt is compiled for Python {PYTHON_LOCK_VERSION}, "
+                f"not {python_version}: resolving dependencies instead",
+                indentation=1,
+            )
+            return None
+
+        pyproject_path = self.get_path() / "pyproject.toml"
+        if requirements_path.stat().st_mtime < pyproject_path.stat().st_mtime:
+            self.log(
+                "requirements.txt is older than pyproject.toml, "
+                "resolving dependencies instead",
+                indentation=1,
+            )
+            return None
+
+        return requirements_read_file(requirements_path)
+
     def _get_source_code_directories(self) -> [TargetFileOrDirectoryType]:
         src = self.find_by_name(PATH_DIR_SRC)
 
@@ -555,6 +1211,91 @@ class PythonWorkdir(
 
         return []
 
+    def _get_test_affected_node_ids(self) -> list[str] | None:
+        """Select the tests affected by the changes since the impact map was recorded.
+
+        Returns None when a full run is needed: no map yet, an unknown
+        commit, or a changed file the map records nothing of (test
+        configuration, data, new source files).
+        """
+        import json
+
+        from wexample_helpers.helpers.shell import shell_run
+
+        from wexample_wex_addon_dev_python.helpers.impact import (
+            impact_get_unknown_paths,
+            impact_parse_diff,
+            impact_select_tests,
+        )
+
+        map_path = self._get_test_impact_map_path()
+        if not map_path.exists():
+            self.log("No test impact map yet, running every test to record it")
+            return None
+
+        impact_map = json.loads(map_path.read_text())
+        try:
+            diff = shell_run(
+                cmd=[
+                    "git",
+                    "diff",
+                    "-U0",
+                    "--relative",
+                    "--no-color",
+                    "--no-ext-diff",
+                    impact_map["commit_hash"],
+                ],
+                cwd=self.get_path(),
+                inherit_stdio=False,
+            ).stdout
+            untracked = shell_run(
+                cmd=["git", "ls-files", "--others", "--exclude-standard"],
+                cwd=self.get_path(),
+                inherit_stdio=False,
+            ).stdout.splitlines()
+        except Exception:
+            self.log("Impact map commit not found, running every test")
+            return None
+
+        changes = impact_parse_diff(diff)
+        changed_paths = set(changes) | set(untracked)
+
+        # Changed or new test files run entirely.
+        tests_prefix = f"{PATH_DIR_TESTS}/"
+        changed_test_files = {
+            path
+            for path in changed_paths
+            if path.startswith(tests_prefix)
+            and (Path(path).name.startswith("test_") or path.endswith("_test.py"))
+            and path.endswith(".py")
+        }
+
+        unknown_paths = impact_get_unknown_paths(
+            impact_map, changed_paths - changed_test_files
+        )
+        if unknown_paths:
+            self.log(
+                f"{len(unknown_paths)} changed file(s) unknown to the impact map "
+                f"({', '.join(unknown_paths[:3])}), running every test"
+            )
+            return None
+
+        selected = impact_select_tests(impact_map, changes)
+        changed_test_files = {
+            path for path in changed_test_files if (self.get_path() / path).exists()
+        }
+        # Tests renamed or removed since the map was recorded are dropped,
+        # the collection cache knows the current ones.
+        existing = set(self._get_test_node_ids())
+        selected = {
+            node_id
+            for node_id in selected
+            if node_id.partition("::")[0] not in changed_test_files
+            and node_id in existing
+        }
+
+        return sorted(changed_test_files) + sorted(selected)
+
     def _get_test_code_directories(self) -> [TargetFileOrDirectoryType]:
         tests = self.find_by_name(PATH_DIR_TESTS)
 
@@ -563,6 +1304,296 @@ class PythonWorkdir(
 
         return []
 
+    def _get_test_collection_path(self) -> Path:
+        return self.get_local_dir_path() / "test_collection.json"
+
+    def _get_test_config_key(self) -> str:
+        """Fingerprint of the files changing how every test file is collected."""
+        import hashlib
+
+        from wexample_wex_addon_dev_python.helpers.fingerprint import (
+            fingerprint_from_data,
+        )
+
+        config_paths = [
+            self.get_path() / "pyproject.toml",
+            self.get_path() / "conftest.py",
+            *sorted((self.get_path() / PATH_DIR_TESTS).rglob("conftest.py")),
+        ]
+
+        return fingerprint_from_data(
+            {
+                str(path): hashlib.sha256(path.read_bytes()).hexdigest()
+                for path in config_paths
+                if path.is_file()
+            }
+        )
+
+    def _get_test_coverage_engine(
+        self, coverage: str | None, inventory: dict[str, VenvDistribution]
+    ) -> str:
+        """Resolve the coverage engine: trace, sysmon (Python 3.12+), or none."""
+        from wexample_wex_addon_dev_python.helpers.coverage import (
+            coverage_get_sysmon_blocker,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import venv_get_python_version
+
+        if coverage is None:
+            coverage = (
+                self.search_app_or_suite_runtime_config(
+                    "python.test.coverage"
+                ).to_str_or_none()
+                or PYTHON_TEST_COVERAGE_TRACE
+            )
+
+        engines = (
+            PYTHON_TEST_COVERAGE_NONE,
+            PYTHON_TEST_COVERAGE_SYSMON,
+            PYTHON_TEST_COVERAGE_TRACE,
+        )
+        if coverage not in engines:
+            raise ValueError(
+                f'Invalid coverage engine "{coverage}": expected one of '
+                f"{', '.join(engines)}."
+            )
+
+        if coverage == PYTHON_TEST_COVERAGE_SYSMON:
+            coverage_distribution = inventory.get("coverage")
+            blocker = coverage_get_sysmon_blocker(
+                python_version=venv_get_python_version(self.get_venv_path()),
+                coverage_version=(
+                    coverage_distribution.version if coverage_distribution else None
+                ),
+            )
+            if blocker:
+                self.warning(
+                    f"The {PYTHON_TEST_COVERAGE_SYSMON} coverage engine needs "
+                    f"{blocker}, using {PYTHON_TEST_COVERAGE_TRACE}."
+                )
+                return PYTHON_TEST_COVERAGE_TRACE
+
+        return coverage
+
+    def _get_test_coverage_store(self) -> CoverageStore:
+        from wexample_wex_addon_dev_python.common.coverage_store import CoverageStore
+
+        return CoverageStore(path=self.get_local_dir_path() / "coverage.sqlite")
+
+    def _get_test_env(
+        self,
+        coverage: str,
+        track_memory: bool,
+        selection_path: Path | None = None,
+    ) -> dict[str, str]:
+        import os
+
+        from wexample_helpers.helpers.module import module_get_path
+
+        import wexample_wex_addon_dev_python
+
+        plugin_path = (
+            module_get_path(wexample_wex_addon_dev_python) / "resources" / "pytest"
+        )
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(plugin_path), env.get("PYTHONPATH")])
+        )
+        env["WEX_TEST_METRICS_OUTPUT"] = str(self._get_test_metrics_path())
+        if track_memory:
+            env["WEX_TEST_METRICS_MEMORY"] = "1"
+        else:
+            env.pop("WEX_TEST_METRICS_MEMORY", None)
+        if selection_path:
+            env["WEX_TEST_SELECTION_INPUT"] = str(selection_path)
+        else:
+            env.pop("WEX_TEST_SELECTION_INPUT", None)
+
+        if coverage == PYTHON_TEST_COVERAGE_SYSMON:
+            env["COVERAGE_CORE"] = PYTHON_TEST_COVERAGE_SYSMON
+
+        return env
+
+    def _get_test_impact_map_path(self) -> Path:
+        return self.get_local_dir_path() / "test_impact_map.json"
+
+    def _get_test_keyword_paths(self, keyword: str) -> list[str]:
+        from wexample_wex_addon_dev_python.helpers.keyword_expression import (
+            keyword_expression_select_paths,
+        )
+
+        return keyword_expression_select_paths(keyword, self._get_test_node_keywords())
+
+    def _get_test_metrics_path(self) -> Path:
+        # Raw output of the last run, the history is kept in local data.
+        return self.get_local_dir_path() / "test_metrics.json"
+
+    def _get_test_node_ids(self, keyword: str | None = None) -> list[str]:
+        from wexample_wex_addon_dev_python.helpers.keyword_expression import (
+            keyword_expression_compile,
+        )
+
+        matches = keyword_expression_compile(keyword or "")
+        return [
+            node_id
+            for node_id, names in self._get_test_node_keywords().items()
+            if matches(names)
+        ]
+
+    def _get_test_node_keywords(self) -> dict[str, list[str]]:
+        """Map every test node id to its -k names, collecting only changed files.
+
+        Node ids are cached per test file, keyed by its content and by the
+        conftest and pyproject files. Tests parametrized from data outside
+        of these files are not noticed until one of them changes.
+        """
+        import hashlib
+        import json
+
+        cache_path = self._get_test_collection_path()
+        cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+        config_key = self._get_test_config_key()
+        cached_files = (
+            cache.get("files", {}) if cache.get("config_key") == config_key else {}
+        )
+
+        files = {}
+        stale_paths = []
+        tests_path = self.get_path() / PATH_DIR_TESTS
+        test_paths = sorted(
+            {*tests_path.rglob("test_*.py"), *tests_path.rglob("*_test.py")}
+        )
+        for test_path in test_paths:
+            relative_path = test_path.relative_to(self.get_path()).as_posix()
+            file_hash = hashlib.sha256(test_path.read_bytes()).hexdigest()
+
+            cached = cached_files.get(relative_path)
+            if cached and cached["hash"] == file_hash:
+                files[relative_path] = cached
+            else:
+                files[relative_path] = {"hash": file_hash, "node_keywords": {}}
+                stale_paths.append(relative_path)
+
+        if stale_paths or len(files) != len(cached_files):
+            if stale_paths:
+                self.log(f"Collecting {len(stale_paths)} changed test files")
+                for node_id, names in self._collect_test_node_keywords(
+                    stale_paths
+                ).items():
+                    relative_path = node_id.partition("::")[0]
+                    if relative_path in files:
+                        files[relative_path]["node_keywords"][node_id] = names
+
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"config_key": config_key, "files": files})
+            )
+
+        return {
+            node_id: names
+            for file in files.values()
+            for node_id, names in file["node_keywords"].items()
+        }
+
+    def _get_test_selection_path(self) -> Path:
+        return self.get_local_dir_path() / "test_selection.json"
+
+    def _get_test_shard_node_ids(
+        self, index: int, count: int, keyword: str | None = None
+    ) -> list[str]:
+        """Return the node ids of the given shard, among the ones matching keyword.
+
+        Every CI node must compute the same split: durations come from the
+        committed durations file, never from the local history, which
+        differs from one machine to another. Without that file, tests are
+        split by node id alone.
+        """
+        import json
+
+        from wexample_wex_addon_dev_python.helpers.shard import (
+            shard_partition_node_ids,
+        )
+
+        durations_path = self.get_path() / PYTHON_TEST_DURATIONS_FILE_NAME
+        if durations_path.exists():
+            durations = json.loads(durations_path.read_text())
+        else:
+            self.log(
+                f"No {PYTHON_TEST_DURATIONS_FILE_NAME} file, splitting tests by "
+                "node id, save one with python::test/durations-save"
+            )
+            durations = {}
+
+        return shard_partition_node_ids(
+            node_ids=self._get_test_node_ids(keyword=keyword),
+            durations=durations,
+            count=count,
+        )[index - 1]
+
+    def _get_venv_template_requirements(
+        self, env: str | None, python_version: str | None
+    ) -> list[str]:
+        """Requirements shared through the venv template, sorted."""
+        from wexample_wex_addon_dev_python.helpers.requirements import (
+            requirements_lock_applies,
+            requirements_read_file,
+        )
+
+        config = self.get_app_config_file()
+        requirements_path = self.get_path() / "requirements.txt"
+
+        # The pinned requirements are the resolved set when available for
+        # this interpreter.
+        if requirements_path.exists() and requirements_lock_applies(
+            python_version, PYTHON_LOCK_VERSION
+        ):
+            requirements = requirements_read_file(requirements_path)
+        else:
+            requirements = config.get_dependencies_specs()
+
+        return sorted(
+            set(requirements)
+            | set(config.get_dependencies_specs(optional=True, group="dev"))
+        )
+
+    def _get_venv_templates_path(self) -> Path:
+        # Templates are shared by the whole suite when there is one.
+        owner = self.get_shallow_suite_workdir() or self
+        return owner.get_local_dir_path() / "venv_templates"
+
+    def _get_warm_test_server_client(self) -> WarmTestServerClient:
+        from wexample_wex_addon_dev_python.common.warm_test_server_client import (
+            WarmTestServerClient,
+        )
+        from wexample_wex_addon_dev_python.helpers.fingerprint import (
+            fingerprint_from_data,
+        )
+        from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+            warm_test_server_get_socket_dir,
+        )
+
+        # Unix socket paths are limited to about a hundred characters, too
+        # short for .wex/local of deep workdirs.
+        socket_key = fingerprint_from_data(str(self.get_path()))[:16]
+
+        return WarmTestServerClient(
+            import_name=self.get_package_import_name(),
+            log_path=self.get_local_dir_path() / "test_server.log",
+            python_path=self.get_python_path(),
+            socket_path=warm_test_server_get_socket_dir() / f"{socket_key}.sock",
+        )
+
+    def _get_wheelhouse_path(self) -> Path:
+        # Configurable so several suites (or CI jobs) can share one directory.
+        wheelhouse_path_config = self.search_app_or_suite_runtime_config(
+            "python.wheelhouse_path"
+        )
+        if not wheelhouse_path_config.is_none():
+            return Path(wheelhouse_path_config.get_str())
+
+        owner = self.get_shallow_suite_workdir() or self
+        return owner.get_local_dir_path() / "wheelhouse"
+
     def _init_listeners(self) -> None:
         """Add event listeners"""
         self.operation_add_event_listener(
@@ -572,19 +1603,359 @@ class PythonWorkdir(
     def _install_dependencies_in_venv(
         self, venv_path: Path, env: str | None = None, force: bool = False
     ) -> None:
-        from wexample_wex_addon_app.helpers.python import (
-            python_install_dependency_in_venv,
+        import time
+
+        from wexample_wex_addon_dev_python.common.venv_install_plan import (
+            VenvInstallPlan,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import (
+            venv_distribution_satisfies,
+            venv_get_python_version,
+            venv_scan_distributions,
         )
 
+        started_at = time.perf_counter()
+        plans = []
+
         # Installing the package itself (editable, with dev extras) pulls
         # runtime and test dependencies while honoring the version
         # constraints of pyproject.toml — pytest must be present for the
         # publication test phase.
-        python_install_dependency_in_venv(
+        plan = VenvInstallPlan(venv_path=venv_path)
+        plan.add_editable(f"{self.get_path()}[dev]")
+
+        lock_requirements = self._get_lock_requirements(
+            python_version=venv_get_python_version(venv_path)
+        )
+        if lock_requirements is not None:
+            inventory = {} if force else venv_scan_distributions(venv_path)
+
+            # The lock is fully pinned: install it as-is, the resolver then
+            # only has the package itself and its dev group left to check.
+            locked_plan = VenvInstallPlan(venv_path=venv_path, no_deps=True)
+            for spec in lock_requirements:
+                if not venv_distribution_satisfies(inventory, spec):
+                    locked_plan.add_requirement(spec)
+            plans.append(locked_plan)
+
+        plans.append(plan)
+
+        self._run_install_plans(plans=plans, started_at=started_at)
+
+    def _install_fingerprint_matches(self, venv_path: Path, env: str | None) -> bool:
+        if not (venv_path / "bin" / "python").exists():
+            return False
+
+        stored = self.get_local_data_value("install", "fingerprints", default={})
+        return stored.get(str(venv_path)) == self._get_install_fingerprint(
+            venv_path=venv_path, env=env
+        )
+
+    def _install_venv(
+        self,
+        venv_path: Path,
+        env: str | None,
+        force: bool = False,
+        create_venv: bool = True,
+        python_bin: str = "python3",
+    ) -> None:
+        from wexample_wex_addon_app.helpers.python import python_ensure_pip_or_fail
+
+        # Nothing changed since the last successful install: skip spawning
+        # pip and re-resolving dependencies.
+        if not force and self._install_fingerprint_matches(
+            venv_path=venv_path, env=env
+        ):
+            self.log(f"Environment up to date: @path{{{venv_path}}}")
+            return
+
+        if create_venv:
+            self._create_venv_from_template(
+                venv_path=venv_path, env=env, python_bin=python_bin
+            )
+
+        self.log(f"Using venv: @path{{{venv_path}}}")
+        python_ensure_pip_or_fail(venv_path)
+
+        self._install_dependencies_in_venv(
             venv_path=venv_path,
-            name=f"{self.get_path()}[dev]",
-            editable=True,
+            env=env,
+            force=force,
         )
 
+        self._save_install_fingerprint(venv_path=venv_path, env=env)
+
     def _on_test_event(self, event: Event) -> None:
         self.success("A python file has been renamed")
+
+    def _parse_test_parallel(self, parallel: int | str | None) -> str | None:
+        """Normalize a worker count: "auto", a positive number, or None for serial."""
+        if parallel is None or str(parallel) in ("", "0"):
+            return None
+
+        parallel = str(parallel).strip().lower()
+        if parallel == PYTHON_PYTEST_PARALLEL_AUTO or (
+            parallel.isdigit() and int(parallel) > 0
+        ):
+            return parallel
+
+        raise ValueError(
+            f'Invalid parallel value "{parallel}": expected '
+            f'"{PYTHON_PYTEST_PARALLEL_AUTO}" or a number of workers.'
+        )
+
+    def _remove_stale_shard_reports(self, index: int, count: int) -> None:
+        """Remove the coverage reports a shard run must not leave to the merge.
+
+        Its own report from an earlier run, and every report of a split in
+        another number of shards. Reports of the other shards of this split
+        are kept: they may belong to the current run.
+        """
+        from wexample_wex_addon_dev_python.helpers.shard import (
+            shard_parse_report_name,
+        )
+
+        for path in self.get_path().glob(PYTHON_PYTEST_COV_SHARD_JSON_GLOB):
+            parsed = shard_parse_report_name(path.name)
+            if parsed and (parsed == (index, count) or parsed[1] != count):
+                path.unlink(missing_ok=True)
+
+    def _run_install_plan(self, plan: VenvInstallPlan) -> None:
+        """Install from the wheelhouse first, reaching the index only when needed.
+
+        An offline attempt runs when the wheelhouse holds a wheel for every
+        requirement of the plan (see VenvInstallPlan.can_install_offline()).
+        If the install still fails, e.g. on a missing dependency, the plan
+        runs again with the index as fallback, then the wheels it fetched
+        are collected so the next run stays offline.
+        """
+        import subprocess
+
+        wheelhouse_path = self._get_wheelhouse_path()
+        plan.find_links = [str(wheelhouse_path)]
+
+        if plan.can_install_offline(wheelhouse_path):
+            plan.offline = True
+            try:
+                plan.run(inherit_stdio=False)
+                return
+            except subprocess.CalledProcessError:
+                self.log(
+                    "Wheelhouse incomplete, falling back to the index",
+                    indentation=1,
+                )
+            plan.offline = False
+
+        plan.run()
+        plan.collect_wheels(wheelhouse_path)
+
+    def _run_install_plans(
+        self, plans: list[VenvInstallPlan], started_at: float
+    ) -> None:
+        """Run the install plans in order and report where time went."""
+        import time
+
+        planned_at = time.perf_counter()
+        timings = {}
+
+        for plan in plans:
+            plan_started_at = time.perf_counter()
+
+            if plan.is_empty():
+                self.log(f"Nothing to {plan.get_label()}", indentation=1)
+            else:
+                self.subtitle(plan.describe(), indentation=1)
+                self._run_install_plan(plan)
+
+            timings[plan.get_label()] = f"{time.perf_counter() - plan_started_at:.2f}s"
+
+        self.io.properties(
+            properties={
+                "installer": plans[0].get_installer_name(),
+                "requirements": sum(len(plan.requirements) for plan in plans),
+                "editables": sum(len(plan.editable_paths) for plan in plans),
+                "planning": f"{planned_at - started_at:.2f}s",
+                **timings,
+                "total": f"{time.perf_counter() - started_at:.2f}s",
+            },
+            title="Install timings",
+        )
+
+    def _run_test_command_warm(self, cmd: list[str], env: dict[str, str]) -> None:
+        import subprocess
+
+        # The server runs pytest in-process: only its arguments are sent.
+        prefix = self.get_python_exec_module_command("pytest")
+        exit_code = self._get_warm_test_server_client().run(
+            args=cmd[len(prefix) :], cwd=self.get_path(), env=env
+        )
+        if exit_code:
+            raise subprocess.CalledProcessError(exit_code, cmd)
+
+    def _save_install_fingerprint(self, venv_path: Path, env: str | None) -> None:
+        # Derived state, keyed by venv so that a shared suite venv and a
+        # local .venv never overwrite each other's fingerprint.
+        fingerprints = self.get_local_data_value("install", "fingerprints", default={})
+        fingerprints[str(venv_path)] = self._get_install_fingerprint(
+            venv_path=venv_path, env=env
+        )
+        self.set_local_data_value("install", "fingerprints", fingerprints)
+
+    def _save_test_impact_map(self) -> None:
+        import json
+
+        from wexample_helpers_git.helpers.git import git_get_current_commit_hash
+
+        from wexample_wex_addon_dev_python.helpers.coverage import (
+            coverage_read_line_contexts,
+        )
+        from wexample_wex_addon_dev_python.helpers.impact import impact_build_map
+
+        data_path = self.get_path() / ".coverage"
+        if not data_path.exists():
+            self.warning("No coverage data recorded, test impact map not updated")
+            return
+
+        impact_map = impact_build_map(
+            coverage_read_line_contexts(data_path), base_path=self.get_path()
+        )
+        impact_map["commit_hash"] = git_get_current_commit_hash(cwd=self.get_path())
+
+        map_path = self._get_test_impact_map_path()
+        map_path.parent.mkdir(parents=True, exist_ok=True)
+        map_path.write_text(json.dumps(impact_map, separators=(",", ":")))
+
+    def _save_test_metrics(self) -> None:
+        import json
+
+        from wexample_helpers_git.helpers.git import git_get_current_commit_hash
+
+        from wexample_wex_addon_dev_python.helpers.metrics import metrics_add_run
+
+        metrics_path = self._get_test_metrics_path()
+        if not metrics_path.exists():
+            return
+
+        # A namespace of its own: the history is much larger than the rest
+        # of the test data, and only needed by sharding and reports.
+        self.set_local_data_value(
+            "test_metrics",
+            "history",
+            metrics_add_run(
+                history=self.get_local_data_value(
+                    "test_metrics", "history", default=[]
+                ),
+                commit_hash=git_get_current_commit_hash(cwd=self.get_path()),
+                tests=json.loads(metrics_path.read_text()),
+            ),
+        )
+        metrics_path.unlink()
+
+    def _store_coverage_reports(self, report_paths: list[Path]) -> dict:
+        """Record json reports in the coverage store and keep their totals as the last report."""
+        commit_hash = self._get_git_commit_hash("HEAD")
+        totals = self._get_test_coverage_store().record_json_reports(
+            commit_hash=commit_hash, report_paths=report_paths
+        )
+
+        # Derived state, not configuration: lives in .wex/local/ (untracked)
+        # so test runs never dirty the repository.
+        self.set_local_data_value(
+            "test",
+            "coverage_last_report",
+            {
+                "commit_hash": commit_hash,
+                "covered": totals["covered_lines"],
+                "excluded": totals["excluded_lines"],
+                "missing": totals["missing_lines"],
+                "percent": totals["percent_covered"],
+                "total": totals["num_statements"],
+            },
+        )
+
+        return totals
+
+    def _test_run_matrix(self) -> None:
+        """Run the tests once per local interpreter allowed by requires-python.
+
+        Each version gets its own venv under .wex/local/matrix, installed
+        through the same template and fingerprint machinery as the main one,
+        then every version runs concurrently, without coverage.
+        """
+        import os
+        import subprocess
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_wex_addon_dev_python.const.python import (
+            PYTHON_TEST_MATRIX_VERSIONS,
+        )
+        from wexample_wex_addon_dev_python.helpers.venv import venv_find_interpreters
+
+        requires_python = (
+            self.get_app_config().get("project", {}).get("requires-python", "")
+        )
+        interpreters = venv_find_interpreters(
+            versions=PYTHON_TEST_MATRIX_VERSIONS, requires_python=requires_python
+        )
+        if not interpreters:
+            self.warning(
+                f"No local interpreter satisfies requires-python {requires_python}"
+            )
+            return
+
+        matrix_path = self.get_local_dir_path() / "matrix"
+        env = self.get_app_env()
+
+        # Installs run one by one: they share the venv templates and the
+        # wheelhouse.
+        for version, python_bin in interpreters.items():
+            self.subtitle(f"Python {version}")
+            self._install_venv(
+                venv_path=matrix_path / version, env=env, python_bin=python_bin
+            )
+
+        def _run(version: str) -> tuple[int, float]:
+            started_at = time.perf_counter()
+            log_path = matrix_path / f"{version}.log"
+
+            with log_path.open("w") as log:
+                returncode = subprocess.run(
+                    [
+                        str(matrix_path / version / "bin" / "python"),
+                        "-m",
+                        "pytest",
+                        # Concurrent runs would race on the cache directory.
+                        "-p",
+                        "no:cacheprovider",
+                    ],
+                    cwd=self.get_path(),
+                    env=dict(os.environ),
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                ).returncode
+
+            return returncode, time.perf_counter() - started_at
+
+        self.log(f"Running tests on Python {', '.join(interpreters)}")
+        with ThreadPoolExecutor(max_workers=len(interpreters)) as executor:
+            results = dict(zip(interpreters, executor.map(_run, interpreters)))
+
+        self.io.table(
+            data=[
+                [
+                    version,
+                    interpreters[version],
+                    "passed" if returncode == 0 else f"failed ({returncode})",
+                    f"{duration:.2f}s",
+                    str(matrix_path / f"{version}.log"),
+                ]
+                for version, (returncode, duration) in results.items()
+            ],
+            headers=["Python", "Interpreter", "Result", "Duration", "Log"],
+            title="Test matrix",
+        )
+
+        failed = [version for version, (returncode, _) in results.items() if returncode]
+        if failed:
+            raise RuntimeError(f"Tests failed on Python {', '.join(failed)}")
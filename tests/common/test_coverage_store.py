@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+
+def _write_report(path: Path, files: dict[str, tuple[list[int], list[int]]]) -> Path:
+    path.write_text(
+        json.dumps(
+            {
+                "meta": {"version": "7.4.0"},
+                "files": {
+                    name: {
+                        "executed_lines": executed,
+                        "missing_lines": missing,
+                        "excluded_lines": [],
+                    }
+                    for name, (executed, missing) in files.items()
+                },
+                "totals": {},
+            }
+        )
+    )
+
+    return path
+
+
+def _count_rows(store_path: Path, table: str) -> int:
+    with sqlite3.connect(store_path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    import time
+
+    # Reports are pruned by recording time: each call gets a later one.
+    ticks = [1000.0]
+
+    def _time() -> float:
+        ticks[0] += 1
+        return ticks[0]
+
+    monkeypatch.setattr(time, "time", _time)
+    return ticks
+
+
+def _create_store(tmp_path: Path, **kwargs):
+    from wexample_wex_addon_dev_python.common.coverage_store import CoverageStore
+
+    return CoverageStore(path=tmp_path / "coverage.sqlite", **kwargs)
+
+
+def test_coverage_store_merges_shard_reports(tmp_path: Path, clock) -> None:
+    store = _create_store(tmp_path)
+
+    totals = store.record_json_reports(
+        "commit-a",
+        [
+            _write_report(
+                tmp_path / "shard-1.json",
+                {"src/app.py": ([1, 2], [3, 4]), "src/cli.py": ([1], [2])},
+            ),
+            _write_report(tmp_path / "shard-2.json", {"src/app.py": ([3], [1, 2, 4])}),
+        ],
+    )
+
+    # A line is missing only when no shard executed it.
+    assert store.get_missing_lines("commit-a", ["src/app.py", "src/cli.py"]) == {
+        "src/app.py": [4],
+        "src/cli.py": [2],
+    }
+    assert totals["covered_lines"] == 4
+    assert totals["num_statements"] == 6
+    assert totals["missing_lines"] == 2
+    assert store.has_report("commit-a")
+    assert not store.has_report("commit-b")
+
+
+def test_coverage_store_rerecording_replaces_rows(tmp_path: Path, clock) -> None:
+    store = _create_store(tmp_path)
+
+    store.record_json_reports(
+        "commit-a",
+        [
+            _write_report(
+                tmp_path / "first.json",
+                {"src/app.py": ([1], [2]), "src/old.py": ([1], [])},
+            )
+        ],
+    )
+    store.record_json_reports(
+        "commit-a",
+        [_write_report(tmp_path / "second.json", {"src/app.py": ([1, 2], [])})],
+    )
+
+    assert store.get_missing_lines("commit-a", ["src/app.py", "src/old.py"]) == {
+        "src/app.py": []
+    }
+    assert _count_rows(store.path, "report") == 1
+    assert _count_rows(store.path, "file_coverage") == 1
+
+
+def test_coverage_store_prunes_oldest_reports(tmp_path: Path, clock) -> None:
+    store = _create_store(tmp_path, max_reports=2)
+
+    for commit_hash in ["commit-a", "commit-b", "commit-c"]:
+        store.record_json_reports(
+            commit_hash,
+            [
+                _write_report(
+                    tmp_path / f"{commit_hash}.json",
+                    {"src/app.py": ([1], [2]), "src/cli.py": ([1], [])},
+                )
+            ],
+        )
+
+    assert not store.has_report("commit-a")
+    assert store.has_report("commit-b")
+    assert store.has_report("commit-c")
+    # Rows of the pruned report go with it.
+    assert _count_rows(store.path, "file_coverage") == 4
+    assert store.get_missing_lines("commit-a", ["src/app.py"]) == {}
+
+
+def test_coverage_store_get_lost_coverage(tmp_path: Path, clock) -> None:
+    store = _create_store(tmp_path)
+
+    store.record_json_reports(
+        "commit-a",
+        [
+            _write_report(
+                tmp_path / "before.json",
+                {
+                    "src/app.py": ([1, 2, 3, 4], []),
+                    "src/cli.py": ([1], [2]),
+                    "src/new.py": ([1], []),
+                },
+            )
+        ],
+    )
+    store.record_json_reports(
+        "commit-b",
+        [
+            _write_report(
+                tmp_path / "after.json",
+                {"src/app.py": ([1, 2], [3, 4]), "src/cli.py": ([1, 2], [])},
+            )
+        ],
+    )
+
+    assert store.get_lost_coverage(since_commit="commit-a", commit_hash="commit-b") == [
+        {
+            "path": "src/app.py",
+            "percent_after": 50.0,
+            "percent_before": 100.0,
+            "missing_after": 2,
+            "missing_before": 0,
+        }
+    ]
+    assert store.get_missing_lines("commit-b", ["src/app.py"]) == {"src/app.py": [3, 4]}
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import pytest
+
+# The batch edits TOML arrays through the filestate helpers.
+pytest.importorskip("wexample_filestate_python.helpers.toml")
+
+PYPROJECT = """[project]
+name = "demo"
+dependencies = [
+    "attrs>=23.1.0",
+    "pydantic[email]>=2.0.0; python_version >= '3.10'",
+    "requests==2.31.0",
+    "not a valid requirement !!",
+]
+"""
+
+
+class _Pyproject:
+    """Pyproject file kept in memory, counting its writes."""
+
+    def __init__(self, content: str) -> None:
+        import tomlkit
+
+        from wexample_wex_addon_dev_python.file.python_pyproject_toml_file import (
+            PythonPyprojectTomlFile,
+        )
+
+        self._batch = None
+        for name in (
+            "add_dependency_from_spec",
+            "add_dependency_from_string",
+            "batch_edit",
+        ):
+            setattr(self, name, getattr(PythonPyprojectTomlFile, name).__get__(self))
+        self.document = tomlkit.parse(content)
+        self.writes = 0
+
+    def get_path(self) -> str:
+        return "pyproject.toml"
+
+    def get_dependencies(self) -> list[str]:
+        return [str(item) for item in self._get_deps_array()]
+
+    def write_parsed(self) -> None:
+        self.writes += 1
+
+    def _get_deps_array(self, optional: bool = False, group: str | None = "dev"):
+        project = self.document["project"]
+        if optional:
+            return project["optional-dependencies"][group]
+
+        return project["dependencies"]
+
+
+def test_pyproject_dependencies_batch_writes_all_edits_once() -> None:
+    from packaging.requirements import Requirement
+
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pyproject.batch_edit() as batch:
+        assert batch.add(Requirement("cattrs>=23.2.0"))
+        assert batch.update("Requests", "==2.32.0")
+        assert batch.remove("attrs")
+        assert not batch.remove("missing")
+        # Reads still see the file as it was.
+        assert "attrs>=23.1.0" in pyproject.get_dependencies()
+
+    assert pyproject.writes == 1
+    assert pyproject.get_dependencies() == [
+        "cattrs>=23.2.0",
+        "not a valid requirement !!",
+        "pydantic[email]>=2.0.0; python_version >= '3.10'",
+        "requests==2.32.0",
+    ]
+    assert batch.get_changes() == [
+        {"group": None, "name": "attrs", "new": None, "old": "attrs>=23.1.0"},
+        {
+            "group": None,
+            "name": "requests",
+            "new": "requests==2.32.0",
+            "old": "requests==2.31.0",
+        },
+        {"group": None, "name": "cattrs", "new": "cattrs>=23.2.0", "old": None},
+    ]
+
+
+def test_pyproject_dependencies_batch_update_keeps_extras_and_markers() -> None:
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pyproject.batch_edit() as batch:
+        assert batch.update("pydantic", ">=2.5.0")
+        assert not batch.update("missing", ">=1.0.0")
+
+    assert (
+        'pydantic[email]>=2.5.0; python_version >= "3.10"'
+        in pyproject.get_dependencies()
+    )
+
+
+def test_pyproject_dependencies_batch_joined_by_add_dependency_from_string() -> None:
+    pyproject = _Pyproject(PYPROJECT)
+
+    # As CodeBaseWorkdir.update_dependencies() does, inside one batch.
+    with pyproject.batch_edit():
+        assert pyproject.add_dependency_from_string("pydantic", "2.5.0", ">=")
+        assert pyproject.add_dependency_from_string("cattrs", "23.2.0", ">=")
+        assert not pyproject.add_dependency_from_string("attrs", "23.1.0", ">=")
+
+    assert pyproject.writes == 1
+    assert pyproject.get_dependencies() == [
+        "attrs>=23.1.0",
+        "cattrs>=23.2.0",
+        "not a valid requirement !!",
+        'pydantic[email]>=2.5.0; python_version >= "3.10"',
+        "requests==2.31.0",
+    ]
+
+
+def test_pyproject_dependencies_batch_keeps_unparsable_entries() -> None:
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pyproject.batch_edit() as batch:
+        batch.update("attrs", ">=24.0.0")
+
+    assert "not a valid requirement !!" in pyproject.get_dependencies()
+    assert [change["name"] for change in batch.get_changes()] == ["attrs"]
+
+
+def test_pyproject_dependencies_batch_writes_nothing_unchanged() -> None:
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pyproject.batch_edit() as batch:
+        assert not batch.update("attrs", ">=23.1.0")
+
+    assert pyproject.writes == 0
+    assert batch.get_changes() == []
+
+
+def test_pyproject_dependencies_batch_writes_nothing_when_block_raises() -> None:
+    from packaging.requirements import Requirement
+
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pytest.raises(RuntimeError):
+        with pyproject.batch_edit() as batch:
+            batch.add(Requirement("cattrs>=23.2.0"))
+            raise RuntimeError("Interrupted")
+
+    assert pyproject.writes == 0
+    assert "cattrs>=23.2.0" not in pyproject.get_dependencies()
+    assert pyproject._batch is None
+
+
+def test_pyproject_dependencies_batch_refuses_conflicting_edits() -> None:
+    from packaging.requirements import Requirement
+
+    pyproject = _Pyproject(PYPROJECT)
+
+    with pytest.raises(ValueError, match="Conflicting edits"):
+        with pyproject.batch_edit() as batch:
+            assert batch.update("attrs", ">=24.0.0")
+            # The same edit again is harmless.
+            assert not batch.add(Requirement("attrs>=24.0.0"))
+            batch.add(Requirement("Attrs>=25.0.0"))
+
+    assert pyproject.writes == 0
+
+
+def test_pyproject_dependencies_batch_keeps_packages_listed_several_times() -> None:
+    pyproject = _Pyproject("""[project]
+name = "demo"
+dependencies = [
+    "numpy<2; python_version < '3.10'",
+    "numpy>=2; python_version >= '3.10'",
+    "attrs>=23.1.0",
+]
+""")
+
+    with pyproject.batch_edit() as batch:
+        assert batch.update("attrs", ">=24.0.0")
+        with pytest.raises(ValueError, match="several entries"):
+            batch.update("numpy", ">=2.1")
+        with pytest.raises(ValueError, match="several entries"):
+            pyproject.add_dependency_from_string("NumPy", "2.1.0", ">=")
+
+    assert pyproject.writes == 1
+    assert pyproject.get_dependencies() == [
+        "attrs>=24.0.0",
+        "numpy<2; python_version < '3.10'",
+        "numpy>=2; python_version >= '3.10'",
+    ]
+    assert [change["name"] for change in batch.get_changes()] == ["attrs"]
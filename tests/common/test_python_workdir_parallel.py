@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _create_workdir() -> SimpleNamespace:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    workdir = SimpleNamespace(
+        get_python_exec_module_command=lambda module: ["python", "-m", module],
+    )
+    workdir._parse_test_parallel = lambda parallel: PythonWorkdir._parse_test_parallel(
+        workdir, parallel
+    )
+
+    return workdir
+
+
+@pytest.mark.parametrize(
+    ("parallel", "expected"),
+    [
+        ("auto", "auto"),
+        (" AUTO ", "auto"),
+        (4, "4"),
+        ("8", "8"),
+        (1, "1"),
+        (0, None),
+        ("0", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_test_parallel(parallel, expected) -> None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    assert PythonWorkdir._parse_test_parallel(_create_workdir(), parallel) == expected
+
+
+@pytest.mark.parametrize("parallel", ["-2", "many", "1.5", -1])
+def test_parse_test_parallel_rejects_invalid_values(parallel) -> None:
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    with pytest.raises(ValueError, match="Invalid parallel value"):
+        PythonWorkdir._parse_test_parallel(_create_workdir(), parallel)
+
+
+def test_get_command_adds_xdist_options_only_when_parallel() -> None:
+    from wexample_wex_addon_dev_python.const.python import PYTHON_TEST_COVERAGE_NONE
+    from wexample_wex_addon_dev_python.workdir.python_workdir import PythonWorkdir
+
+    def _get_command(parallel) -> list[str]:
+        return PythonWorkdir.test_get_command(
+            _create_workdir(), parallel=parallel, coverage=PYTHON_TEST_COVERAGE_NONE
+        )
+
+    for serial in (None, 0, "0", ""):
+        command = _get_command(serial)
+        assert "-n" not in command
+        assert not any(part.startswith("--dist") for part in command)
+
+    command = _get_command("auto")
+    assert command[command.index("-n") + 1 :] == ["auto"]
+    assert _get_command(3)[-2:] == ["-n", "3"]
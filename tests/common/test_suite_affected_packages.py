@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+DEPENDENCIES = {
+    "helpers": [],
+    "filestate": ["helpers"],
+    "prompt": ["helpers"],
+    "app": ["filestate"],
+    "docs": [],
+}
+
+
+def _create_suite(has_changes: dict[str, bool | Exception]) -> SimpleNamespace:
+    from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+        SuiteDependencyGraph,
+    )
+
+    graph = SuiteDependencyGraph(dependencies_map=DEPENDENCIES)
+    packages = [
+        SimpleNamespace(
+            get_path=lambda name=name: Path(name),
+            get_package_name=lambda name=name: name,
+        )
+        for name in graph.get_order()
+    ]
+    git_queries = SimpleNamespace(
+        has_changes_since=lambda refs: {
+            path: has_changes.get(path.name, False) for path in refs
+        }
+    )
+    warnings = []
+
+    return SimpleNamespace(
+        get_dependency_graph=lambda: graph,
+        get_git_queries=lambda: git_queries,
+        get_ordered_packages=lambda: packages,
+        warning=warnings.append,
+        warnings=warnings,
+    )
+
+
+def test_get_affected_packages_follows_reverse_dependencies() -> None:
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    suite = _create_suite({"helpers": True, "prompt": True})
+
+    affected = PythonPackagesSuiteWorkdir.get_affected_packages(
+        suite, base_ref="origin/main"
+    )
+
+    # Leaves first; a changed package keeps its own reason even when one of
+    # its dependencies changed too.
+    assert affected == {
+        "helpers": "changed",
+        "filestate": "depends on helpers",
+        "prompt": "changed",
+        "app": "depends on helpers",
+    }
+    assert suite.warnings == []
+
+
+def test_get_affected_packages_treats_git_errors_as_changed() -> None:
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    suite = _create_suite({"filestate": RuntimeError("unknown revision")})
+
+    affected = PythonPackagesSuiteWorkdir.get_affected_packages(
+        suite, base_ref="v1.0.0"
+    )
+
+    assert affected == {"filestate": "changed", "app": "depends on filestate"}
+    assert len(suite.warnings) == 1
+    assert "filestate" in suite.warnings[0]
+    assert "unknown revision" in suite.warnings[0]
+
+
+def test_suite_affected_command_output(monkeypatch) -> None:
+    from wexample_wex_addon_dev_python.commands.suite.affected import (
+        python__suite__affected,
+    )
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    affected = {"helpers": "changed", "app": "depends on helpers"}
+    suite = PythonPackagesSuiteWorkdir.__new__(PythonPackagesSuiteWorkdir)
+    monkeypatch.setattr(
+        PythonPackagesSuiteWorkdir,
+        "get_affected_packages",
+        lambda self, base_ref: affected if base_ref == "origin/main" else {},
+    )
+    tables = []
+    context = SimpleNamespace(
+        io=SimpleNamespace(table=lambda **kwargs: tables.append(kwargs))
+    )
+    run = python__suite__affected.function
+
+    assert (
+        run(context=context, app_workdir=suite, base="origin/main", names_only=True)
+        == "helpers\napp"
+    )
+    assert (
+        run(context=context, app_workdir=suite, base="v1.0.0")
+        == "No package changed since v1.0.0."
+    )
+    assert run(context=context, app_workdir=suite, base="origin/main") is None
+    assert tables[0]["data"] == [["helpers", "changed"], ["app", "depends on helpers"]]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+def _create_graph(dependencies_map: dict[str, list[str]]):
+    from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+        SuiteDependencyGraph,
+    )
+
+    return SuiteDependencyGraph(dependencies_map=dependencies_map)
+
+
+def test_suite_dependency_graph_queries() -> None:
+    graph = _create_graph(
+        {
+            "app": ["cli", "helpers"],
+            "cli": ["helpers"],
+            "helpers": ["attrs"],
+            "docs": [],
+        }
+    )
+
+    assert graph.get_path("app", "helpers") == ["app", "helpers"]
+    assert graph.get_path("cli", "attrs") == ["cli", "helpers", "attrs"]
+    assert graph.get_path("helpers", "app") == []
+    assert graph.get_dependents("helpers") == {"app", "cli"}
+    assert graph.get_dependents("app") == set()
+    assert graph.get_closure("app") == {"attrs", "cli", "helpers"}
+    assert graph.reaches("app", "attrs")
+    assert not graph.reaches("docs", "helpers")
+    # Dependencies out of the map (attrs) are never listed.
+    assert graph.get_levels() == [["docs"], ["helpers"], ["cli"], ["app"]]
+    assert graph.get_order() == ["docs", "helpers", "cli", "app"]
+
+
+def test_suite_dependency_graph_cycle_only_fails_ordering() -> None:
+    graph = _create_graph({"app": ["cli"], "cli": ["helpers"], "helpers": ["app"]})
+
+    # Stacks and reachability still work on a cyclic suite.
+    assert graph.get_path("app", "helpers") == ["app", "cli", "helpers"]
+    assert graph.get_dependents("app") == {"cli", "helpers"}
+
+    with pytest.raises(ValueError, match="Cyclic dependencies"):
+        graph.get_levels()
+    with pytest.raises(ValueError, match="Cyclic dependencies"):
+        graph.get_order()
+
+
+def test_suite_dependency_graph_is_rebuilt_on_pyproject_change(
+    tmp_path: Path,
+) -> None:
+    import os
+
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    package_path = tmp_path / "helpers"
+    package_path.mkdir()
+    pyproject_path = package_path / "pyproject.toml"
+    pyproject_path.write_text("")
+
+    dependencies_maps = [{"helpers": []}, {"helpers": [], "app": ["helpers"]}]
+    suite = SimpleNamespace(
+        _dependency_graph_memo=None,
+        _dependency_graph_memo_key=None,
+        build_dependencies_map=lambda: dependencies_maps[0],
+        get_packages_paths=lambda: [package_path],
+    )
+
+    graph = PythonPackagesSuiteWorkdir.get_dependency_graph(suite)
+    assert PythonPackagesSuiteWorkdir.get_dependency_graph(suite) is graph
+
+    dependencies_maps.pop(0)
+    stat = pyproject_path.stat()
+    os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    rebuilt = PythonPackagesSuiteWorkdir.get_dependency_graph(suite)
+    assert rebuilt is not graph
+    assert rebuilt.get_order() == ["helpers", "app"]
+
+
+def test_suite_dependency_graph_order_matches_graphlib_static_order() -> None:
+    from graphlib import TopologicalSorter
+
+    dependencies_map = {
+        "app": ["zlib", "cli"],
+        "cli": ["helpers"],
+        "docs": [],
+        "helpers": [],
+        "zlib": [],
+        "api": ["helpers", "zlib"],
+    }
+
+    # The order the suite used before the built-in graph: graphlib's
+    # static_order over the sorted nodes.
+    sorter = TopologicalSorter()
+    for name in sorted(dependencies_map):
+        sorter.add(name, *sorted(dependencies_map[name]))
+    expected = list(sorter.static_order())
+
+    graph = _create_graph(dependencies_map)
+
+    assert graph.get_order() == expected
+    # Not alphabetical within a level: graphlib lists a node once first
+    # met, dependencies included.
+    assert graph.get_order() == ["helpers", "zlib", "docs", "cli", "api", "app"]
+    assert graph.get_levels() == [["helpers", "zlib", "docs"], ["cli", "api"], ["app"]]
+
+
+def test_build_dependencies_map_reads_the_packages_manifest(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+        packages_manifest_get_pyproject_mtimes,
+    )
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    for name in ("app", "helpers"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "pyproject.toml").write_text("")
+
+    manifest = {
+        "dependencies": {"app": ["helpers"], "helpers": []},
+        "paths": ["app", "helpers"],
+        "pyprojects": packages_manifest_get_pyproject_mtimes(
+            tmp_path, ["app", "helpers"]
+        ),
+    }
+
+    def _get_packages() -> list:
+        raise AssertionError("Packages were instantiated.")
+
+    suite = SimpleNamespace(
+        _packages_manifest_cache=manifest,
+        _get_packages_manifest=lambda: manifest,
+        get_packages=_get_packages,
+        get_path=lambda: tmp_path,
+    )
+
+    dependencies_map = PythonPackagesSuiteWorkdir.build_dependencies_map(suite)
+
+    assert dependencies_map == {"app": ["helpers"], "helpers": []}
+    # Callers get a copy, the manifest is left untouched.
+    dependencies_map["app"].append("cli")
+    assert manifest["dependencies"]["app"] == ["helpers"]
+
+
+def test_get_editable_dependencies_fingerprint_reads_the_manifest(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_dev_python.common.suite_dependency_graph import (
+        SuiteDependencyGraph,
+    )
+    from wexample_wex_addon_dev_python.workdir.python_packages_suite_workdir import (
+        PythonPackagesSuiteWorkdir,
+    )
+
+    graph = SuiteDependencyGraph(
+        dependencies_map={
+            "app": ["cli"],
+            "cli": ["helpers"],
+            "helpers": [],
+            "docs": [],
+        }
+    )
+    manifest = {
+        "names": {
+            "app": "pip/app",
+            "cli": "pip/cli",
+            "helpers": "pip/helpers",
+            "docs": "docs",
+        },
+        "pyprojects": {"pip/cli": 2, "pip/helpers": 1, "pip/app": 3, "docs": 4},
+    }
+    suite = SimpleNamespace(
+        get_dependency_graph=lambda: graph,
+        get_path=lambda: tmp_path,
+        _get_packages_manifest=lambda: manifest,
+        _get_packages_names=lambda: manifest["names"],
+    )
+
+    assert PythonPackagesSuiteWorkdir.get_editable_dependencies_fingerprint(
+        suite, "app"
+    ) == {
+        "cli": [str(tmp_path / "pip/cli"), 2],
+        "helpers": [str(tmp_path / "pip/helpers"), 1],
+    }
+    assert (
+        PythonPackagesSuiteWorkdir.get_editable_dependencies_fingerprint(
+            suite, "helpers"
+        )
+        == {}
+    )
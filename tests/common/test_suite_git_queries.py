@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_suite_git_queries_runs_each_query_once() -> None:
+    from wexample_wex_addon_dev_python.common.suite_git_queries import (
+        SuiteGitQueries,
+    )
+
+    calls = []
+    git_queries = SuiteGitQueries()
+
+    def _queries(paths: list[Path]) -> dict:
+        return {
+            path: (
+                ("commit_hash", str(path)),
+                lambda path=path: calls.append(path) or f"hash-{path.name}",
+            )
+            for path in paths
+        }
+
+    first = git_queries._run(_queries([Path("a"), Path("b")]))
+    second = git_queries._run(_queries([Path("b"), Path("c")]))
+
+    assert first == {Path("a"): "hash-a", Path("b"): "hash-b"}
+    assert second == {Path("b"): "hash-b", Path("c"): "hash-c"}
+    assert sorted(calls) == [Path("a"), Path("b"), Path("c")]
+
+
+def test_suite_git_queries_stays_within_max_workers() -> None:
+    import threading
+    import time
+
+    from wexample_wex_addon_dev_python.common.suite_git_queries import (
+        SuiteGitQueries,
+    )
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _query() -> bool:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return True
+
+    paths = [Path(f"package-{index}") for index in range(10)]
+    results = SuiteGitQueries(max_workers=3)._run(
+        {path: (("query", str(path)), _query) for path in paths}
+    )
+
+    assert results == {path: True for path in paths}
+    assert 1 < peak <= 3
+
+
+def test_suite_git_queries_returns_errors_as_values() -> None:
+    from wexample_wex_addon_dev_python.common.suite_git_queries import (
+        SuiteGitQueries,
+    )
+
+    error = RuntimeError("not a git repository")
+
+    def _fail() -> str:
+        raise error
+
+    results = SuiteGitQueries()._run(
+        {
+            Path("broken"): (("commit_hash", "broken"), _fail),
+            Path("valid"): (("commit_hash", "valid"), lambda: "hash"),
+        }
+    )
+
+    assert results == {Path("broken"): error, Path("valid"): "hash"}
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+DEPENDENCIES = {
+    "helpers": set(),
+    "filestate": {"helpers"},
+    "prompt": {"helpers"},
+    "app": {"filestate", "helpers"},
+    "cli": {"prompt", "helpers"},
+}
+LEVELS = [["helpers"], ["filestate", "prompt"], ["app", "cli"]]
+
+
+def _create_run(fail_fast: bool, max_workers: int | None = None):
+    from wexample_wex_addon_dev_python.common.suite_waves_run import SuiteWavesRun
+
+    return SuiteWavesRun(
+        fail_fast=fail_fast,
+        get_closure=DEPENDENCIES.__getitem__,
+        levels=LEVELS,
+        max_workers=max_workers,
+    )
+
+
+def test_suite_waves_run_passes_every_level_in_order() -> None:
+    started = []
+    waves_run = _create_run(fail_fast=True, max_workers=2)
+
+    statuses = waves_run.run(task=lambda name: started.append(name) or True)
+
+    assert statuses == {name: "passed" for name in DEPENDENCIES}
+    assert started[0] == "helpers"
+    assert set(started[1:3]) == {"filestate", "prompt"}
+    assert set(waves_run.get_timings()) == set(DEPENDENCIES)
+
+
+def test_suite_waves_run_fail_fast_cancels_packages_not_started() -> None:
+    started = []
+    waves_run = _create_run(fail_fast=True, max_workers=1)
+
+    def _task(name: str) -> bool:
+        started.append(name)
+        return name != "filestate"
+
+    statuses = waves_run.run(task=_task)
+
+    # One worker: prompt was still queued when filestate failed.
+    assert started == ["helpers", "filestate"]
+    assert statuses == {
+        "helpers": "passed",
+        "filestate": "failed",
+        "prompt": "cancelled",
+        "app": "cancelled",
+        "cli": "cancelled",
+    }
+
+
+def test_suite_waves_run_keep_going_skips_dependents_only() -> None:
+    waves_run = _create_run(fail_fast=False)
+
+    statuses = waves_run.run(task=lambda name: name != "filestate")
+
+    assert statuses == {
+        "helpers": "passed",
+        "filestate": "failed",
+        "prompt": "passed",
+        "app": "skipped",
+        "cli": "passed",
+    }
+
+
+def test_suite_waves_run_counts_errors_as_failures() -> None:
+    waves_run = _create_run(fail_fast=False)
+    done = []
+
+    def _task(name: str) -> bool:
+        if name == "prompt":
+            raise RuntimeError("Package prompt not found in the suite")
+        return True
+
+    statuses = waves_run.run(
+        task=_task, on_done=lambda name, status: done.append((name, status))
+    )
+
+    assert statuses["prompt"] == "failed"
+    assert statuses["cli"] == "skipped"
+    assert statuses["app"] == "passed"
+    assert str(waves_run.get_errors()["prompt"]) == (
+        "Package prompt not found in the suite"
+    )
+    assert ("prompt", "failed") in done
+    # The failed package still gets its timeline row.
+    assert "prompt" in waves_run.get_timings()
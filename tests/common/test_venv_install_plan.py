@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def _create_plan(tmp_path: Path, **kwargs):
+    from wexample_wex_addon_dev_python.common.venv_install_plan import (
+        VenvInstallPlan,
+    )
+
+    plan = VenvInstallPlan(venv_path=tmp_path / ".venv", **kwargs)
+    plan.add_requirement("attrs>=23")
+    plan.add_editable(tmp_path / "pip" / "helpers")
+    plan.add_editable(tmp_path / "pip" / "app")
+
+    return plan
+
+
+def test_venv_install_plan_build_command_with_uv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shutil
+
+    monkeypatch.setattr(shutil, "which", lambda name: f"/usr/bin/{name}")
+    plan = _create_plan(tmp_path, no_deps=True)
+
+    assert plan.build_command() == [
+        "uv",
+        "pip",
+        "install",
+        "--python",
+        str(tmp_path / ".venv" / "bin" / "python"),
+        "--no-deps",
+        "attrs>=23",
+        "-e",
+        str(tmp_path / "pip" / "helpers"),
+        "-e",
+        str(tmp_path / "pip" / "app"),
+    ]
+    assert plan.get_installer_name() == "uv"
+
+
+def test_venv_install_plan_build_command_with_pip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shutil
+
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    plan = _create_plan(
+        tmp_path, offline=True, find_links=[str(tmp_path / "wheelhouse")]
+    )
+
+    assert plan.build_command() == [
+        str(tmp_path / ".venv" / "bin" / "python"),
+        "-m",
+        "pip",
+        "install",
+        "--no-index",
+        "--find-links",
+        str(tmp_path / "wheelhouse"),
+        "attrs>=23",
+        "-e",
+        str(tmp_path / "pip" / "helpers"),
+        "-e",
+        str(tmp_path / "pip" / "app"),
+    ]
+    assert plan.get_installer_name() == "pip"
+
+
+def test_venv_install_plan_ignores_duplicates(tmp_path: Path) -> None:
+    plan = _create_plan(tmp_path)
+    plan.add_requirement("attrs>=23")
+    plan.add_editable(str(tmp_path / "pip" / "app"))
+
+    assert plan.requirements == ["attrs>=23"]
+    assert len(plan.editable_paths) == 2
+    assert not plan.is_empty()
+
+
+def test_venv_install_plan_build_collect_command_fills_wheelhouse(
+    tmp_path: Path,
+) -> None:
+    plan = _create_plan(tmp_path, find_links=[str(tmp_path / "wheelhouse")])
+
+    # pip fetches the pins whichever installer ran the install, without
+    # resolving them again.
+    assert plan.build_collect_command(
+        tmp_path / "wheelhouse", ["attrs==23.2.0", "cattrs==23.2.3"]
+    ) == [
+        str(tmp_path / ".venv" / "bin" / "python"),
+        "-m",
+        "pip",
+        "wheel",
+        "--no-deps",
+        "--wheel-dir",
+        str(tmp_path / "wheelhouse"),
+        "--find-links",
+        str(tmp_path / "wheelhouse"),
+        "attrs==23.2.0",
+        "cattrs==23.2.3",
+    ]
+
+
+def _create_wheelhouse(tmp_path: Path, wheels: list[str]) -> Path:
+    wheelhouse_path = tmp_path / "wheelhouse"
+    wheelhouse_path.mkdir()
+    for wheel in wheels:
+        (wheelhouse_path / wheel).write_bytes(b"")
+
+    return wheelhouse_path
+
+
+def test_venv_install_plan_can_install_offline(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.common.venv_install_plan import (
+        VenvInstallPlan,
+    )
+
+    wheelhouse_path = _create_wheelhouse(
+        tmp_path,
+        ["attrs-23.2.0-py3-none-any.whl", "Py_Yaml-6.0.1-py3-none-any.whl"],
+    )
+
+    plan = VenvInstallPlan(venv_path=tmp_path / ".venv", no_deps=True)
+    plan.add_requirement("attrs==23.2.0")
+    plan.add_requirement("py-yaml>=6")
+    plan.add_requirement("colorama==0.4.6; sys_platform == 'never'")
+    assert plan.can_install_offline(wheelhouse_path)
+
+    plan.add_requirement("cattrs==23.2.3")
+    assert not plan.can_install_offline(wheelhouse_path)
+
+
+def test_venv_install_plan_with_editables_needs_the_index(tmp_path: Path) -> None:
+    wheelhouse_path = _create_wheelhouse(tmp_path, ["attrs-23.2.0-py3-none-any.whl"])
+
+    # Editable builds need their build backend, never in the wheelhouse.
+    assert not _create_plan(tmp_path).can_install_offline(wheelhouse_path)
+
+
+def test_venv_install_plan_get_collect_requirements(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.common.venv_install_plan import (
+        VenvInstallPlan,
+    )
+
+    site_packages = tmp_path / ".venv" / "lib" / "python3.11" / "site-packages"
+    for name, version in [("attrs", "23.2.0"), ("cattrs", "23.2.3"), ("app", "1.0")]:
+        dist_info = site_packages / f"{name}-{version}.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "METADATA").write_text(f"Name: {name}\nVersion: {version}\n\n")
+    (site_packages / "app-1.0.dist-info" / "direct_url.json").write_text(
+        '{"url": "file:///src/app", "dir_info": {"editable": true}}'
+    )
+    wheelhouse_path = _create_wheelhouse(tmp_path, ["attrs-23.2.0-py3-none-any.whl"])
+
+    plan = VenvInstallPlan(venv_path=tmp_path / ".venv")
+
+    assert plan.get_collect_requirements(wheelhouse_path) == ["cattrs==23.2.3"]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_coverage_format_line_ranges() -> None:
+    from wexample_wex_addon_dev_python.helpers.coverage import (
+        coverage_format_line_ranges,
+    )
+
+    assert coverage_format_line_ranges([9, 3, 4, 5, 12, 13]) == "3-5, 9, 12-13"
+
+
+def test_coverage_iter_json_files_streams_file_entries(tmp_path: Path) -> None:
+    import json
+
+    from wexample_wex_addon_dev_python.helpers.coverage import (
+        coverage_iter_json_files,
+    )
+
+    files = {
+        f"src/module_{index}.py": {"executed_lines": list(range(1, index + 2))}
+        for index in range(20)
+    }
+    report_path = tmp_path / "coverage.json"
+    report_path.write_text(
+        json.dumps(
+            {"meta": {"format": 3}, "files": files, "totals": {"covered_lines": 1}},
+            indent=2,
+        )
+    )
+
+    # Chunks smaller than any entry force values to span several reads.
+    assert dict(coverage_iter_json_files(report_path, chunk_size=7)) == files
+
+
+def test_coverage_lines_to_numbits_round_trip() -> None:
+    from wexample_wex_addon_dev_python.helpers.coverage import (
+        coverage_lines_to_numbits,
+        coverage_numbits_to_lines,
+    )
+
+    lines = [1, 2, 8, 70]
+
+    assert coverage_numbits_to_lines(coverage_lines_to_numbits(lines)) == lines
+
+
+def test_coverage_numbits_to_lines() -> None:
+    from wexample_wex_addon_dev_python.helpers.coverage import (
+        coverage_numbits_to_lines,
+    )
+
+    assert coverage_numbits_to_lines(bytes([0b00000110, 0b00000001])) == [1, 2, 8]
+
+
+def test_coverage_get_sysmon_blocker_falls_back_before_312_and_74() -> None:
+    from wexample_wex_addon_dev_python.helpers.coverage import (
+        coverage_get_sysmon_blocker,
+    )
+
+    assert coverage_get_sysmon_blocker("3.12.4", "7.6.1") is None
+    # Not installed yet: the install brings a recent coverage.
+    assert coverage_get_sysmon_blocker("3.13.0", None) is None
+
+    assert "Python 3.12+" in coverage_get_sysmon_blocker("3.11.9", "7.6.1")
+    assert "Python 3.12+" in coverage_get_sysmon_blocker(None, "7.6.1")
+    assert "coverage 7.4+" in coverage_get_sysmon_blocker("3.12.4", "7.3.2")
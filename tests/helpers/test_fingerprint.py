@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+
+def test_fingerprint_from_data_ignores_key_order() -> None:
+    from wexample_wex_addon_dev_python.helpers.fingerprint import (
+        fingerprint_from_data,
+    )
+
+    assert fingerprint_from_data({"a": 1, "b": [1, 2]}) == fingerprint_from_data(
+        {"b": [1, 2], "a": 1}
+    )
+
+
+def test_fingerprint_from_data_changes_with_values() -> None:
+    from wexample_wex_addon_dev_python.helpers.fingerprint import (
+        fingerprint_from_data,
+    )
+
+    assert fingerprint_from_data({"python_version": "3.11.9"}) != (
+        fingerprint_from_data({"python_version": "3.12.4"})
+    )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_impact_select_tests_from_diff() -> None:
+    from wexample_wex_addon_dev_python.helpers.impact import (
+        impact_build_map,
+        impact_parse_diff,
+        impact_select_tests,
+    )
+
+    base_path = Path("/project")
+    impact_map = impact_build_map(
+        {
+            "/project/src/pkg/a.py": {
+                1: {""},
+                2: {"tests/test_a.py::test_one"},
+                3: {"tests/test_a.py::test_one"},
+                5: {"tests/test_a.py::test_two"},
+            },
+            "/project/src/pkg/b.py": {
+                1: {""},
+                2: {"tests/test_b.py::test_b"},
+            },
+        },
+        base_path=base_path,
+    )
+
+    assert impact_map["files"]["src/pkg/a.py"] == [[1, 1, []], [2, 3, [0]], [5, 5, [1]]]
+
+    body_change = impact_parse_diff(
+        "--- a/src/pkg/a.py\n+++ b/src/pkg/a.py\n@@ -3 +3 @@\n-x\n+y\n"
+    )
+    assert impact_select_tests(impact_map, body_change) == {"tests/test_a.py::test_one"}
+
+    # An insertion after line 4 lands next to line 5.
+    insertion = impact_parse_diff(
+        "--- a/src/pkg/a.py\n+++ b/src/pkg/a.py\n@@ -4,0 +5,2 @@\n+z\n+z\n"
+    )
+    assert impact_select_tests(impact_map, insertion) == {"tests/test_a.py::test_two"}
+
+    import_time_change = impact_parse_diff(
+        "--- a/src/pkg/b.py\n+++ /dev/null\n@@ -1,2 +0,0 @@\n-a\n-b\n"
+    )
+    assert impact_select_tests(impact_map, import_time_change) == {
+        "tests/test_b.py::test_b"
+    }
+
+
+def test_impact_parse_diff_new_side() -> None:
+    from wexample_wex_addon_dev_python.helpers.impact import impact_parse_diff
+
+    assert impact_parse_diff(
+        "--- a/src/pkg/a.py\n+++ b/src/pkg/a.py\n"
+        "@@ -3 +3,2 @@\n-x\n+y\n+y\n@@ -8,2 +9,0 @@\n-z\n-z\n"
+        "--- /dev/null\n+++ b/src/pkg/new.py\n@@ -0,0 +1 @@\n+n\n",
+        new_side=True,
+    ) == {"src/pkg/a.py": [(3, 4)], "src/pkg/new.py": [(1, 1)]}
+
+
+def test_impact_get_unknown_paths() -> None:
+    from wexample_wex_addon_dev_python.helpers.impact import (
+        impact_build_map,
+        impact_get_unknown_paths,
+    )
+
+    impact_map = impact_build_map(
+        {"/project/src/pkg/a.py": {1: {""}, 2: {"tests/test_a.py::test_one"}}},
+        base_path=Path("/project"),
+    )
+
+    assert impact_get_unknown_paths(impact_map, ["src/pkg/a.py"]) == []
+    assert impact_get_unknown_paths(
+        impact_map,
+        [
+            "src/pkg/a.py",
+            "src/pkg/new.py",
+            "pyproject.toml",
+            "tests/conftest.py",
+            "tests/data/sample.json",
+        ],
+    ) == [
+        "pyproject.toml",
+        "src/pkg/new.py",
+        "tests/conftest.py",
+        "tests/data/sample.json",
+    ]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_keyword_expression_matches() -> None:
+    from wexample_wex_addon_dev_python.helpers.keyword_expression import (
+        keyword_expression_matches,
+    )
+
+    names = ["test_parse_json[utf8]", "TestParser", "test_parser.py", "slow"]
+
+    assert keyword_expression_matches("", names)
+    assert keyword_expression_matches("parse", names)
+    assert keyword_expression_matches("JSON and not xml", names)
+    assert keyword_expression_matches("xml or (Slow and utf8)", names)
+    assert not keyword_expression_matches("not parser", names)
+    assert not keyword_expression_matches("json and xml", names)
+
+
+def test_keyword_expression_rejects_invalid_expressions() -> None:
+    from wexample_wex_addon_dev_python.helpers.keyword_expression import (
+        keyword_expression_matches,
+    )
+
+    for expression in ("json and", "(json", "json xml", "json @", "json(a=1)"):
+        with pytest.raises(ValueError):
+            keyword_expression_matches(expression, ["json"])
+
+
+def test_keyword_expression_select_paths() -> None:
+    from wexample_wex_addon_dev_python.helpers.keyword_expression import (
+        keyword_expression_select_paths,
+    )
+
+    node_keywords = {
+        "tests/test_json.py::test_parse": ["test_parse", "test_json.py"],
+        "tests/test_json.py::test_dump": ["test_dump", "test_json.py"],
+        "tests/test_xml.py::test_parse": ["test_parse", "test_xml.py"],
+        "tests/test_yaml.py::test_dump": ["test_dump", "test_yaml.py"],
+    }
+
+    assert keyword_expression_select_paths("parse", node_keywords) == [
+        "tests/test_json.py",
+        "tests/test_xml.py",
+    ]
+    assert keyword_expression_select_paths("dump and yaml", node_keywords) == [
+        "tests/test_yaml.py"
+    ]
+    assert keyword_expression_select_paths("csv", node_keywords) == []
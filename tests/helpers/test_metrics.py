@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+
+def test_metrics_add_run_merges_runs_of_a_commit() -> None:
+    from wexample_wex_addon_dev_python.helpers.metrics import metrics_add_run
+
+    history = metrics_add_run([], "a", {"t::one": {"call": 1.0}})
+    history = metrics_add_run(history, "a", {"t::two": {"call": 2.0}})
+    history = metrics_add_run(history, "b", {"t::one": {"call": 3.0}}, max_runs=1)
+
+    assert history == [{"commit_hash": "b", "tests": {"t::one": {"call": 3.0}}}]
+
+    history = metrics_add_run([], "a", {"t::one": {"call": 1.0}})
+    history = metrics_add_run(history, "a", {"t::two": {"call": 2.0}})
+
+    assert set(history[0]["tests"]) == {"t::one", "t::two"}
+
+
+def test_metrics_rank_slowest_reports_trend() -> None:
+    from wexample_wex_addon_dev_python.helpers.metrics import (
+        metrics_get_durations,
+        metrics_rank_slowest,
+    )
+
+    history = [
+        {
+            "commit_hash": "a",
+            "tests": {
+                "t::slow": {"setup": 0.5, "call": 1.5},
+                "t::fast": {"call": 0.1},
+            },
+        },
+        {
+            "commit_hash": "b",
+            "tests": {"t::slow": {"setup": 0.5, "call": 2.5, "memory_peak": 2048}},
+        },
+    ]
+
+    assert metrics_get_durations(history) == {"t::slow": 3.0, "t::fast": 0.1}
+
+    rows = metrics_rank_slowest(history, limit=1)
+    assert [row["node_id"] for row in rows] == ["t::slow"]
+    assert rows[0]["trend"] == 0.5
+    assert rows[0]["runs"] == 2
+
+    memory_rows = metrics_rank_slowest(history, sort="memory")
+    assert [row["value"] for row in memory_rows] == [2048]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def _create_package(path: Path, name: str) -> Path:
+    path.mkdir(parents=True)
+    (path / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+
+    return path
+
+
+def _is_package_directory(path: Path) -> bool:
+    return path.is_dir() and (path / "pyproject.toml").is_file()
+
+
+def _touch_later(path: Path) -> None:
+    # Some filesystems only keep coarse modification times.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_packages_manifest_get_key_lists_location_directories(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+        packages_manifest_get_key,
+    )
+
+    (tmp_path / "pip").mkdir()
+    (tmp_path / "tools" / "cli").mkdir(parents=True)
+
+    locations, directories = packages_manifest_get_key(
+        tmp_path, ["pip/*", "tools/cli", "*"]
+    )
+
+    assert locations == ["pip/*", "tools/cli", "*"]
+    assert [directory for directory, _ in directories] == [".", "pip", "tools"]
+    assert all(mtime is not None for _, mtime in directories)
+
+
+def test_packages_manifest_build_lists_every_location(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+        packages_manifest_build,
+    )
+
+    _create_package(tmp_path / "pip" / "helpers", "helpers")
+    _create_package(tmp_path / "tools" / "cli", "cli")
+    (tmp_path / "pip" / "notes").mkdir()
+
+    manifest = packages_manifest_build(
+        tmp_path, ["pip/*", "tools/*"], is_package_directory=_is_package_directory
+    )
+
+    assert manifest["names"] is None
+    assert manifest["dependencies"] is None
+    assert manifest["paths"] == ["pip/helpers", "tools/cli"]
+    assert set(manifest["pyprojects"]) == {"pip/helpers", "tools/cli"}
+
+
+def test_packages_manifest_is_fresh(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.packages_manifest import (
+        packages_manifest_build,
+        packages_manifest_get_key,
+        packages_manifest_is_fresh,
+    )
+
+    locations = ["pip/*", "tools/*"]
+    helpers_path = _create_package(tmp_path / "pip" / "helpers", "helpers")
+    _create_package(tmp_path / "tools" / "cli", "cli")
+
+    def _build() -> dict:
+        return packages_manifest_build(
+            tmp_path, locations, is_package_directory=_is_package_directory
+        )
+
+    def _is_fresh(manifest: dict) -> bool:
+        return packages_manifest_is_fresh(
+            manifest, tmp_path, packages_manifest_get_key(tmp_path, locations)
+        )
+
+    manifest = _build()
+    assert _is_fresh(manifest)
+    assert not _is_fresh(None)
+
+    # A package renamed in its pyproject.toml.
+    (helpers_path / "pyproject.toml").write_text('[project]\nname = "core"\n')
+    _touch_later(helpers_path / "pyproject.toml")
+    assert not _is_fresh(manifest)
+
+    # A package added out of pip/.
+    manifest = _build()
+    _create_package(tmp_path / "tools" / "prompt", "prompt")
+    _touch_later(tmp_path / "tools")
+    assert not _is_fresh(manifest)
+
+    # A package directory removed.
+    manifest = _build()
+    (helpers_path / "pyproject.toml").unlink()
+    assert not _is_fresh(manifest)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+def test_release_propagate_bumps_raises_dependents_to_patch() -> None:
+    from wexample_helpers.const.types import (
+        UPGRADE_TYPE_INTERMEDIATE,
+        UPGRADE_TYPE_MAJOR,
+        UPGRADE_TYPE_MINOR,
+    )
+
+    from wexample_wex_addon_dev_python.helpers.release import (
+        release_propagate_bumps,
+    )
+
+    planned = release_propagate_bumps(
+        bumps={
+            "core": UPGRADE_TYPE_MAJOR,
+            "helpers": UPGRADE_TYPE_MINOR,
+            "app": None,
+            "cli": None,
+            "tools": UPGRADE_TYPE_INTERMEDIATE,
+        },
+        dependencies_map={
+            "core": [],
+            "helpers": [],
+            "app": ["core"],
+            "cli": ["helpers"],
+            "tools": ["core"],
+        },
+    )
+
+    assert planned == {
+        "core": UPGRADE_TYPE_MAJOR,
+        "helpers": UPGRADE_TYPE_MINOR,
+        # Updated constraint on core.
+        "app": UPGRADE_TYPE_MINOR,
+        # A patch of helpers is already accepted.
+        "cli": None,
+        "tools": UPGRADE_TYPE_INTERMEDIATE,
+    }
+
+
+def test_release_classify_bump_from_git_state(tmp_path) -> None:
+    from wexample_helpers.const.types import UPGRADE_TYPE_MINOR
+
+    from wexample_wex_addon_dev_python.helpers.release import release_classify_bump
+
+    def classify(**git_state) -> dict:
+        return release_classify_bump(
+            package_path=tmp_path,
+            package_name="wexample-demo",
+            snapshot_dir=tmp_path / "snapshots",
+            **git_state,
+        )
+
+    first = classify(last_tag=None, has_changes=True, has_source_changes=True)
+    assert first["bump"] == UPGRADE_TYPE_MINOR
+    assert first["last_tag"] is None
+
+    unchanged = classify(
+        last_tag="wexample-demo/v1.0.0", has_changes=False, has_source_changes=False
+    )
+    assert unchanged["bump"] is None
+    assert unchanged["last_tag"] == "wexample-demo/v1.0.0"
+
+    # Only packaging or tests changed: no public API to compare.
+    outside_src = classify(
+        last_tag="wexample-demo/v1.0.0", has_changes=True, has_source_changes=False
+    )
+    assert outside_src["bump"] == UPGRADE_TYPE_MINOR
+    assert outside_src["breaking"] is None
+    assert outside_src["error"] is None
+
+
+def test_release_get_tag_prefix() -> None:
+    from wexample_wex_addon_dev_python.helpers.release import (
+        release_get_tag_prefix,
+    )
+
+    assert release_get_tag_prefix("helpers/v1.2.0", "1.2.0") == "helpers/v*"
+    assert release_get_tag_prefix("v0.1.0", "0.1.0") == "v*"
+
+    with pytest.raises(ValueError):
+        release_get_tag_prefix("helpers/latest", "1.2.0")
+
+
+def _create_tagged_package(path, tag: str):
+    import subprocess
+
+    module_path = path / "src" / "sample"
+    module_path.mkdir(parents=True)
+    (module_path / "__init__.py").write_text(
+        "from sample.core import run\n\n__all__ = ['run']\n"
+    )
+    (module_path / "core.py").write_text(
+        "def run(value: int) -> int:\n    return value\n"
+    )
+
+    def _git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=path,
+            check=True,
+            capture_output=True,
+        )
+
+    _git("init", "-q")
+    _git("add", ".")
+    _git("commit", "-q", "-m", "Initial commit")
+    _git("tag", tag)
+
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_release_load_api_snapshot_reuses_the_snapshot(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("wexample_helpers.helpers.shell")
+    import griffe
+
+    from wexample_wex_addon_dev_python.helpers.release import (
+        release_load_api_snapshot,
+    )
+
+    package_path = tmp_path / "package"
+    package_path.mkdir()
+    commit_hash = _create_tagged_package(package_path, "sample/v1.0.0")
+    snapshot_dir = tmp_path / "snapshots"
+
+    loaded = release_load_api_snapshot(
+        package_path=package_path,
+        module_name="sample",
+        tag="sample/v1.0.0",
+        snapshot_dir=snapshot_dir,
+    )
+
+    snapshot_path = snapshot_dir / f"sample_v1.0.0-{commit_hash[:12]}.json"
+    assert [path.name for path in snapshot_dir.iterdir()] == [snapshot_path.name]
+
+    def _fail_load_git(*args, **kwargs):
+        raise AssertionError("The tag was loaded from git again.")
+
+    monkeypatch.setattr(griffe, "load_git", _fail_load_git)
+    decoded = release_load_api_snapshot(
+        package_path=package_path,
+        module_name="sample",
+        tag="sample/v1.0.0",
+        snapshot_dir=snapshot_dir,
+    )
+
+    assert set(decoded.members) == set(loaded.members)
+    # Aliases resolve through the collection the decoded module belongs to.
+    assert decoded["run"].target_path == "sample.core.run"
+    assert str(decoded["run"].final_target.parameters["value"].annotation) == "int"
+
+
+def test_release_load_api_snapshot_reloads_an_unreadable_snapshot(tmp_path) -> None:
+    pytest.importorskip("wexample_helpers.helpers.shell")
+
+    from wexample_wex_addon_dev_python.helpers.release import (
+        release_load_api_snapshot,
+    )
+
+    package_path = tmp_path / "package"
+    package_path.mkdir()
+    commit_hash = _create_tagged_package(package_path, "v1.0.0")
+    snapshot_dir = tmp_path / "snapshots"
+    snapshot_dir.mkdir()
+    snapshot_path = snapshot_dir / f"v1.0.0-{commit_hash[:12]}.json"
+    snapshot_path.write_text('{"kind": "module", "truncated')
+
+    module = release_load_api_snapshot(
+        package_path=package_path,
+        module_name="sample",
+        tag="v1.0.0",
+        snapshot_dir=snapshot_dir,
+    )
+
+    assert "run" in module.members
+    assert json.loads(snapshot_path.read_text())["name"] == "sample"
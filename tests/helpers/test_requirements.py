@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_requirements_read_file_keeps_only_specs(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_read_file,
+    )
+
+    path = tmp_path / "requirements.txt"
+    path.write_text(
+        "# This file was autogenerated by uv via the following command:\n"
+        "#    uv pip compile pyproject.toml\n"
+        "--index-url https://pypi.org/simple\n"
+        "attrs==23.2.0\n"
+        "    # via cattrs\n"
+        "cattrs==23.2.3  # pinned\n"
+        "pyyaml==6.0.1 \\\n"
+        "    --hash=sha256:abc\n"
+        "\n"
+    )
+
+    assert requirements_read_file(path) == [
+        "attrs==23.2.0",
+        "cattrs==23.2.3",
+        "pyyaml==6.0.1",
+    ]
+
+
+def test_requirements_lock_applies_to_its_interpreter_only() -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_lock_applies,
+    )
+
+    assert requirements_lock_applies("3.11.9", "3.11")
+    assert requirements_lock_applies("3.11", "3.11")
+    assert not requirements_lock_applies("3.12.4", "3.11")
+    assert not requirements_lock_applies("3.1.2", "3.11")
+    assert not requirements_lock_applies(None, "3.11")
+
+
+def test_requirements_is_unsatisfiable_error() -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_is_unsatisfiable_error,
+    )
+
+    assert requirements_is_unsatisfiable_error(
+        "× No solution found when resolving dependencies"
+    )
+    assert requirements_is_unsatisfiable_error(
+        "requirements are unsatisfiable: helpers==1.2.0"
+    )
+    assert not requirements_is_unsatisfiable_error("Failed to download attrs")
+
+
+def test_requirements_compile_wave_retries_unsatisfiable_subset() -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_compile_wave,
+    )
+
+    calls = []
+    retried = []
+
+    def _compile(items: list[str], refresh: bool) -> dict[str, Exception]:
+        calls.append((items, refresh))
+        if not refresh:
+            return {
+                "app": RuntimeError("No solution found"),
+                "cli": RuntimeError("Network unreachable"),
+            }
+        return {}
+
+    failures = requirements_compile_wave(
+        items=["helpers", "app", "cli"],
+        compile_items=_compile,
+        on_retry=retried.extend,
+    )
+
+    # Only the unsatisfiable compile is retried, the other failure stays.
+    assert calls == [(["helpers", "app", "cli"], False), (["app"], True)]
+    assert retried == ["app"]
+    assert list(failures) == ["cli"]
+
+
+def test_requirements_compile_wave_reports_failed_retries() -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_compile_wave,
+    )
+
+    def _compile(items: list[str], refresh: bool) -> dict[str, Exception]:
+        return {item: RuntimeError(f"No solution found ({refresh})") for item in items}
+
+    failures = requirements_compile_wave(
+        items=["helpers", "app"], compile_items=_compile, on_retry=lambda items: None
+    )
+
+    assert {item: str(error) for item, error in failures.items()} == {
+        "helpers": "No solution found (True)",
+        "app": "No solution found (True)",
+    }
+
+
+def test_requirements_compile_wave_without_failure() -> None:
+    from wexample_wex_addon_dev_python.helpers.requirements import (
+        requirements_compile_wave,
+    )
+
+    def _on_retry(items: list[str]) -> None:
+        raise AssertionError("Nothing to retry")
+
+    assert (
+        requirements_compile_wave(
+            items=["helpers"],
+            compile_items=lambda items, refresh: {},
+            on_retry=_on_retry,
+        )
+        == {}
+    )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_shard_parse_spec() -> None:
+    from wexample_wex_addon_dev_python.helpers.shard import shard_parse_spec
+
+    assert shard_parse_spec("2/4") == (2, 4)
+
+    for spec in ("0/4", "5/4", "2", "a/b"):
+        with pytest.raises(ValueError):
+            shard_parse_spec(spec)
+
+
+def test_shard_partition_node_ids_balances_durations() -> None:
+    from wexample_wex_addon_dev_python.helpers.shard import shard_partition_node_ids
+
+    node_ids = ["t::a", "t::b", "t::c", "t::d", "t::e"]
+    durations = {"t::a": 8.0, "t::b": 4.0, "t::c": 4.0, "t::d": 1.0}
+
+    shards = shard_partition_node_ids(node_ids, durations, count=2)
+
+    assert shards == [["t::a", "t::c"], ["t::b", "t::d", "t::e"]]
+    assert sorted(sum(shards, [])) == node_ids
+
+
+def test_shard_parse_report_name() -> None:
+    from wexample_wex_addon_dev_python.helpers.shard import shard_parse_report_name
+
+    assert shard_parse_report_name("coverage.shard-2-of-4.json") == (2, 4)
+    assert shard_parse_report_name("coverage.shard-10-of-12.json") == (10, 12)
+    assert shard_parse_report_name("coverage.json") is None
+    assert shard_parse_report_name("coverage.shard-a-of-4.json") is None
+
+
+def test_shard_partition_node_ids_without_durations_is_order_independent() -> None:
+    from wexample_wex_addon_dev_python.helpers.shard import shard_partition_node_ids
+
+    node_ids = ["t::a", "t::b", "t::c", "t::d", "t::e"]
+
+    shards = shard_partition_node_ids(node_ids, {}, count=2)
+
+    # Without durations, tests are dealt by node id: another collection
+    # order only changes the order inside each shard.
+    assert shards == [["t::a", "t::c", "t::e"], ["t::b", "t::d"]]
+    assert [
+        sorted(shard) for shard in shard_partition_node_ids(node_ids[::-1], {}, count=2)
+    ] == shards
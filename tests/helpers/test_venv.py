@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_venv_get_python_version_reads_pyvenv_cfg(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import venv_get_python_version
+
+    (tmp_path / "pyvenv.cfg").write_text(
+        "home = /usr/bin\ninclude-system-site-packages = false\nversion = 3.12.4\n"
+    )
+
+    assert venv_get_python_version(tmp_path) == "3.12.4"
+
+
+def test_venv_get_python_version_reads_uv_version_info(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import venv_get_python_version
+
+    (tmp_path / "pyvenv.cfg").write_text("home = /usr/bin\nversion_info = 3.11.9\n")
+
+    assert venv_get_python_version(tmp_path) == "3.11.9"
+
+
+def test_venv_get_python_version_returns_none_without_venv(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import venv_get_python_version
+
+    assert venv_get_python_version(tmp_path) is None
+
+
+def _create_dist_info(
+    site_packages: Path, name: str, version: str, editable_url: str | None = None
+) -> None:
+    import json
+
+    dist_info = site_packages / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nName: ignored\n"
+    )
+    if editable_url:
+        (dist_info / "direct_url.json").write_text(
+            json.dumps({"url": editable_url, "dir_info": {"editable": True}})
+        )
+
+
+def test_venv_scan_distributions_reads_versions_and_editables(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import venv_scan_distributions
+
+    site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+    _create_dist_info(site_packages, "Attrs", "23.2.0")
+    _create_dist_info(
+        site_packages,
+        "wexample-helpers",
+        "1.0.0",
+        editable_url=f"file://{tmp_path}/pip/helpers",
+    )
+
+    inventory = venv_scan_distributions(tmp_path)
+
+    assert inventory["attrs"].version == "23.2.0"
+    assert inventory["attrs"].editable_path is None
+    assert inventory["wexample-helpers"].is_editable_at(tmp_path / "pip" / "helpers")
+
+
+def test_venv_distribution_satisfies_checks_specifier(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import (
+        venv_distribution_satisfies,
+        venv_scan_distributions,
+    )
+
+    _create_dist_info(
+        tmp_path / "lib" / "python3.12" / "site-packages", "attrs", "23.2.0"
+    )
+    inventory = venv_scan_distributions(tmp_path)
+
+    assert venv_distribution_satisfies(inventory, "attrs>=23.1.0")
+    assert not venv_distribution_satisfies(inventory, "attrs>=24")
+    assert not venv_distribution_satisfies(inventory, "pytest")
+
+
+def test_venv_find_interpreters_filters_on_requires_python(monkeypatch) -> None:
+    import shutil
+
+    from wexample_wex_addon_dev_python.helpers import venv
+
+    monkeypatch.setattr(
+        shutil, "which", lambda name: None if name == "python3.10" else f"/bin/{name}"
+    )
+    monkeypatch.setattr(
+        venv,
+        "venv_get_interpreter_version",
+        lambda python_bin: f"{python_bin[len('/bin/python'):]}.1 (main)",
+    )
+
+    assert venv.venv_find_interpreters(
+        ["3.10", "3.11", "3.12", "3.13"], requires_python=">=3.10,<3.13"
+    ) == {"3.11": "/bin/python3.11", "3.12": "/bin/python3.12"}
+
+
+def test_venv_get_missing_requirements_finds_new_dependency(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.venv import (
+        venv_get_missing_requirements,
+        venv_scan_distributions,
+    )
+
+    # A standalone package already installed as editable, whose
+    # pyproject.toml gained a dependency since: the self-install is skipped,
+    # the new dependency must still be planned.
+    site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+    _create_dist_info(site_packages, "attrs", "23.2.0")
+    _create_dist_info(
+        site_packages,
+        "wexample-demo",
+        "1.0.0",
+        editable_url=f"file://{tmp_path}/demo",
+    )
+    inventory = venv_scan_distributions(tmp_path)
+
+    assert venv_get_missing_requirements(
+        inventory,
+        ["attrs>=23", "Requests>=2.31", "wexample-helpers>=1.0"],
+        excluded_names={"wexample-helpers"},
+    ) == ["Requests>=2.31"]
+    assert venv_get_missing_requirements(inventory, ["attrs>=24"]) == ["attrs>=24"]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+
+def test_warm_test_server_check_socket_owner_accepts_own_socket(
+    tmp_path: Path,
+) -> None:
+    import socket
+
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_check_socket_owner,
+    )
+
+    socket_path = tmp_path / "server.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        warm_test_server_check_socket_owner(socket_path)
+
+    # A missing socket is started afterwards, nothing to check.
+    warm_test_server_check_socket_owner(tmp_path / "missing.sock")
+
+
+def test_warm_test_server_check_socket_owner_refuses_other_files(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_check_socket_owner,
+    )
+
+    socket_path = tmp_path / "server.sock"
+    socket_path.write_text("")
+
+    with pytest.raises(RuntimeError):
+        warm_test_server_check_socket_owner(socket_path)
+
+
+def test_warm_test_server_filter_env() -> None:
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_filter_env,
+    )
+
+    env = {
+        "COVERAGE_CORE": "sysmon",
+        "HOME": "/home/user",
+        "PATH": "/usr/bin",
+        "PIPY_TOKEN": "secret",
+        "WEX_TEST_METRICS_OUTPUT": "/tmp/metrics.json",
+    }
+
+    assert warm_test_server_filter_env(
+        env, names=["HOME", "PATH"], prefixes=["COVERAGE_", "WEX_TEST_"]
+    ) == {
+        "COVERAGE_CORE": "sysmon",
+        "HOME": "/home/user",
+        "PATH": "/usr/bin",
+        "WEX_TEST_METRICS_OUTPUT": "/tmp/metrics.json",
+    }
+
+
+def test_warm_test_server_get_socket_dir_is_private(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_get_socket_dir,
+    )
+
+    path = warm_test_server_get_socket_dir(base_path=tmp_path)
+
+    assert path.is_dir()
+    assert os.stat(path).st_mode & 0o777 == 0o700
+    # Reused as is on the next run.
+    assert warm_test_server_get_socket_dir(base_path=tmp_path) == path
+
+
+def test_warm_test_server_get_socket_dir_refuses_open_dir(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_get_socket_dir,
+    )
+
+    (tmp_path / "wex-test").mkdir()
+    os.chmod(tmp_path / "wex-test", 0o777)
+
+    with pytest.raises(RuntimeError):
+        warm_test_server_get_socket_dir(base_path=tmp_path)
+
+
+def test_warm_test_server_get_socket_dir_refuses_symlink(tmp_path: Path) -> None:
+    from wexample_wex_addon_dev_python.helpers.warm_test_server import (
+        warm_test_server_get_socket_dir,
+    )
+
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    (tmp_path / "wex-test").symlink_to(target)
+
+    with pytest.raises(RuntimeError):
+        warm_test_server_get_socket_dir(base_path=tmp_path)